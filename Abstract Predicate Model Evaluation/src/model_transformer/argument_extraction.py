@@ -1,5 +1,8 @@
 import glob
+import time
 import torch
+from functools import partial
+from torch.utils.data import DataLoader
 from transformers import AutoTokenizer, AutoModel, AutoConfig
 from tqdm import tqdm
 from pathlib import Path
@@ -9,72 +12,118 @@ from transformers import logging
 logging.set_verbosity(40)
 
 from src.model_transformer.utils import *
+from src.model_transformer.shared_backbone import set_adapter
+from src.model_transformer.windowing import turn_windows, merge_windows
+from src.model_transformer.training import BucketBatchSampler, collate_padded, IGNORE_INDEX
+
+
+# Dialogues longer than the encoder allows are split into windows overlapping by (at least) WINDOW_OVERLAP
+# subwords, which are passed through the encoder in batches of WINDOW_BATCH_SIZE
+WINDOW_OVERLAP = 128
+WINDOW_BATCH_SIZE = 16
 
 
 class ArgumentExtraction(torch.nn.Module):
-    def __init__(self, base_model='albert-base-v2', path=None, sep='<eos>'):
+    def __init__(self, base_model='albert-base-v2', path=None, sep='<eos>', backbone=None, model=None,
+                 tokenizer=None, num_labels=505, model_path=None):
         """ Init model with multi-span extraction heads for SPO arguments.
 
             params:
-            str base_model: Transformer architecture to use (default: albert-base-v2)
-            str path:       Path to pretrained model
+            str base_model:         Transformer architecture to use (default: albert-base-v2)
+            str path:               Path to pretrained model
+            SharedAlbert backbone:  encoder and tokenizer shared with triple scoring (optional)
+            PreTrainedModel model:  encoder to use instead of loading base_model, e.g. from a bundle (optional)
+            tokenizer:              tokenizer (with SPEAKER tokens) to use with model, or with base_model to
+                                    share it with other modules (optional)
+            int num_labels:         number of BIO labels; 505 for level 1, 341 for level 2 and 3 for the
+                                    baseline (default: 505)
+            str model_path:         checkpoint to load instead of that of level 1 (optional)
         """
         super().__init__()
-        print('loading %s for argument extraction' % base_model)
-        self._model = AutoModel.from_pretrained(base_model)
         self._base = base_model
         self._sep = sep
-
-        # Load and extend tokenizer with special SPEAKER tokens
-        self._tokenizer = AutoTokenizer.from_pretrained(base_model)
-        self._tokenizer.add_tokens(['SPEAKER1', 'SPEAKER2'], special_tokens=True)
-        self._model.resize_token_embeddings(len(self._tokenizer))
+        self._shared = backbone is not None
+
+        if model is not None:
+            # Encoder and tokenizer loaded elsewhere (see bundle.load_bundle)
+            self._model = model
+            self._tokenizer = tokenizer
+        elif backbone is None:
+            print('loading %s for argument extraction' % base_model)
+            self._model = AutoModel.from_pretrained(base_model)
+
+            # Load and extend tokenizer with special SPEAKER tokens (unless shared with other modules)
+            self._tokenizer = tokenizer
+            if tokenizer is None:
+                self._tokenizer = AutoTokenizer.from_pretrained(base_model)
+                self._tokenizer.add_tokens(['SPEAKER1', 'SPEAKER2'], special_tokens=True)
+            self._model.resize_token_embeddings(len(self._tokenizer))
+        else:
+            # Share encoder and tokenizer with triple scoring (see SharedAlbert)
+            self._model = backbone.model
+            self._tokenizer = backbone.tokenizer
 
         # Add token classification heads
-        hidden_size = AutoConfig.from_pretrained(base_model).hidden_size
-        # self._subj_head = torch.nn.Linear(hidden_size, 3)
-        # self._pred_head = torch.nn.Linear(hidden_size, 3)
-        # self._obj_head = torch.nn.Linear(hidden_size, 3)
-
-        # Level `1`
-        self._subj_head = torch.nn.Linear(hidden_size, 505)
-        self._pred_head = torch.nn.Linear(hidden_size, 505)
-        self._obj_head = torch.nn.Linear(hidden_size, 505)
-
-        # Level 2
-        # self._subj_head = torch.nn.Linear(hidden_size, 341)
-        # self._pred_head = torch.nn.Linear(hidden_size, 341)
-        # self._obj_head = torch.nn.Linear(hidden_size, 341)
+        hidden_size = self._model.config.hidden_size
+        self._subj_head = torch.nn.Linear(hidden_size, num_labels)
+        self._pred_head = torch.nn.Linear(hidden_size, num_labels)
+        self._obj_head = torch.nn.Linear(hidden_size, num_labels)
 
         self._relu = torch.nn.ReLU()
         self._softmax = torch.nn.Softmax(dim=-1)
 
+        # Weights of the three heads concatenated for inference (see fuse_heads)
+        self._fused_heads = None
+
+        # Maximum number of subwords per forward pass (see predict_batch)
+        self._max_positions = self._model.config.max_position_embeddings
+
         # Set GPU if available
         self._device = torch.device('cuda') if torch.cuda.is_available() else torch.device('cpu')
         self.to(self._device)
 
-        # Load model / tokenizer if pretrained model is given
-        if path:
+        # Load model / tokenizer if pretrained model is given (heads of a shared backbone are loaded separately)
+        self._model_path = None
+        if (path or model_path) and not self._shared:
             print('\t- Loading pretrained')
             # model_path = glob.glob(path + '/argument_extraction_' + base_model + '.zip')[0]
             # model_path = Path("src/model_transformer/models/2022-04-27/argument_extraction_albert-base-v2.zip")
-            
-            model_path = Path("src/model_transformer/models/level1/argument_extraction_albert-base-v2.zip")
-            # model_path = Path("src/model_transformer/models/level2/argument_extraction_albert-base-v2.zip")
+            if model_path is None:
+                model_path = Path("src/model_transformer/models/level1/argument_extraction_albert-base-v2.zip")
             print(model_path)
             self.load_state_dict(torch.load(model_path, map_location=self._device))
+            self._model_path = model_path
 
-    def forward(self, input_ids, speaker_ids):
-        """ Computes BIO label probabilities for each token
+    def _logits(self, input_ids, speaker_ids, attn_mask=None):
+        """ Computes BIO label logits of shape (N, seq_len, |C|) for subjects, predicates and objects
         """
-        # Feed dialog through transformer
-        y = self._model(input_ids=input_ids, token_type_ids=speaker_ids)
+        # Feed dialog through transformer (without the adapters for triple scoring)
+        if self._shared:
+            set_adapter(self._model, False)
+        y = self._model(input_ids=input_ids, token_type_ids=speaker_ids, attention_mask=attn_mask)
         h = self._relu(y.last_hidden_state)
 
+        if self._fused_heads is not None:
+            weight, bias = self._fused_heads
+            return torch.nn.functional.linear(h, weight, bias).chunk(3, dim=-1)
+        return self._subj_head(h), self._pred_head(h), self._obj_head(h)
+
+    def fuse_heads(self):
+        """ Concatenates the subject, predicate and object heads into a single linear layer,
+            so inference computes all label logits with one matrix multiplication. The fused
+            copy is not updated by training; fit() discards it. Quantized heads are left as is.
+        """
+        heads = [self._subj_head, self._pred_head, self._obj_head]
+        if not all(type(head) == torch.nn.Linear for head in heads):
+            return
+        self._fused_heads = (torch.cat([head.weight.detach() for head in heads], dim=0),
+                             torch.cat([head.bias.detach() for head in heads], dim=0))
+
+    def forward(self, input_ids, speaker_ids, attn_mask=None):
+        """ Computes BIO label probabilities for each token
+        """
         # Predict spans
-        y_subj = self._softmax(self._subj_head(h))
-        y_pred = self._softmax(self._pred_head(h))
-        y_obj_ = self._softmax(self._obj_head(h))
+        y_subj, y_pred, y_obj_ = [self._softmax(y) for y in self._logits(input_ids, speaker_ids, attn_mask)]
 
         # Permute output as tensor of shape (N, |C|, seq_len)
         y_subj = y_subj.permute(0, 2, 1)
@@ -82,125 +131,279 @@ class ArgumentExtraction(torch.nn.Module):
         y_obj_ = y_obj_.permute(0, 2, 1)
         return y_subj, y_pred, y_obj_
 
-    def _retokenize_tokens(self, tokens):
-        """ Re-tokenizes a sequence of tokens into a sequence of subwords and speaker_ids.
-        """
-        # Tokenize each token individually (keeping track of subwords)
-        input_ids = [[self._tokenizer.cls_token_id]]
-        for t in tokens:
-            if t != '<eos>':
-                input_ids.append(self._tokenizer.encode(t, add_special_tokens=False))
-            else:
-                input_ids.append([self._tokenizer.eos_token_id])
-
-        # Flatten input_ids
-        f_input_ids = torch.LongTensor([[i for ids in input_ids for i in ids]]).to(self._device)
+    def _retokenize_batch(self, token_seqs):
+        """ Re-tokenizes token sequences into subwords and speaker_ids with a single call to the
+            (fast) tokenizer, aligning subwords with tokens through word_ids().
 
-        # Determine how often we need to repeat the labels
-        repeats = [len(ids) for ids in input_ids]
-
-        # Set speaker IDs
-        speaker_ids = [0] + [tokens[:i + 1].count(self._sep) % 2 for i in range(len(tokens))][:-1]
-        speaker_ids = self._repeat_speaker_ids(speaker_ids, repeats)
-
-        return f_input_ids, speaker_ids, repeats
-
-    def _repeat_speaker_ids(self, speaker_ids, repeats):
-        """ Repeats speaker IDs for oov tokens.
+            returns:    list of (input_ids, speaker_ids, repeats) arrays, one for each sequence
         """
-        rep_speaker_ids = np.repeat([0] + list(speaker_ids), repeats=repeats)
-        return torch.LongTensor([rep_speaker_ids]).to(self._device)
+        # Tokenize all tokens except separators at once
+        words = [[t for t in tokens if t != self._sep] for tokens in token_seqs]
+        word_input_ids, word_repeats = self._tokenize_words(words)
+
+        outputs = []
+        for tokens, ids, counts in zip(token_seqs, word_input_ids, word_repeats):
+            is_sep = np.array([t == self._sep for t in tokens], dtype=bool)
+
+            # Determine how often we need to repeat the labels ([CLS] and separators are one subword)
+            repeats = np.ones(len(tokens) + 1, dtype=np.int64)
+            repeats[1:][~is_sep] = counts
+            offsets = np.cumsum(repeats) - repeats
+
+            # Place [CLS], separators ([SEP]) and subwords of the other tokens
+            input_ids = np.empty(repeats.sum(), dtype=np.int64)
+            input_ids[0] = self._tokenizer.cls_token_id
+            input_ids[offsets[1:][is_sep]] = self._tokenizer.eos_token_id
+            is_subword = np.ones(len(input_ids), dtype=bool)
+            is_subword[0] = False
+            is_subword[offsets[1:][is_sep]] = False
+            input_ids[is_subword] = ids
+
+            # Set speaker IDs (number of separators preceding each token)
+            speaker_ids = (np.cumsum(is_sep) - is_sep) % 2
+            speaker_ids = np.repeat(np.concatenate([[0], speaker_ids]).astype(np.int64), repeats)
+
+            outputs.append((input_ids, speaker_ids, repeats))
+        return outputs
+
+    def _tokenize_words(self, words):
+        """ Tokenizes lists of words into subwords, returning for each list the flat subword IDs
+            and the number of subwords of each word.
+        """
+        if not self._tokenizer.is_fast:
+            input_ids = [[self._tokenizer.encode(w, add_special_tokens=False) for w in ws] for ws in words]
+            counts = [[len(ids) for ids in lst] for lst in input_ids]
+            return [[i for ids in lst for i in ids] for lst in input_ids], counts
+
+        input_ids = [[] for _ in words]
+        counts = [np.zeros(len(ws), dtype=np.int64) for ws in words]
+
+        non_empty = [i for i, ws in enumerate(words) if ws]
+        if non_empty:
+            encoding = self._tokenizer([words[i] for i in non_empty], is_split_into_words=True,
+                                       add_special_tokens=False)
+            for j, i in enumerate(non_empty):
+                input_ids[i] = encoding['input_ids'][j]
+                word_ids = np.array(encoding.word_ids(j), dtype=np.int64)
+                counts[i] = np.bincount(word_ids, minlength=len(words[i]))
+        return input_ids, counts
 
     def _repeat_labels(self, labels, repeats):
         """ Repeats BIO labels for OOV tokens. Ensure B-labeled tokens are repeated
             as B-I-I etc.
         """
-        # Repeat each label b the amount of subwords per token
-        rep_labels = []
-        for label, rep in zip([0] + list(labels), repeats):
-            # Outside
-            if label == 0:
-                rep_labels += [label] * rep
-            # Beginning + Inside
-            else:
-                rep_labels += [label] + ([label+1] * (rep - 1))  # If label = B -> B-I-I-I...
-        return torch.LongTensor([rep_labels]).to(self._device)
+        # Repeat each label by the amount of subwords per token
+        labels = np.concatenate([[0], labels]).astype(np.int64)
+        rep_labels = np.repeat(labels, repeats)
 
-    def fit(self, tokens, labels, epochs=2, lr=1e-5, weight=3):
-        """ Fits the model to the annotations
+        # Subwords following the first subword of a labeled token get label + 1 (if label = B -> B-I-I-I...)
+        starts = (np.cumsum(repeats) - repeats)[repeats > 0]
+        is_following = np.ones(len(rep_labels), dtype=bool)
+        is_following[starts] = False
+        rep_labels[is_following & (rep_labels != 0)] += 1
+        return rep_labels
+
+    def fit(self, tokens=None, labels=None, epochs=2, lr=1e-5, weight=3, batch_size=8, accumulation_steps=1,
+            bucket_size=50, dataset=None):
+        """ Fits the model to the annotations in padded mini-batches of dialogues of similar length.
+
+            params:
+            list tokens:            token sequences of the dialogues
+            list labels:            (subject, predicate, object) BIO labels of each token sequence
+            int epochs:             number of passes over the data (default: 2)
+            float lr:               learning rate (default: 1e-5)
+            int weight:             weight of the B- and I-tags in the loss relative to O (default: 3)
+            int batch_size:         number of dialogues per mini-batch (default: 8)
+            int accumulation_steps: number of mini-batches to accumulate gradients over before each update,
+                                    e.g. to train with large effective batches on small GPUs (default: 1)
+            int bucket_size:        number of mini-batches per length bucket (see BucketBatchSampler)
+            Dataset dataset:        pre-tokenized (input_ids, speaker_ids, labels) examples to use instead of
+                                    tokens and labels, e.g. TrainingCache.arguments (optional)
         """
-        # Re-tokenize to obtain input_ids and associated labels
-        X = []
-        for token_seq, (subj_labels, pred_labels, _obj_labels) in zip(tokens, labels):
-            input_ids, speaker_ids, repeats = self._retokenize_tokens(token_seq)
-            subj_labels = self._repeat_labels(subj_labels, repeats)  # repeat when split into subwords
-            pred_labels = self._repeat_labels(pred_labels, repeats)
-            _obj_labels = self._repeat_labels(_obj_labels, repeats)
-            X.append((input_ids, speaker_ids, subj_labels, pred_labels, _obj_labels))
+        self._fused_heads = None
+
+        # Labels of a pre-tokenized dataset must be those of the heads (e.g. a level 2 cache for a level 2 model)
+        num_labels = getattr(dataset, 'num_labels', None)
+        if num_labels is not None and num_labels != self._subj_head.out_features:
+            raise ValueError('dataset has %s BIO labels, but the model %s' % (num_labels, self._subj_head.out_features))
+
+        # Re-tokenize to obtain input_ids and associated labels (repeated when split into subwords)
+        if dataset is None:
+            dataset = []
+            for (input_ids, speaker_ids, repeats), seq_labels in zip(self._retokenize_batch(tokens), labels):
+                seq_labels = np.stack([self._repeat_labels(arg_labels, repeats) for arg_labels in seq_labels])
+                dataset.append((input_ids, speaker_ids, seq_labels))
+        lengths = dataset.lengths if hasattr(dataset, 'lengths') else [len(x[0]) for x in dataset]
+
+        # Batch dialogues of similar length, padding labels with IGNORE_INDEX so padding adds no loss (sequences
+        # are cut off at the maximum input length of the encoder)
+        sampler = BucketBatchSampler(lengths, batch_size, bucket_size)
+        collate = partial(collate_padded, pad_values=(self._tokenizer.pad_token_id, 0, IGNORE_INDEX),
+                          max_len=self._max_positions)
+        loader = DataLoader(dataset, batch_sampler=sampler, collate_fn=collate)
 
         # Set up optimizer
         optim = torch.optim.Adam(self.parameters(), lr=lr)
 
         # Higher weight for B- and I-tags to account for class imbalance
-        class_weights = torch.Tensor([1] + [weight] * 2).to(self._device)
-        criterion = torch.nn.CrossEntropyLoss(weight=class_weights)
+        num_labels = self._subj_head.out_features
+        class_weights = torch.Tensor([1] + [weight] * (num_labels - 1)).to(self._device)
+        criterion = torch.nn.CrossEntropyLoss(weight=class_weights, ignore_index=IGNORE_INDEX)
 
         print('Training!')
         for epoch in range(epochs):
             losses = []
-            random.shuffle(X)
-            for input_ids, speaker_ids, subj_y, pred_y, obj_y in tqdm(X):
+            start = time.perf_counter()
+            optim.zero_grad()
+            for step, batch in enumerate(tqdm(loader)):
+                input_ids, speaker_ids, y, attn_mask = [t.to(self._device) for t in batch]
+
                 # Forward pass
-                subj_y_hat, pred_y_hat, obj_y_hat = self(input_ids, speaker_ids)
+                subj_y_hat, pred_y_hat, obj_y_hat = self(input_ids, speaker_ids, attn_mask)
 
                 # Compute loss
-                loss = criterion(subj_y_hat, subj_y)
-                loss += criterion(pred_y_hat, pred_y)
-                loss += criterion(obj_y_hat, obj_y)
+                loss = criterion(subj_y_hat, y[:, 0])
+                loss += criterion(pred_y_hat, y[:, 1])
+                loss += criterion(obj_y_hat, y[:, 2])
                 losses.append(loss.item())
 
-                optim.zero_grad()
-                loss.backward()
-                optim.step()
+                # Update weights every accumulation_steps mini-batches (and at the end of the epoch)
+                (loss / accumulation_steps).backward()
+                if (step + 1) % accumulation_steps == 0 or step + 1 == len(loader):
+                    optim.step()
+                    optim.zero_grad()
 
-            print("mean loss =", np.mean(losses))
+            elapsed = time.perf_counter() - start
+            print("mean loss = %s (%.1f examples/s)" % (np.mean(losses), len(dataset) / elapsed))
 
         # Save model to file
         torch.save(self.state_dict(), 'argument_extraction_%s' % self._base)
 
-    def predict(self, token_seq):
-        """ Predicts """
-        # Retokenize token sequence
-        input_ids, speaker_ids, _ = self._retokenize_tokens(token_seq)
+    def _decode(self, input_ids, speaker_ids, attn_mask):
+        """ Computes the most likely BIO label of each token and its probability, both of
+            shape (N, 3, seq_len), without normalizing over all classes: exp(max - logsumexp)
+        """
+        logits = torch.stack(self._logits(input_ids, speaker_ids, attn_mask), dim=1)
+        max_logits, labels = logits.max(dim=-1)
+        return labels, torch.exp(max_logits - torch.logsumexp(logits, dim=-1))
+
+    def _to_tensors(self, *arrays):
+        return [torch.from_numpy(array).to(self._device) for array in arrays]
+
+    def _run(self, input_ids, speaker_ids, attn_mask):
+        """ Runs _decode on padded NumPy arrays, returning labels (int16) and probabilities on the host
+        """
+        labels, confs = self._decode(*self._to_tensors(input_ids, speaker_ids, attn_mask))
+        return labels.to(torch.int16).cpu().numpy(), confs.cpu().detach().numpy()
+
+    def _run_full(self, input_ids, speaker_ids, attn_mask):
+        """ Runs the model on padded NumPy arrays, returning all label probabilities of shape (N, |C|, seq_len)
+        """
+        logits = self._logits(*self._to_tensors(input_ids, speaker_ids, attn_mask))
+        return [self._softmax(y).permute(0, 2, 1).cpu().detach().numpy() for y in logits]
+
+    def predict(self, token_seq, full=False):
+        """ Predicts BIO labels for a single token sequence (see predict_batch) """
+        return self.predict_batch([token_seq], full)[0]
+
+    def predict_batch(self, token_seqs, full=False):
+        """ Predicts BIO labels for multiple token sequences at once by padding them
+            to the longest sequence in the batch and running a single forward pass.
+            By default, only the most likely label of each subword and its probability
+            are computed (on device) and copied to the host. Sequences longer than the
+            encoder allows are split into overlapping windows at turn boundaries, whose
+            predictions are merged (see windowing.turn_windows and merge_windows).
+
+            params:
+            list token_seqs:    list of token sequences (one for each dialogue)
+            bool full:          whether to return the full label probability matrices (default: False)
+
+            returns:    list of (labels, confs, subwords) tuples, one for each sequence, with labels and
+                        confs of shape (3, seq_len) for subjects, predicates and objects, or, if full=True,
+                        list of (subjs, preds, objs, subwords) tuples with probabilities of shape (|C|, seq_len)
+        """
+        if not token_seqs:
+            return []
+
+        # Retokenize all token sequences at once
+        batch = self._retokenize_batch(token_seqs)
+
+        # Split sequences into windows (a single window holds the whole sequence if it fits)
+        rows = []
+        windows = []
+        for i, (input_ids, speaker_ids, _) in enumerate(batch):
+            turn_starts = np.flatnonzero(input_ids == self._tokenizer.eos_token_id) + 1
+            windows.append(turn_windows(turn_starts, len(input_ids), self._max_positions, WINDOW_OVERLAP))
+            for start, end in windows[-1]:
+                index = np.concatenate([[0], np.arange(start, end)])
+                rows.append((input_ids[index], speaker_ids[index]))
+
+        # Forward-pass (windows of long sequences in batches of WINDOW_BATCH_SIZE)
+        step = len(rows) if len(rows) == len(batch) else WINDOW_BATCH_SIZE
+        outputs = []
+        for k in range(0, len(rows), step):
+            outputs += self._predict_rows(rows[k:k + step], full)
+
+        # Merge windows of each sequence
+        merged = []
+        for (input_ids, _, _), seq_windows in zip(batch, windows):
+            seq_outputs, outputs = outputs[:len(seq_windows)], outputs[len(seq_windows):]
+            if len(seq_windows) > 1:
+                seq_outputs = [merge_windows(seq_windows, [out[j] for out in seq_outputs], len(input_ids))
+                               for j in range(len(seq_outputs[0]))]
+            else:
+                seq_outputs = seq_outputs[0]
+            merged.append(tuple(seq_outputs))
 
         # Invert tokenization for viewing
-        subwords = self._tokenizer.convert_ids_to_tokens(input_ids[0])
+        return [output + (self._tokenizer.convert_ids_to_tokens(input_ids.tolist()),)
+                for output, (input_ids, _, _) in zip(merged, batch)]
 
-        # Forward-pass
-        predictions = self(input_ids, speaker_ids)
-        subjs = predictions[0].cpu().detach().numpy()[0]
-        preds = predictions[1].cpu().detach().numpy()[0]
-        objs = predictions[2].cpu().detach().numpy()[0]
+    def _predict_rows(self, rows, full=False):
+        """ Pads rows of input_ids and speaker_ids to the longest row, masking out the padding, and
+            runs a single forward pass (see predict_batch).
+        """
+        lengths = [len(input_ids) for input_ids, _ in rows]
+        max_len = max(lengths)
 
-        return subjs, preds, objs, subwords
+        # Pad input_ids with [PAD] and speaker_ids with 0, masking out the padding
+        batch_input_ids = np.full((len(rows), max_len), self._tokenizer.pad_token_id, dtype=np.int64)
+        batch_speakers = np.zeros((len(rows), max_len), dtype=np.int64)
+        batch_attn_mask = np.zeros((len(rows), max_len), dtype=np.float32)
+        for i, (input_ids, speaker_ids) in enumerate(rows):
+            batch_input_ids[i, :lengths[i]] = input_ids
+            batch_speakers[i, :lengths[i]] = speaker_ids
+            batch_attn_mask[i, :lengths[i]] = 1
 
+        if full:
+            subjs, preds, objs = self._run_full(batch_input_ids, batch_speakers, batch_attn_mask)
+            return [(subjs[i, :, :n], preds[i, :, :n], objs[i, :, :n]) for i, n in enumerate(lengths)]
 
-if __name__ == '__main__':
-    annotations = load_annotations('<path_to_annotation_file')
+        labels, confs = self._run(batch_input_ids, batch_speakers, batch_attn_mask)
+        return [(labels[i, :, :n], confs[i, :, :n]) for i, n in enumerate(lengths)]
 
-    # Convert argument annotations to BIO-tag sequences
-    tokens, labels = [], []
-    for ann in annotations:
-        # Map triple arguments to BIO tagged masks
-        labels.append((triple_to_bio_tags(ann, 0),
-                       triple_to_bio_tags(ann, 1),
-                       triple_to_bio_tags(ann, 2)))
 
-        # Flatten turn sequence
-        tokens.append([t for ts in ann['tokens'] for t in ts + ['<eos>']])
+if __name__ == '__main__':
+    import argparse
+    from src.model_transformer.predicate_index import PredicateIndex
+    from src.model_transformer.training_cache import TrainingCache
+
+    parser = argparse.ArgumentParser(description='Train argument extraction on a training cache')
+    parser.add_argument('cache', help='directory of the training cache (see training_cache)')
+    parser.add_argument('--level', default=1, type=int, choices=[1, 2], help='level of abstract predicates')
+    parser.add_argument('--conversion_dict', default=None, help='conversion dict (default: that of level)')
+    parser.add_argument('--out', default='models/argument_extraction_albert-v2_31_03_2022', help='path of the model')
+    args = parser.parse_args()
+
+    conversion_dict = args.conversion_dict
+    if conversion_dict is None:
+        conversion_dict = '../Argument Extraction/conversion_dict_level%s.json' % args.level
+
+    # Load pre-tokenized annotations with BIO labels of the same level (see training_cache)
+    num_labels = PredicateIndex.from_file(conversion_dict).num_labels
+    model = ArgumentExtraction(num_labels=num_labels)
+    cache = TrainingCache(args.cache, model._tokenizer, num_labels)
 
     # Fit model to data
-    model = ArgumentExtraction()
-    model.fit(tokens, labels)
-    torch.save(model.state_dict(), 'models/argument_extraction_albert-v2_31_03_2022')
-
+    model.fit(dataset=cache.arguments)
+    torch.save(model.state_dict(), args.out)
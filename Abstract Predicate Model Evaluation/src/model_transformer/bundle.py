@@ -0,0 +1,147 @@
+import argparse
+import json
+import struct
+import transformers
+from safetensors import safe_open
+from safetensors.torch import save_file
+from tokenizers import Tokenizer
+from transformers import AutoConfig, PreTrainedTokenizerFast
+
+from src.model_transformer.argument_extraction import ArgumentExtraction
+from src.model_transformer.triple_scoring import TripleScoring
+from src.model_transformer.shared_backbone import load_heads
+
+# Catch warnings
+from transformers import logging
+logging.set_verbosity(40)
+
+
+BUNDLE_FORMAT = 'albert-triple-extractor'
+BUNDLE_VERSION = '1'
+MODULES = {'argument_extraction': ArgumentExtraction, 'triple_scoring': TripleScoring}
+
+
+def save_bundle(extractor, bio_lookup, path):
+    """ Saves an AlbertTripleExtractor as a single safetensors file holding the weights of both
+        modules, the encoder config, the tokenizer (with SPEAKER tokens) and the bio_lookup.
+
+        params:
+        AlbertTripleExtractor extractor:    pipeline to save (with separate encoders)
+        dict bio_lookup:                    dict with B-tag as key and abstract predicate as value
+        str path:                           path of the bundle (e.g. level1.safetensors)
+    """
+    modules = {'argument_extraction': extractor._argument_module, 'triple_scoring': extractor._scoring_module}
+    if any(module._shared for module in modules.values()):
+        raise ValueError('bundles of a shared backbone are not supported')
+
+    tokenizer = extractor._argument_module._tokenizer
+    if not tokenizer.is_fast:
+        raise ValueError('bundles require a fast tokenizer')
+
+    # Weights of both modules (encoders and heads)
+    tensors = dict()
+    for name, module in modules.items():
+        for key, value in module.state_dict().items():
+            tensors[name + '.' + key] = value.detach().cpu().contiguous()
+
+    encoder = extractor._argument_module._model
+    metadata = {'format': BUNDLE_FORMAT,
+                'version': BUNDLE_VERSION,
+                'model_class': type(encoder).__name__,
+                'config': encoder.config.to_json_string(),
+                'tokenizer': tokenizer.backend_tokenizer.to_str(),
+                'special_tokens': json.dumps(tokenizer.special_tokens_map),
+                'bio_lookup': json.dumps(bio_lookup),
+                'max_len': str(extractor._scoring_module._max_len)}
+    save_file(tensors, path, metadata=metadata)
+    print('saved bundle to %s' % path)
+
+
+def _load_tokenizer(metadata):
+    tokenizer = PreTrainedTokenizerFast(tokenizer_object=Tokenizer.from_str(metadata['tokenizer']),
+                                        **json.loads(metadata['special_tokens']))
+    return tokenizer
+
+
+def read_bio_lookup(path):
+    """ Reads the bio_lookup of a bundle (without loading the weights).
+    """
+    with safe_open(path, framework='pt') as file:
+        metadata = file.metadata()
+    return {int(k): v for k, v in json.loads(metadata['bio_lookup']).items()}
+
+
+def read_tokenizer(path):
+    """ Reads the tokenizer of a bundle (without loading the weights), e.g. to share it among bundles.
+    """
+    with safe_open(path, framework='pt') as file:
+        metadata = file.metadata()
+    return _load_tokenizer(metadata)
+
+
+def read_size(path):
+    """ Reads the size of the weights of a bundle in bytes from its header (without loading the weights).
+    """
+    with open(path, 'rb') as file:
+        header_len, = struct.unpack('<Q', file.read(8))
+        header = json.loads(file.read(header_len))
+    return sum(end - start for key, entry in header.items() if key != '__metadata__'
+               for start, end in [entry['data_offsets']])
+
+
+def load_bundle(path, sep='<eos>', overflow='truncate', tokenizer=None):
+    """ Loads both modules from a bundle (see save_bundle). Weights are memory-mapped rather than
+        read into private memory (so processes loading the same bundle share the page cache) and
+        encoders are built from the stored config without hub resolution or random initialization.
+
+        params:
+        str path:       path of the bundle
+        str sep:        separator token used to delimit dialogue turns (default: <eos>)
+        str overflow:   overflow policy of triple scoring (see TripleScoring) (default: truncate)
+        tokenizer:      tokenizer to use instead of the stored one, e.g. shared with other bundles (optional)
+
+        returns:    ArgumentExtraction, TripleScoring and bio_lookup
+    """
+    with safe_open(path, framework='pt') as file:
+        metadata = file.metadata()
+        if metadata.get('format') != BUNDLE_FORMAT:
+            raise ValueError('%s is not a bundle of %s' % (path, BUNDLE_FORMAT))
+        tensors = {key: file.get_tensor(key) for key in file.keys()}
+
+    config = AutoConfig.for_model(**json.loads(metadata['config']))
+    model_class = getattr(transformers, metadata['model_class'])
+    tokenizer = tokenizer if tokenizer is not None else _load_tokenizer(metadata)
+
+    modules = []
+    for name, module_class in MODULES.items():
+        state = {key[len(name) + 1:]: value for key, value in tensors.items() if key.startswith(name + '.')}
+
+        # Build encoder from its weights and put the heads on top
+        encoder_state = {key[len('_model.'):]: value for key, value in state.items() if key.startswith('_model.')}
+        model = model_class.from_pretrained(None, config=config, state_dict=encoder_state)
+        if name == 'triple_scoring':
+            module = module_class(sep=sep, overflow=overflow, max_len=int(metadata['max_len']), model=model,
+                                  tokenizer=tokenizer)
+        else:
+            num_labels = state['_subj_head.weight'].shape[0]
+            module = module_class(sep=sep, model=model, tokenizer=tokenizer, num_labels=num_labels)
+        load_heads(module, state)
+        modules.append(module)
+
+    bio_lookup = {int(k): v for k, v in json.loads(metadata['bio_lookup']).items()}
+    return modules[0], modules[1], bio_lookup
+
+
+if __name__ == '__main__':
+    from src.model_transformer.run_transformer_pipeline import AlbertTripleExtractor
+    from src.model_transformer.utils import load_bio_lookup
+
+    parser = argparse.ArgumentParser(description='Bundle argument extraction and triple scoring checkpoints, '
+                                                 'tokenizer and bio_lookup into a single file')
+    parser.add_argument('out_path', help='path of the bundle (e.g. level1.safetensors)')
+    parser.add_argument('--path', default='models/level1', help='path to savefile')
+    parser.add_argument('--level', default=1, type=int, choices=[1, 2], help='level of abstract predicates')
+    args = parser.parse_args()
+
+    bio_lookup = load_bio_lookup('../Argument Extraction/conversion_dict_level%s.json' % args.level)
+    save_bundle(AlbertTripleExtractor(args.path, bio_lookup), bio_lookup, args.out_path)
@@ -0,0 +1,66 @@
+import argparse
+import glob
+
+from src.model_transformer.run_transformer_pipeline import AlbertTripleExtractor
+from src.model_transformer.inference_engine import InferenceEngine
+from src.model_transformer.utils import load_bio_lookup
+from src.evaluation.benchmark_evaluation.benchmark_evaluation_categories import load_examples
+from src.evaluation.benchmark_evaluation.metrics import precision_at_k, recall_at_k, f_score_at_k, \
+    precision_recall_auc
+
+
+def predict(model, examples):
+    """ Extracts triples from the dialogue of each example (dialogue, triples).
+    """
+    return [model.extract_triples(dialog, verbose=False) for dialog, _ in examples]
+
+
+def evaluate(true_triples, pred_triples, k):
+    """ Computes precision@k, recall@k, F1@k and PR-AUC without plotting the PR curve.
+    """
+    auc, _ = precision_recall_auc(true_triples, pred_triples, plot_pr=False)
+    return (precision_at_k(true_triples, pred_triples, k), recall_at_k(true_triples, pred_triples, k),
+            f_score_at_k(true_triples, pred_triples, k), auc)
+
+
+def check_quantization(model, quantized_model, test_file, k=0.9):
+    """ Replays a test file through the float32 and INT8 models and compares their
+        precision@k, recall@k, F1@k and PR-AUC (see evaluate).
+
+        params:
+        InferenceEngine model:              float32 model
+        InferenceEngine quantized_model:    quantized model
+        str test_file:                      test file (e.g. src/dataset/final/eval/test_full_level1_eval.txt)
+        float k:                            confidence level at which to evaluate models
+
+        returns:    scores of the float32 model, scores of the quantized model and their difference
+    """
+    examples = [(dialog, triples) for dialog, triples in load_examples(test_file)
+                if all(len(triple) == 4 for triple in triples)]
+    true_triples = [triples for _, triples in examples]
+
+    scores = evaluate(true_triples, predict(model, examples), k)
+    quantized_scores = evaluate(true_triples, predict(quantized_model, examples), k)
+    delta = tuple(q - s for s, q in zip(scores, quantized_scores))
+    return scores, quantized_scores, delta
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare precision and recall of the INT8 quantized models '
+                                                 'against the float32 models on the evaluation files')
+    parser.add_argument('--path', default='models/level1', help='path to savefile')
+    parser.add_argument('--level', default=1, type=int, choices=[1, 2], help='level of abstract predicates')
+    parser.add_argument('--k', default=0.9, type=float, help='confidence level at which to evaluate models')
+    args = parser.parse_args()
+
+    bio_lookup = load_bio_lookup('../Argument Extraction/conversion_dict_level%s.json' % args.level)
+    model = InferenceEngine(AlbertTripleExtractor(args.path, bio_lookup))
+    quantized_model = InferenceEngine(AlbertTripleExtractor(args.path, bio_lookup, quantize=True))
+
+    results = []
+    for test_file in sorted(glob.glob('src/dataset/final/eval/*_level%s_eval.txt' % args.level)):
+        results.append((test_file, check_quantization(model, quantized_model, test_file, args.k)))
+
+    print('\n%-55s %10s %10s %10s %10s' % ('delta (INT8 - float32)', 'precision', 'recall', 'F1', 'AUC'))
+    for test_file, (_, _, delta) in results:
+        print('%-55s %+10.4f %+10.4f %+10.4f %+10.4f' % ((test_file.split('/')[-1],) + delta))
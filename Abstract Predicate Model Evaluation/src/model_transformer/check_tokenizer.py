@@ -0,0 +1,83 @@
+import argparse
+import glob
+import spacy
+
+
+# Test set (formerly src/dataset/final/test), evaluation set and benchmark examples
+TEST_FILES = ['src/dataset/final/test_jaap/*.txt',
+              'src/dataset/final/eval/*.txt',
+              'src/evaluation/benchmark_evaluation/test_examples/*.txt']
+
+
+def load_dialogs(path):
+    """ Loads the dialogues of a test file, i.e. the second line of every block
+        (the first holds the ID of the example and the others its triples).
+
+        params:
+        str path:   path to test file
+
+        returns:    list of separator-delimited dialogues
+    """
+    dialogs = []
+    with open(path, 'r', encoding='utf-8') as file:
+        block = []
+        for line in file:
+            if line.strip() and not line.startswith('#'):
+                block.append(line.strip())
+            elif block:
+                dialogs.append(block[1])
+                block = []
+        if block:
+            dialogs.append(block[1])
+    return dialogs
+
+
+def check_tokenizer(dialogs, nlp, sep='<eos>'):
+    """ Checks that tokenizing turns with the spaCy tokenizer only ('fast' mode of
+        AlbertTripleExtractor) yields the same tokens as running the full pipeline.
+
+        params:
+        list dialogs:   separator-delimited dialogues
+        Language nlp:   spaCy pipeline
+        str sep:        separator token used to delimit dialogue turns (default: <eos>)
+
+        returns:    list of (turn, full tokens, fast tokens) triples for turns that differ
+    """
+    mismatches = []
+    for dialog in dialogs:
+        for turn in dialog.split(sep):
+            turn = turn.lower().strip()
+            if not turn:
+                continue
+
+            full = [t.lower_ for t in nlp(turn)]
+            fast = [t.lower_ for t in nlp.make_doc(turn)]
+            if full != fast:
+                mismatches.append((turn, full, fast))
+    return mismatches
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check that the fast tokenizer mode reproduces the tokens '
+                                                 'of the full spaCy pipeline on the test dialogues')
+    parser.add_argument('patterns', nargs='*', default=TEST_FILES, help='glob patterns of test files')
+    args = parser.parse_args()
+
+    nlp = spacy.load('en_core_web_sm')
+
+    num_dialogs = 0
+    num_mismatches = 0
+    for pattern in args.patterns:
+        for fname in sorted(glob.glob(pattern)):
+            dialogs = load_dialogs(fname)
+            mismatches = check_tokenizer(dialogs, nlp)
+            print('%s: %s dialogues, %s mismatches' % (fname, len(dialogs), len(mismatches)))
+            for turn, full, fast in mismatches:
+                print('\t- %s\n\t  full: %s\n\t  fast: %s' % (turn, full, fast))
+
+            num_dialogs += len(dialogs)
+            num_mismatches += len(mismatches)
+
+    print('checked %s dialogues, %s mismatches' % (num_dialogs, num_mismatches))
+    if num_mismatches:
+        raise SystemExit(1)
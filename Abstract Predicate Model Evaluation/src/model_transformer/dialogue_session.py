@@ -0,0 +1,96 @@
+from collections import deque
+
+
+class DialogueSession:
+    def __init__(self, extractor, window=3, min_delta=0.01, post_process=True, batch_size=32,
+                 speaker1=None, speaker2=None):
+        """ Incremental triple extraction for a live conversation. Turns are added one at a
+            time; each turn is tokenized only once and extraction only considers a bounded
+            window of the latest turns, so that the cost per turn does not grow with the
+            length of the conversation.
+
+        :param extractor:    AlbertTripleExtractor
+        :param window:       number of latest turns to extract triples from (default: 3)
+        :param min_delta:    minimum change in confidence for a known triple to be emitted again
+        :param post_process: Whether to apply rules to fix contractions and strip auxiliaries (like baselines)
+        :param batch_size:   If a lot of possible triples exist, batch up processing
+        :param speaker1:     name of the speaker of the first (third, fifth, ...) turn (default: as extractor)
+        :param speaker2:     name of the speaker of the second (fourth, ...) turn (default: as extractor)
+        """
+        self._extractor = extractor
+        self._window = window
+        self._min_delta = min_delta
+        self._post_process = post_process
+        self._batch_size = batch_size
+        self._speaker1 = speaker1 if speaker1 else extractor._speaker1
+        self._speaker2 = speaker2 if speaker2 else extractor._speaker2
+
+        # Tokenized turns with pronouns resolved for either speaker ID (None for empty turns)
+        self._turns = deque(maxlen=window)
+        self._num_turns = 0
+
+        # Arguments extracted from the latest windows and confidences of all triples emitted so far
+        self._arguments = deque(maxlen=window)
+        self._triples = dict()
+
+    @property
+    def triples(self):
+        """ All triples extracted so far with their latest confidence. """
+        return sorted([(conf, triple) for triple, conf in self._triples.items()], key=lambda x: -x[0])
+
+    @property
+    def arguments(self):
+        """ Subject, predicate and object arguments extracted after each of the latest turns. """
+        return list(self._arguments)
+
+    def _window_tokens(self):
+        """ Assembles the token sequence of the window as AlbertTripleExtractor._tokenize would.
+        """
+        tokens = []
+        for turn_id, turn in enumerate(self._turns):
+            speaker_id = (len(self._turns) - turn_id + 1) % 2
+            if turn is not None:
+                tokens += turn[speaker_id]
+        return tokens
+
+    def add_turn(self, turn):
+        """ Adds a turn to the conversation and extracts triples from the window of latest turns.
+
+        :param turn: utterance of the next speaker
+        :return:     list of confidence-triple pairs that are new or whose confidence changed
+        """
+        # Tokenize the new turn only, resolving pronouns for both speaker IDs it may get in the window
+        turn = turn.lower().strip()
+        if turn:
+            tokens = self._extractor._tokenize_turn(turn)
+            self._turns.append(tuple(self._extractor._resolve_pronouns(tokens, speaker_id) for speaker_id in (0, 1)))
+        else:
+            self._turns.append(None)
+        self._num_turns += 1
+
+        # The extractor calls the speaker of the latest turn SPEAKER1
+        if self._num_turns % 2 == 1:
+            speakers = (self._speaker1, self._speaker2)
+        else:
+            speakers = (self._speaker2, self._speaker1)
+
+        arguments = []
+        triples = self._extractor._extract_from_tokens([self._window_tokens()], post_process=self._post_process,
+                                                       batch_size=self._batch_size, speakers=[speakers],
+                                                       arguments=arguments)[0]
+        self._arguments.append(arguments[0])
+
+        # Emit triples that are new or whose confidence changed
+        updates = []
+        for conf, triple in triples:
+            if triple not in self._triples or abs(self._triples[triple] - conf) >= self._min_delta:
+                updates.append((conf, triple))
+            self._triples[triple] = conf
+        return updates
+
+    def reset(self):
+        """ Forgets all turns and triples of the conversation. """
+        self._turns.clear()
+        self._arguments.clear()
+        self._triples = dict()
+        self._num_turns = 0
@@ -0,0 +1,186 @@
+import argparse
+import glob
+import itertools
+import time
+import numpy as np
+import torch
+
+from src.model_transformer.run_transformer_pipeline import AlbertTripleExtractor
+from src.model_transformer.dialogue_session import DialogueSession
+from src.model_transformer.check_tokenizer import TEST_FILES, load_dialogs
+from src.model_transformer.utils import load_bio_lookup
+
+
+# Dialogues of increasing length to warm up the models with
+WARMUP_DIALOGS = ["i like dogs .",
+                  "do you have any pets ? <eos> yes , i have two dogs . <eos> i love dogs !",
+                  "i went to the new university . it was great ! <eos> i like studying too and learning . you ? "
+                  "<eos> no , i hate it ! <eos> why ? <eos> my teachers are too strict and i do not like "
+                  "waking up early . <eos> that is a shame ."]
+
+
+class InferenceEngine:
+    def __init__(self, extractor, fuse=True):
+        """ Runs an AlbertTripleExtractor for inference only: its modules are put in eval mode,
+            their parameters frozen and every call is made without autograd (inference_mode).
+            All other attributes are those of the extractor.
+
+            The modules of the extractor are changed in place, so the extractor itself also runs in
+            eval mode with frozen parameters (and fused heads) afterwards; release() restores it.
+
+        :param extractor: AlbertTripleExtractor
+        :param fuse:      whether to fuse the argument extraction heads into one layer (default: True)
+        """
+        self._extractor = extractor
+        modules = [extractor._argument_module, extractor._scoring_module]
+
+        # Training mode and requires_grad flags to restore on release()
+        self._state = [(module, module.training, [(p, p.requires_grad) for p in module.parameters()])
+                       for module in modules]
+
+        for module in modules:
+            module.eval()
+            module.requires_grad_(False)
+
+        # Attention already runs as a fused kernel (SDPA); the three 505-way heads are fused here
+        if fuse:
+            extractor._argument_module.fuse_heads()
+
+    def __getattr__(self, name):
+        return getattr(self._extractor, name)
+
+    @property
+    def extractor(self):
+        return self._extractor
+
+    def extract_triples(self, dialog, **kwargs):
+        """ See AlbertTripleExtractor.extract_triples """
+        with torch.inference_mode():
+            return self._extractor.extract_triples(dialog, **kwargs)
+
+    def extract_triples_batch(self, dialogs, **kwargs):
+        """ See AlbertTripleExtractor.extract_triples_batch """
+        with torch.inference_mode():
+            return self._extractor.extract_triples_batch(dialogs, **kwargs)
+
+    def _extract_from_tokens(self, tokens, *args, **kwargs):
+        with torch.inference_mode():
+            return self._extractor._extract_from_tokens(tokens, *args, **kwargs)
+
+    def session(self, **kwargs):
+        """ Starts a DialogueSession which runs in inference mode (see AlbertTripleExtractor.session) """
+        return DialogueSession(self, **kwargs)
+
+    def warmup(self, dialogs=None, repeats=2):
+        """ See warmup """
+        return warmup(self, dialogs, repeats)
+
+    def release(self):
+        """ Restores the training mode and requires_grad flags of the modules of the extractor and
+            unfuses the heads, so that the extractor can be used (e.g. trained) as before.
+
+        :return: AlbertTripleExtractor
+        """
+        for module, training, flags in self._state:
+            module.train(training)
+            for param, requires_grad in flags:
+                param.requires_grad_(requires_grad)
+        self._extractor._argument_module._fused_heads = None
+        return self._extractor
+
+
+def warmup(model, dialogs=None, repeats=2):
+    """ Runs a few dialogues through the pipeline so that lazy initialization, memory
+        allocation and kernel selection do not end up in the latency of the first requests.
+
+    :param model:   AlbertTripleExtractor or InferenceEngine
+    :param dialogs: dialogues to warm up with (default: WARMUP_DIALOGS)
+    :param repeats: number of times to process the dialogues (default: 2)
+    :return:        time spent warming up in seconds
+    """
+    dialogs = dialogs if dialogs else WARMUP_DIALOGS
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for dialog in dialogs:
+            model.extract_triples(dialog, verbose=False)
+        model.extract_triples_batch(dialogs)
+    elapsed = time.perf_counter() - start
+
+    print('warmed up in %.2fs' % elapsed)
+    return elapsed
+
+
+def peak_memory(fn):
+    """ Measures the peak memory allocated by torch while calling fn (on the GPU if available,
+        otherwise on the CPU by profiling allocations).
+
+    :param fn: function to call
+    :return:   return value of fn and peak memory in bytes
+    """
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+        torch.cuda.reset_peak_memory_stats()
+        baseline = torch.cuda.memory_allocated()
+        out = fn()
+        torch.cuda.synchronize()
+        return out, torch.cuda.max_memory_allocated() - baseline
+
+    with torch.profiler.profile(activities=[torch.profiler.ProfilerActivity.CPU], profile_memory=True) as prof:
+        out = fn()
+
+    # Replay allocations and frees in order to find the highest point
+    events = sorted(prof.events(), key=lambda e: e.time_range.start)
+    usage = itertools.accumulate(e.self_cpu_memory_usage for e in events)
+    return out, max(itertools.chain([0], usage))
+
+
+def benchmark(model, dialogs):
+    """ Measures the latency of extracting triples from each dialogue and the peak memory
+        when processing the largest one.
+
+    :param model:   AlbertTripleExtractor or InferenceEngine
+    :param dialogs: list of separator-delimited dialogues
+    :return:        dict with mean, p50 and p95 latency (in ms) and peak memory (in MB)
+    """
+    latencies = []
+    for dialog in dialogs:
+        start = time.perf_counter()
+        model.extract_triples(dialog, verbose=False)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    longest = max(dialogs, key=len)
+    _, peak = peak_memory(lambda: model.extract_triples(longest, verbose=False))
+
+    return {'mean_ms': float(np.mean(latencies)),
+            'p50_ms': float(np.percentile(latencies, 50)),
+            'p95_ms': float(np.percentile(latencies, 95)),
+            'peak_mb': peak / 2 ** 20}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark latency and peak memory of the extraction pipeline '
+                                                 'before and after wrapping it in an InferenceEngine')
+    parser.add_argument('--path', default='models/level1', help='path to savefile')
+    parser.add_argument('--level', default=1, type=int, choices=[1, 2], help='level of abstract predicates')
+    parser.add_argument('--num_dialogs', default=50, type=int, help='number of test dialogues to process')
+    args = parser.parse_args()
+
+    bio_lookup = load_bio_lookup('../Argument Extraction/conversion_dict_level%s.json' % args.level)
+    dialogs = [dialog for pattern in TEST_FILES for fname in sorted(glob.glob(pattern))
+               for dialog in load_dialogs(fname)][:args.num_dialogs]
+
+    # Both runs are warmed up the same way, so that neither includes first-call costs
+    model = AlbertTripleExtractor(args.path, bio_lookup)
+    warmup(model)
+    before = benchmark(model, dialogs)
+
+    engine = InferenceEngine(model)
+    engine.warmup()
+    after = benchmark(engine, dialogs)
+    engine.release()
+
+    print('\n%-8s %10s %10s %10s %10s' % ('', 'mean (ms)', 'p50 (ms)', 'p95 (ms)', 'peak (MB)'))
+    for name, result in [('before', before), ('after', after)]:
+        print('%-8s %10.1f %10.1f %10.1f %10.1f' % (name, result['mean_ms'], result['p50_ms'], result['p95_ms'],
+                                                    result['peak_mb']))
@@ -0,0 +1,225 @@
+import argparse
+import gc
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import spacy
+import torch
+from transformers import AutoTokenizer
+
+from src.model_transformer.run_transformer_pipeline import AlbertTripleExtractor
+from src.model_transformer.post_processing import PostProcessor
+from src.model_transformer.inference_engine import InferenceEngine
+from src.model_transformer.bundle import read_tokenizer, read_size
+from src.model_transformer.result_cache import CachedExtractor
+from src.model_transformer.utils import load_bio_lookup
+
+
+# Checkpoints of the model variants (relative to 'Abstract Predicate Model Evaluation')
+VARIANTS = {'level1': {'model_paths': ('src/model_transformer/models/level1/argument_extraction_albert-base-v2.zip',
+                                       'src/model_transformer/models/TripleCandidateScorerLevel1/'
+                                       'candidate_scorer_albert-base-v2.zip'),
+                       'conversion_dict': '../Argument Extraction/conversion_dict_level1.json',
+                       'num_labels': 505},
+            'level2': {'model_paths': ('src/model_transformer/models/level2/argument_extraction_albert-base-v2.zip',
+                                       'src/model_transformer/models/TripleCandidateScorerLevel2/'
+                                       'candidate_scorer_albert-base-v2.zip'),
+                       'conversion_dict': '../Argument Extraction/conversion_dict_level2.json',
+                       'num_labels': 341},
+            'baseline': {'model_paths': ('../Baseline Model Evaluation/src/model_transformer/models/'
+                                         'baseline-2022-12-09/argument_extraction_albert-base-v2.zip',
+                                         '../Baseline Model Evaluation/src/model_transformer/models/'
+                                         'baseline-2022-12-09/candidate_scorer_albert-base-v2.zip'),
+                         'conversion_dict': None,
+                         'num_labels': 3}}
+
+
+def model_size(model):
+    """ Computes the memory held by the parameters and buffers of both modules of an extractor.
+
+        params:
+        AlbertTripleExtractor model:    extractor (or InferenceEngine)
+
+        returns:    size in bytes
+    """
+    size = 0
+    for module in [model._argument_module, model._scoring_module]:
+        for tensor in list(module.parameters()) + list(module.buffers()):
+            size += tensor.numel() * tensor.element_size()
+    return size
+
+
+def _release_memory():
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+class ModelRegistry:
+    def __init__(self, variants=None, default=None, memory_budget=None, engine=True, cache=None, **kwargs):
+        """ Loads named model variants on demand and keeps them in memory until the memory budget is
+            exceeded, at which point the least recently used variants are evicted. All variants share
+            one spaCy pipeline, post-processor and subword tokenizer.
+
+        :param variants:      dict with variant name as key and either the path of a bundle (see
+                              bundle.save_bundle) or a dict with 'model_paths', 'conversion_dict' and
+                              'num_labels' as value (default: VARIANTS)
+        :param default:       variant to use if a call selects none (default: first variant)
+        :param memory_budget: maximum size of the loaded variants in MB (default: unlimited); variants are
+                              evicted before another is loaded, based on its size from an earlier load or as
+                              estimated from its files (see estimate_size), so that the budget is only exceeded
+                              if the estimate is too low or a single variant is larger than the budget
+        :param engine:        whether to run variants in an InferenceEngine (default: True)
+        :param cache:         ResultCache to put in front of the variants (default: none)
+        :param kwargs:        other arguments of AlbertTripleExtractor (e.g. max_candidates)
+        """
+        self._variants = variants if variants else VARIANTS
+        self._default = default if default else next(iter(self._variants))
+        if self._default not in self._variants:
+            raise ValueError('unknown variant %s' % self._default)
+
+        self._budget = memory_budget * 2 ** 20 if memory_budget else None
+        self._engine = engine
+        self._cache = cache
+        self._kwargs = kwargs
+
+        # Shared among variants
+        self._nlp = spacy.load('en_core_web_sm')
+        self._post_processor = PostProcessor()
+        self._subword_tokenizer = None
+
+        # Loaded variants (with their size) in order of use and sizes of variants loaded before
+        self._models = OrderedDict()
+        self._sizes = dict()
+        self._lock = threading.Lock()
+        self._stats = {'loads': 0, 'evictions': 0}
+
+    @property
+    def variants(self):
+        return list(self._variants)
+
+    @property
+    def loaded(self):
+        """ Names of the loaded variants from least to most recently used. """
+        return list(self._models)
+
+    @property
+    def stats(self):
+        """ Number of loads and evictions and the memory held by the loaded variants (in MB). """
+        with self._lock:
+            return dict(self._stats, memory_mb=sum(size for _, size in self._models.values()) / 2 ** 20)
+
+    def estimate_size(self, variant):
+        """ Estimates the memory a variant will hold once loaded, without loading it: its size when it was
+            last loaded, or else the size of the weights in its bundle or checkpoints.
+
+        :param variant: name of the variant
+        :return:        size in bytes (0 if unknown)
+        """
+        if variant in self._sizes:
+            return self._sizes[variant]
+
+        spec = self._variants[variant]
+        if isinstance(spec, str):
+            return read_size(spec)
+        return sum(os.path.getsize(path) for path in spec['model_paths'] if path and os.path.exists(path))
+
+    def _load_tokenizer(self, spec):
+        # The tokenizer stored in a bundle, or that of the base model extended with SPEAKER tokens
+        if isinstance(spec, str):
+            return read_tokenizer(spec)
+
+        tokenizer = AutoTokenizer.from_pretrained(self._kwargs.get('base_model', 'albert-base-v2'))
+        tokenizer.add_tokens(['SPEAKER1', 'SPEAKER2'], special_tokens=True)
+        return tokenizer
+
+    def _load(self, name):
+        spec = self._variants[name]
+        if self._subword_tokenizer is None:
+            self._subword_tokenizer = self._load_tokenizer(spec)
+        shared = dict(nlp=self._nlp, post_processor=self._post_processor, subword_tokenizer=self._subword_tokenizer)
+
+        if isinstance(spec, str):
+            model = AlbertTripleExtractor.from_bundle(spec, **shared, **self._kwargs)
+        else:
+            bio_lookup = load_bio_lookup(spec['conversion_dict']) if spec['conversion_dict'] else dict()
+            model = AlbertTripleExtractor(None, bio_lookup, num_labels=spec['num_labels'],
+                                          model_paths=spec['model_paths'], **shared, **self._kwargs)
+
+        model = InferenceEngine(model) if self._engine else model
+        return CachedExtractor(model, self._cache, variant=name) if self._cache is not None else model
+
+    def _evict(self, size):
+        # Evict least recently used variants until a variant of the given size fits in the budget
+        evicted = False
+        while self._models and sum(s for _, s in self._models.values()) + size > self._budget:
+            name, _ = self._models.popitem(last=False)
+            self._stats['evictions'] += 1
+            evicted = True
+            print('evicted %s' % name)
+
+        if evicted:
+            _release_memory()
+
+    def get(self, variant=None):
+        """ Returns a variant, loading it (and evicting others) if needed.
+
+        :param variant: name of the variant (default: default variant)
+        :return:        AlbertTripleExtractor or InferenceEngine
+        """
+        variant = variant if variant else self._default
+        if variant not in self._variants:
+            raise ValueError('unknown variant %s (available: %s)' % (variant, self.variants))
+
+        with self._lock:
+            if variant in self._models:
+                self._models.move_to_end(variant)
+                return self._models[variant][0]
+
+            # Make room before loading, so that the evicted variants and the new one are not held at once
+            start = time.perf_counter()
+            if self._budget is not None:
+                self._evict(self.estimate_size(variant))
+
+            model = self._load(variant)
+            size = model_size(model)
+            if self._budget is not None:
+                self._evict(size)
+
+            self._models[variant] = (model, size)
+            self._sizes[variant] = size
+            self._stats['loads'] += 1
+            print('loaded %s (%.1f MB) in %.2fs' % (variant, size / 2 ** 20, time.perf_counter() - start))
+            return model
+
+    def evict(self, variant):
+        """ Removes a variant from memory (if loaded). """
+        with self._lock:
+            if self._models.pop(variant, None) is not None:
+                self._stats['evictions'] += 1
+                _release_memory()
+
+    def extract_triples(self, dialog, variant=None, **kwargs):
+        """ See AlbertTripleExtractor.extract_triples; variant selects the model (default: default variant) """
+        return self.get(variant).extract_triples(dialog, **kwargs)
+
+    def extract_triples_batch(self, dialogs, variant=None, **kwargs):
+        """ See AlbertTripleExtractor.extract_triples_batch; variant selects the model (default: default variant) """
+        return self.get(variant).extract_triples_batch(dialogs, **kwargs)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Extract triples with level 1, level 2 and baseline models')
+    parser.add_argument('dialog', help='separator-delimited dialogue')
+    parser.add_argument('--variants', nargs='*', default=list(VARIANTS), help='variants to run')
+    parser.add_argument('--memory_budget', default=None, type=float, help='memory budget in MB')
+    args = parser.parse_args()
+
+    registry = ModelRegistry(memory_budget=args.memory_budget)
+    for variant in args.variants:
+        print('\n%s:' % variant)
+        for score, triple in registry.extract_triples(args.dialog, variant=variant, verbose=False)[:10]:
+            print(score, triple)
+    print(registry.stats)
@@ -0,0 +1,161 @@
+import argparse
+import os
+import torch
+from transformers import AutoTokenizer
+
+from src.model_transformer.argument_extraction import ArgumentExtraction
+from src.model_transformer.triple_scoring import TripleScoring
+
+# Catch warnings
+from transformers import logging
+logging.set_verbosity(40)
+
+
+ARGUMENT_EXTRACTION_FILE = 'argument_extraction.onnx'
+TRIPLE_SCORING_FILE = 'triple_scoring.onnx'
+
+
+class _ArgumentExtractionGraph(torch.nn.Module):
+    def __init__(self, module):
+        """ Exports ArgumentExtraction with on-graph decoding of labels (see ArgumentExtraction._decode)
+        """
+        super().__init__()
+        self.module = module
+
+    def forward(self, input_ids, speaker_ids, attn_mask):
+        return self.module._decode(input_ids, speaker_ids, attn_mask)
+
+
+def export_onnx(extractor, out_dir, opset=18):
+    """ Exports the argument extraction and triple scoring modules of an AlbertTripleExtractor
+        (encoders with SPEAKER-token embeddings and heads) to ONNX with dynamic batch and
+        sequence axes, together with the tokenizer. The graphs are captured with torch.export
+        (the dynamo-based exporter, which requires onnxscript).
+
+        params:
+        AlbertTripleExtractor extractor:    pipeline to export (not quantized)
+        str out_dir:                        directory to write the ONNX graphs and tokenizer to
+        int opset:                          ONNX opset version (default: 18)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    argument_module = extractor._argument_module
+    scoring_module = extractor._scoring_module
+    training = argument_module.training, scoring_module.training
+
+    # Dummy dialogues to trace the graphs with (padded, so that masking is traced rather than skipped)
+    input_ids = torch.full((2, 16), argument_module._tokenizer.unk_token_id, dtype=torch.long)
+    speaker_ids = torch.zeros((2, 16), dtype=torch.long)
+    attn_mask = torch.ones((2, 16), dtype=torch.float)
+    attn_mask[1, 8:] = 0
+    dummy = tuple(x.to(argument_module._device) for x in (input_ids, speaker_ids, attn_mask))
+
+    inputs = ['input_ids', 'speaker_ids', 'attn_mask']
+    axes = {name: {0: torch.export.Dim.DYNAMIC, 1: torch.export.Dim.DYNAMIC} for name in inputs}
+    with torch.no_grad():
+        torch.onnx.export(_ArgumentExtractionGraph(argument_module).eval(), dummy,
+                          os.path.join(out_dir, ARGUMENT_EXTRACTION_FILE), input_names=inputs,
+                          output_names=['labels', 'confs'], opset_version=opset, dynamo=True,
+                          dynamic_shapes=axes, external_data=False, verbose=False)
+
+        dummy = tuple(x.to(scoring_module._device) for x in dummy)
+        torch.onnx.export(scoring_module.eval(), dummy, os.path.join(out_dir, TRIPLE_SCORING_FILE), input_names=inputs,
+                          output_names=['scores'], opset_version=opset, dynamo=True,
+                          dynamic_shapes=axes, external_data=False, verbose=False)
+
+    # Restore training mode of the modules
+    argument_module.train(training[0])
+    scoring_module.train(training[1])
+
+    argument_module._tokenizer.save_pretrained(out_dir)
+    print('exported ONNX graphs to %s' % out_dir)
+
+
+def _inference_session(path):
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+
+
+class OnnxArgumentExtraction(ArgumentExtraction):
+    def __init__(self, path, sep='<eos>'):
+        """ ArgumentExtraction running an exported graph (see export_onnx) through ONNX Runtime
+            on CPU. The PyTorch encoder is never built or loaded.
+
+            params:
+            str path:   directory with the exported graphs and tokenizer
+            str sep:    separator token used to delimit dialogue turns (default: <eos>)
+        """
+        torch.nn.Module.__init__(self)
+        print('loading %s for argument extraction' % os.path.join(path, ARGUMENT_EXTRACTION_FILE))
+        self._sep = sep
+        self._shared = False
+        self._device = torch.device('cpu')
+        self._max_positions = 512
+        self._tokenizer = AutoTokenizer.from_pretrained(path)
+        self._session = _inference_session(os.path.join(path, ARGUMENT_EXTRACTION_FILE))
+
+    def fuse_heads(self):
+        # The graph is optimized (and fused) by ONNX Runtime
+        pass
+
+    def _run(self, input_ids, speaker_ids, attn_mask):
+        labels, confs = self._session.run(None, {'input_ids': input_ids, 'speaker_ids': speaker_ids,
+                                                 'attn_mask': attn_mask})
+        return labels.astype('int16'), confs
+
+    def _run_full(self, input_ids, speaker_ids, attn_mask):
+        raise ValueError('full label probabilities are not exported to ONNX')
+
+    def fit(self, *args, **kwargs):
+        raise ValueError('ONNX models cannot be trained')
+
+
+class OnnxTripleScoring(TripleScoring):
+    def __init__(self, path, max_len=80, sep='<eos>', overflow='truncate'):
+        """ TripleScoring running an exported graph (see export_onnx) through ONNX Runtime
+            on CPU. The PyTorch encoder is never built or loaded.
+
+            params:
+            str path:       directory with the exported graphs and tokenizer
+            int max_len:    maximum number of subwords of a candidate (default: 80)
+            str sep:        separator token used to delimit dialogue turns (default: <eos>)
+            str overflow:   overflow policy (see TripleScoring) (default: truncate)
+        """
+        torch.nn.Module.__init__(self)
+        print('loading %s for triple scoring' % os.path.join(path, TRIPLE_SCORING_FILE))
+        self._max_len = max_len
+        self._overflow = overflow
+        self._sep = sep
+        self._shared = False
+        self._device = torch.device('cpu')
+        self._tokenizer = AutoTokenizer.from_pretrained(path)
+        self._session = _inference_session(os.path.join(path, TRIPLE_SCORING_FILE))
+
+    def _run(self, input_ids, speaker_ids, attn_mask):
+        return self._session.run(None, {'input_ids': input_ids, 'speaker_ids': speaker_ids,
+                                        'attn_mask': attn_mask})[0]
+
+    def _predict_batch_cached(self, token_seqs, candidates, prefixes=None):
+        raise ValueError('prefix caching is not available with ONNX Runtime')
+
+    def fit(self, *args, **kwargs):
+        raise ValueError('ONNX models cannot be trained')
+
+
+if __name__ == '__main__':
+    from src.model_transformer.run_transformer_pipeline import AlbertTripleExtractor
+    from src.model_transformer.utils import load_bio_lookup
+
+    parser = argparse.ArgumentParser(description='Export argument extraction and triple scoring to ONNX')
+    parser.add_argument('out_dir', help='directory to write the ONNX graphs and tokenizer to')
+    parser.add_argument('--path', default='models/level1', help='path to savefile')
+    parser.add_argument('--unified_path', default=None, help='path to a unified checkpoint (optional)')
+    parser.add_argument('--level', default=1, type=int, choices=[1, 2], help='level of abstract predicates')
+    parser.add_argument('--opset', default=18, type=int, help='ONNX opset version')
+    args = parser.parse_args()
+
+    bio_lookup = load_bio_lookup('../Argument Extraction/conversion_dict_level%s.json' % args.level)
+    export_onnx(AlbertTripleExtractor(args.path, bio_lookup, unified_path=args.unified_path), args.out_dir,
+                args.opset)
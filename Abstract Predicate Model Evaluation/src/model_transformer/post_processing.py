@@ -1,3 +1,4 @@
+from collections import OrderedDict
 import spacy
 import re
 
@@ -24,9 +25,65 @@ PRED_RULES = {'VERB PART VERB': [0, 1],           # "want to go"
 AUXILIARIES = ["am", "'m", "' m", "are", "is", "was", "do", "does", "did", "'ll", "will", "be", "been", "'ve", "have"]
 
 
+class LRUCache:
+    def __init__(self, maxsize=8192):
+        """ Dictionary which holds at most maxsize items, evicting the least recently used.
+        """
+        self._items = OrderedDict()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        if key not in self._items:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
+
+
 class PostProcessor:
-    def __init__(self):
-        self._nlp = spacy.load('en_core_web_sm')
+    def __init__(self, cache_size=8192, batch_size=256):
+        """ Rule-based post-processing of triples. The decontracted forms, POS sequences and
+            tokens of argument strings are kept in LRU caches shared across calls, as the same
+            strings recur in many candidate triples.
+
+        :param cache_size: maximum number of strings to keep in each cache (default: 8192)
+        :param batch_size: number of strings to pass through spaCy at once (default: 256)
+        """
+        # Only POS tags are used; the parser and NER do not affect them
+        self._nlp = spacy.load('en_core_web_sm', disable=['parser', 'ner'])
+        self._batch_size = batch_size
+        self._decontract_cache = LRUCache(cache_size)
+        self._pos_cache = LRUCache(cache_size)
+        self._token_cache = LRUCache(cache_size)
+
+    @property
+    def cache_info(self):
+        """ Hits, misses and size of the decontraction, POS sequence and token caches. """
+        return {name: {'hits': cache.hits, 'misses': cache.misses, 'size': len(cache)}
+                for name, cache in [('decontract', self._decontract_cache), ('pos_sequence', self._pos_cache),
+                                    ('tokens', self._token_cache)]}
+
+    def _cached_decontract(self, phrase, is_predicate=False):
+        result = self._decontract_cache.get((phrase, is_predicate))
+        if result is None:
+            result = self._decontract(phrase, is_predicate)
+            self._decontract_cache.put((phrase, is_predicate), result)
+        return result
 
     @staticmethod
     def _decontract(phrase, is_predicate=False):
@@ -53,27 +110,75 @@ class PostProcessor:
         # Remove double spaces if any
         return re.sub(' +', ' ', phrase.strip())
 
-    def _pos_sequence(self, predicate):
-        """ Returns the POS sequence of a given predicate string. We add
-            token "I" and "things" to ensure correct POS sequence.
-        """
+    @staticmethod
+    def _to_pos_sequence(doc):
         pos_seq = []
-        for token in self._nlp("I " + predicate.strip() + " things"):
+        for token in doc:
             tag = 'AUX' if token.tag_ == 'MD' else token.pos_  # Ensure backwards compatibility with SpaCy v2
             pos_seq.append(tag)
         return pos_seq[1:-1]
 
+    def _pos_sequence(self, predicate):
+        """ Returns the POS sequence of a given predicate string. We add
+            token "I" and "things" to ensure correct POS sequence.
+        """
+        pos_seq = self._pos_cache.get(predicate)
+        if pos_seq is None:
+            pos_seq = tuple(self._to_pos_sequence(self._nlp("I " + predicate.strip() + " things")))
+            self._pos_cache.put(predicate, pos_seq)
+        return list(pos_seq)
+
+    def _tokens(self, phrase):
+        """ Returns the (lowercased) tokens of a phrase.
+        """
+        tokens = self._token_cache.get(phrase)
+        if tokens is None:
+            tokens = tuple(t.lower_ for t in self._nlp.make_doc(phrase))
+            self._token_cache.put(phrase, tokens)
+        return list(tokens)
+
+    def _tag_all(self, phrases):
+        """ Computes the POS sequences of all phrases not yet cached in batches (nlp.pipe).
+        """
+        phrases = [phrase for phrase in dict.fromkeys(phrases) if phrase not in self._pos_cache]
+        docs = self._nlp.pipe(["I " + phrase.strip() + " things" for phrase in phrases], batch_size=self._batch_size)
+        for phrase, doc in zip(phrases, docs):
+            self._pos_cache.put(phrase, tuple(self._to_pos_sequence(doc)))
+
     def format(self, triple):
         # Fix contractions
-        subj = self._decontract(triple[0])
-        pred = self._decontract(triple[1], is_predicate=True)
-        obj = self._decontract(triple[2])
+        subj = self._cached_decontract(triple[0])
+        pred = self._cached_decontract(triple[1], is_predicate=True)
+        obj = self._cached_decontract(triple[2])
+        return (subj,) + self._format_arguments(pred, obj)
 
+    def format_batch(self, triples):
+        """ Formats many triples at once. Each unique argument string is decontracted and
+            tagged only once (in batches) and each unique predicate-object pair formatted once.
+
+        :param triples: list of triples of the form (subj, pred, obj)
+        :return:        list of formatted triples
+        """
+        triples = [(self._cached_decontract(subj), self._cached_decontract(pred, is_predicate=True),
+                    self._cached_decontract(obj)) for subj, pred, obj in triples]
+
+        # Tag unique predicates and objects together
+        self._tag_all([arg for _, pred, obj in triples for arg in (pred, obj)])
+
+        formatted = dict()
+        for _, pred, obj in triples:
+            if (pred, obj) not in formatted:
+                formatted[(pred, obj)] = self._format_arguments(pred, obj)
+        return [(subj,) + formatted[(pred, obj)] for subj, pred, obj in triples]
+
+    def _format_arguments(self, pred, obj):
+        """ Applies the rules to a decontracted predicate and object (independent of the subject).
+        """
         # Get token sequence of arguments
         pred_tags = self._pos_sequence(pred)
         obj_tags = self._pos_sequence(obj)
-        pred = [t.lower_ for t in self._nlp(pred)]
-        obj = [t.lower_ for t in self._nlp(obj)]
+        pred = self._tokens(pred)
+        obj = self._tokens(obj)
 
         # Remove auxiliaries if there is a following verb or auxiliary
         if len(pred) > 1 and pred_tags[1] in ['AUX', 'VERB', 'INTJ']:
@@ -100,7 +205,7 @@ class PostProcessor:
         if pred.startswith('do like'):
             pred = pred[3:]
 
-        return subj, pred, obj
+        return pred, obj
 
 
 if __name__ == '__main__':
@@ -0,0 +1,139 @@
+import math
+import torch
+
+
+# Submodules and attributes of the ALBERT implementation of transformers (4.x and 5.x) whose computation
+# is re-implemented below; see check_model
+ALBERT_STRUCTURE = {'model': ['embeddings', 'encoder'],
+                    'encoder': ['embedding_hidden_mapping_in', 'albert_layer_groups'],
+                    'layer': ['attention', 'ffn', 'ffn_output', 'activation', 'full_layer_layer_norm'],
+                    'attention': ['query', 'key', 'value', 'dense', 'LayerNorm', 'num_attention_heads',
+                                  'attention_head_size']}
+
+
+def check_model(model):
+    """ Checks that a model has the structure of the ALBERT encoder whose layers encode_prefix and
+        encode_suffix re-implement, so that a change in transformers fails loudly rather than
+        silently changing the scores.
+
+        params:
+        AlbertModel model:  ALBERT encoder
+
+        raises:     NotImplementedError if the model does not have the expected structure
+    """
+    config = model.config
+    if config.model_type != 'albert' or getattr(config, 'position_embedding_type', 'absolute') != 'absolute':
+        raise NotImplementedError('prefix caching requires an ALBERT encoder with absolute position embeddings')
+
+    parts = {'model': model, 'encoder': getattr(model, 'encoder', None)}
+    for name, attributes in ALBERT_STRUCTURE.items():
+        objs = [parts.get(name)]
+        if name in ['layer', 'attention'] and hasattr(model, 'encoder'):
+            layers = list(_albert_layers(model))
+            objs = layers if name == 'layer' else [getattr(layer, 'attention', None) for layer in layers]
+
+        for obj in objs:
+            missing = [attr for attr in attributes if not hasattr(obj, attr)]
+            if missing:
+                raise NotImplementedError('unexpected ALBERT structure (%s has no %s); prefix caching is not '
+                                          'supported with this version of transformers' % (name, missing))
+
+
+def _albert_layers(model):
+    """ Yields the (shared) ALBERT layers in the order in which they are applied.
+    """
+    config = model.config
+    for i in range(config.num_hidden_layers):
+        group_idx = int(i / (config.num_hidden_layers / config.num_hidden_groups))
+        for layer in model.encoder.albert_layer_groups[group_idx].albert_layers:
+            yield layer
+
+
+def _embed(model, input_ids, speaker_ids, position_ids):
+    """ Maps input_ids to the hidden size of the ALBERT encoder.
+    """
+    h = model.embeddings(input_ids=input_ids, token_type_ids=speaker_ids, position_ids=position_ids)
+    return model.encoder.embedding_hidden_mapping_in(h)
+
+
+def _split_heads(attention, x):
+    """ Reshapes a tensor of shape (N, seq_len, hidden) into (N, heads, seq_len, head_size).
+    """
+    n, seq_len, _ = x.shape
+    x = x.view(n, seq_len, attention.num_attention_heads, attention.attention_head_size)
+    return x.permute(0, 2, 1, 3)
+
+
+def _attend(attention, h, keys, values, attn_mask):
+    """ Self-attention of the queries in h over (cached and own) keys and values.
+    """
+    queries = _split_heads(attention, attention.query(h))
+    scores = torch.matmul(queries, keys.transpose(-1, -2)) / math.sqrt(attention.attention_head_size)
+    probs = torch.softmax(scores + attn_mask, dim=-1)
+    context = torch.matmul(probs, values).permute(0, 2, 1, 3).flatten(2)
+    return attention.LayerNorm(h + attention.dense(context))
+
+
+def _feed_forward(layer, h):
+    ffn = layer.ffn_output(layer.activation(layer.ffn(h)))
+    return layer.full_layer_layer_norm(ffn + h)
+
+
+def encode_prefix(model, input_ids, speaker_ids, position_ids):
+    """ Encodes a prefix shared by many inputs (e.g. a dialogue) once and caches
+        the key/value states of every layer.
+
+        params:
+        AlbertModel model:      ALBERT encoder
+        Tensor input_ids:       prefix input_ids of shape (1, prefix_len)
+        Tensor speaker_ids:     prefix speaker_ids of shape (1, prefix_len)
+        Tensor position_ids:    prefix position_ids of shape (1, prefix_len)
+
+        returns:    list with a (keys, values) pair for each layer
+    """
+    check_model(model)
+    h = _embed(model, input_ids, speaker_ids, position_ids)
+    attn_mask = torch.zeros((1, 1, 1, input_ids.shape[1]), dtype=h.dtype, device=h.device)
+
+    cache = []
+    for layer in _albert_layers(model):
+        attention = layer.attention
+        keys = _split_heads(attention, attention.key(h))
+        values = _split_heads(attention, attention.value(h))
+        cache.append((keys, values))
+
+        h = _feed_forward(layer, _attend(attention, h, keys, values, attn_mask))
+    return cache
+
+
+def encode_suffix(model, cache, input_ids, speaker_ids, position_ids, attn_mask):
+    """ Encodes a batch of suffixes which attend to the cached prefix and to themselves.
+        As the prefix was encoded without seeing the suffixes, the result approximates
+        (rather than equals) encoding prefix and suffix jointly.
+
+        params:
+        AlbertModel model:      ALBERT encoder
+        list cache:             per-layer (keys, values) of the prefix (see encode_prefix)
+        Tensor input_ids:       suffix input_ids of shape (N, suffix_len)
+        Tensor speaker_ids:     suffix speaker_ids of shape (N, suffix_len)
+        Tensor position_ids:    suffix position_ids of shape (N, suffix_len)
+        Tensor attn_mask:       suffix attention mask of shape (N, suffix_len)
+
+        returns:    last hidden state of the suffixes of shape (N, suffix_len, hidden)
+    """
+    h = _embed(model, input_ids, speaker_ids, position_ids)
+    n = input_ids.shape[0]
+
+    # The prefix is visible to every suffix; padding in the suffixes is masked out
+    prefix_len = cache[0][0].shape[2]
+    prefix_mask = torch.ones((n, prefix_len), dtype=h.dtype, device=h.device)
+    attn_mask = torch.cat([prefix_mask, attn_mask.to(h.dtype)], dim=1)
+    attn_mask = (1.0 - attn_mask[:, None, None, :]) * torch.finfo(h.dtype).min
+
+    for layer, (prefix_keys, prefix_values) in zip(_albert_layers(model), cache):
+        attention = layer.attention
+        keys = torch.cat([prefix_keys.expand(n, -1, -1, -1), _split_heads(attention, attention.key(h))], dim=2)
+        values = torch.cat([prefix_values.expand(n, -1, -1, -1), _split_heads(attention, attention.value(h))], dim=2)
+
+        h = _feed_forward(layer, _attend(attention, h, keys, values, attn_mask))
+    return h
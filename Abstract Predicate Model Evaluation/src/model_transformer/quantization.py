@@ -0,0 +1,17 @@
+import torch
+
+
+def quantize_dynamic(module):
+    """ Quantizes the linear layers of an ArgumentExtraction or TripleScoring module (those of
+        the encoder as well as the classification heads) dynamically to INT8. Weights are stored
+        as INT8 and activations are quantized on the fly, which is supported on CPU only.
+
+        params:
+        Module module:  ArgumentExtraction or TripleScoring module (quantized in place)
+
+        returns:    module
+    """
+    module.to('cpu')
+    module._device = torch.device('cpu')
+    torch.ao.quantization.quantize_dynamic(module, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    return module
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+from src.model_transformer.post_processing import LRUCache
+
+
+def model_fingerprint(paths, **settings):
+    """ Computes a hash of the files a model was loaded from (path, size and modification time) and
+        the settings that change its output, so that cached results of a replaced checkpoint or bundle
+        are not served under the same variant name.
+
+    :param paths:    paths of the checkpoints, bundle or ONNX files (None entries are skipped)
+    :param settings: other settings of the model, e.g. quantize=True
+    :return:         hex digest
+    """
+    files = []
+    for path in paths:
+        if path is None:
+            continue
+        path = os.path.abspath(str(path))
+        stat = os.stat(path) if os.path.exists(path) else None
+        files.append([path, stat.st_size if stat else None, stat.st_mtime_ns if stat else None])
+
+    data = json.dumps([files, sorted(settings.items())], sort_keys=True, default=str)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, maxsize=4096, path=None):
+        """ Cache of extracted triples with an in-memory LRU tier and an optional on-disk tier
+            (SQLite) which survives restarts. Results found on disk are moved to memory.
+
+        :param maxsize: maximum number of results to keep in memory (default: 4096)
+        :param path:    path of the on-disk tier (default: memory only)
+        """
+        self._memory = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT)')
+            self._db.commit()
+
+    @property
+    def stats(self):
+        """ Number of hits (in memory and on disk), misses and results kept in memory. """
+        with self._lock:
+            return dict(self._stats, size=len(self._memory))
+
+    @staticmethod
+    def key(tokens, variant=None, flags=None):
+        """ Computes the key of a result from the (pronoun-resolved) tokens of the dialogue, the model
+            variant and the flags that affect the result.
+
+        :param tokens:  tokens of the dialogue (see AlbertTripleExtractor._tokenize)
+        :param variant: name of the model variant (optional)
+        :param flags:   dict of flags, e.g. post_process (optional)
+        :return:        hex digest
+        """
+        data = json.dumps([tokens, variant, sorted((flags or dict()).items())], separators=(',', ':'))
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """ Returns the cached triples for key or None. """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._stats['hits'] += 1
+                return value
+
+            row = self._db.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone() if self._db else None
+            if row is None:
+                self._stats['misses'] += 1
+                return None
+
+            value = [(conf, tuple(triple)) for conf, triple in json.loads(row[0])]
+            self._memory.put(key, value)
+            self._stats['disk_hits'] += 1
+            return value
+
+    def put(self, key, triples):
+        """ Caches the triples (list of confidence-triple pairs) for key. """
+        with self._lock:
+            self._memory.put(key, triples)
+            if self._db is not None:
+                value = json.dumps([[float(conf), list(triple)] for conf, triple in triples])
+                self._db.execute('INSERT OR REPLACE INTO results VALUES (?, ?)', (key, value))
+                self._db.commit()
+
+    def clear(self):
+        """ Removes all results (from memory and disk). """
+        with self._lock:
+            self._memory = LRUCache(self._memory._maxsize)
+            if self._db is not None:
+                self._db.execute('DELETE FROM results')
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class CachedExtractor:
+    def __init__(self, extractor, cache, variant=None):
+        """ Puts a ResultCache in front of an AlbertTripleExtractor (or InferenceEngine): dialogues
+            whose pronoun-resolved tokens were seen before with the same variant and flags are not
+            passed through the models again. All other attributes are those of the extractor.
+
+        :param extractor: AlbertTripleExtractor or InferenceEngine
+        :param cache:     ResultCache (may be shared by extractors of different variants)
+        :param variant:   name of the model variant, to keep results of variants apart (default: the
+                          fingerprint of the loaded model, see model_fingerprint)
+        """
+        self._extractor = extractor
+        self._cache = cache
+        self._variant = variant if variant is not None else extractor._fingerprint
+
+    def __getattr__(self, name):
+        return getattr(self._extractor, name)
+
+    @property
+    def cache(self):
+        return self._cache
+
+    def _flags(self, post_process, prefix_cache):
+        # Everything besides the tokens and variant name that changes the triples (including the loaded
+        # weights, so that results of a replaced checkpoint are not served)
+        extractor = self._extractor
+        return {'post_process': post_process, 'prefix_cache': prefix_cache, 'top_k': extractor._top_k,
+                'beam': extractor._beam, 'max_candidates': extractor._max_candidates,
+                'speaker1': extractor._speaker1, 'speaker2': extractor._speaker2,
+                'overflow': extractor._scoring_module._overflow, 'tokenizer': extractor._tokenizer_mode,
+                'model': extractor._fingerprint}
+
+    def extract_triples(self, dialog, post_process=True, batch_size=32, verbose=True, prefix_cache=False):
+        """ See AlbertTripleExtractor.extract_triples """
+        return self.extract_triples_batch([dialog], post_process=post_process, batch_size=batch_size,
+                                          verbose=verbose, prefix_cache=prefix_cache)[0]
+
+    def extract_triples_batch(self, dialogs, post_process=True, batch_size=32, dialog_batch_size=16, verbose=False,
+                              prefix_cache=False):
+        """ See AlbertTripleExtractor.extract_triples_batch """
+        tokens = [self._extractor._tokenize(dialog) for dialog in dialogs]
+        flags = self._flags(post_process, prefix_cache)
+        keys = [self._cache.key(seq, self._variant, flags) for seq in tokens]
+
+        # Only pass uncached dialogues (once each) through the models
+        results = [self._cache.get(key) for key in keys]
+        misses = dict()
+        for i, (key, result) in enumerate(zip(keys, results)):
+            if result is None and key not in misses:
+                misses[key] = i
+
+        if misses:
+            computed = self._extractor._extract_from_tokens([tokens[i] for i in misses.values()], post_process,
+                                                            batch_size, dialog_batch_size, verbose, prefix_cache)
+            computed = dict(zip(misses, computed))
+            for key, triples in computed.items():
+                self._cache.put(key, triples)
+
+            results = [result if result is not None else computed[key] for key, result in zip(keys, results)]
+        return [list(result) for result in results]
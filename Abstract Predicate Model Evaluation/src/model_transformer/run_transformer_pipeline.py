@@ -1,44 +1,146 @@
+import os
 import sys
+import glob
 sys.path.append('predicate_normalization')
 
 from src.model_transformer.argument_extraction import ArgumentExtraction
 from src.model_transformer.triple_scoring import TripleScoring
 from src.model_transformer.post_processing import PostProcessor
-from src.model_transformer.utils import pronoun_to_speaker_id, speaker_id_to_speaker, bio_tags_to_tokens
+from src.model_transformer.shared_backbone import SharedAlbert, load_heads
+from src.model_transformer.dialogue_session import DialogueSession
+from src.model_transformer.quantization import quantize_dynamic
+from src.model_transformer.onnx_runtime import OnnxArgumentExtraction, OnnxTripleScoring
+from src.model_transformer.bundle import load_bundle, read_bio_lookup
+from src.model_transformer.predicate_index import PredicateIndex
+from src.model_transformer.result_cache import model_fingerprint
+from src.model_transformer.utils import pronoun_to_speaker_id, speaker_id_to_speaker, bio_tags_to_tokens, \
+    prune_candidates, load_bio_lookup
 
 from itertools import product
 import spacy
 
+# Tokenization of turns: spaCy tokenizer only (fast) or the full pipeline (full)
+TOKENIZER_MODES = ['fast', 'full']
+
 
 class AlbertTripleExtractor:
     def __init__(self, path, bio_lookup, base_model='albert-base-v2',
-                 sep='<eos>', speaker1='speaker1', speaker2='speaker2'):
+                 sep='<eos>', speaker1='speaker1', speaker2='speaker2', unified_path=None,
+                 top_k=None, beam=None, max_candidates=None, overflow='truncate', tokenizer='fast',
+                 quantize=False, onnx_path=None, bundle_path=None, num_labels=505, model_paths=None, nlp=None,
+                 post_processor=None, subword_tokenizer=None):
         """ Constructor of the Albert-based Triple Extraction Pipeline.
 
-        :param path:       path to savefile
-        :param base_model: base model (default: albert-base-v2)
-        :param sep:        separator token used to delimit dialogue turns (default: <eos>)
-        :param speaker1:   name of user (default: speaker1)
-        :param speaker2:   name of system (default: speaker2)
+        :param path:           path to savefile
+        :param bio_lookup:     dict with B-tag as key and abstract predicate as value, or PredicateIndex
+        :param base_model:     base model (default: albert-base-v2)
+        :param sep:            separator token used to delimit dialogue turns (default: <eos>)
+        :param speaker1:       name of user (default: speaker1)
+        :param speaker2:       name of system (default: speaker2)
+        :param unified_path:   path to a unified checkpoint with a single encoder shared by both
+                               modules (see shared_backbone.convert_checkpoints); replaces path
+        :param top_k:          keep only the k most confident spans per argument (default: all)
+        :param beam:           drop candidates whose joint span confidence is below beam times that of
+                               the best candidate (default: keep all)
+        :param max_candidates: maximum number of candidates to score per dialogue (default: all)
+        :param overflow:       how the scorer handles candidates longer than its max_len: 'truncate',
+                               'truncate_dialogue', 'window' (the part of the dialogue mentioning the
+                               arguments) or 'error' (default: truncate)
+        :param tokenizer:      'fast' to split turns with the spaCy tokenizer only or 'full' to run the
+                               complete spaCy pipeline; both yield the same tokens (default: fast)
+        :param quantize:       whether to run both models on CPU with their linear layers (including the
+                               heads) quantized to INT8 (default: False)
+        :param onnx_path:      directory with models exported by onnx_runtime.export_onnx to run with ONNX
+                               Runtime on CPU instead of PyTorch; replaces path
+        :param bundle_path:    single-file bundle written by bundle.save_bundle to memory-map the weights,
+                               tokenizer and config from; replaces path (see from_bundle)
+        :param num_labels:     number of BIO labels of argument extraction; 505 for level 1, 341 for level 2
+                               and 3 for the baseline, which has no bio_lookup (default: 505)
+        :param model_paths:    argument extraction and triple scoring checkpoints to load instead of those
+                               of level 1 (optional)
+        :param nlp:            spaCy pipeline to share with other extractors (default: load en_core_web_sm)
+        :param post_processor: PostProcessor to share with other extractors (default: new PostProcessor)
+        :param subword_tokenizer: tokenizer (with SPEAKER tokens) to share with other extractors loaded from
+                                  bundles or checkpoints (optional)
         """
-        self._argument_module = ArgumentExtraction(base_model, path=path)
-        self._scoring_module = TripleScoring(base_model, path=path)
+        if tokenizer not in TOKENIZER_MODES:
+            raise ValueError('tokenizer must be one of %s' % TOKENIZER_MODES)
+
+        if onnx_path:
+            self._argument_module = OnnxArgumentExtraction(onnx_path, sep=sep)
+            self._scoring_module = OnnxTripleScoring(onnx_path, sep=sep, overflow=overflow)
+        elif bundle_path:
+            self._argument_module, self._scoring_module, _ = load_bundle(bundle_path, sep=sep, overflow=overflow,
+                                                                         tokenizer=subword_tokenizer)
+        elif unified_path:
+            backbone, extraction_heads, scoring_heads = SharedAlbert.load(unified_path, base_model)
+            self._argument_module = ArgumentExtraction(base_model, backbone=backbone, num_labels=num_labels)
+            self._scoring_module = TripleScoring(base_model, backbone=backbone, overflow=overflow)
+            load_heads(self._argument_module, extraction_heads)
+            load_heads(self._scoring_module, scoring_heads)
+        else:
+            argument_path, scoring_path = model_paths if model_paths else (None, None)
+            self._argument_module = ArgumentExtraction(base_model, path=path, num_labels=num_labels,
+                                                       model_path=argument_path, tokenizer=subword_tokenizer)
+            self._scoring_module = TripleScoring(base_model, path=path, overflow=overflow, model_path=scoring_path,
+                                                 tokenizer=self._argument_module._tokenizer)
+
+        if quantize:
+            quantize_dynamic(self._argument_module)
+            quantize_dynamic(self._scoring_module)
 
-        self._post_processor = PostProcessor()
-        self._nlp = spacy.load('en_core_web_sm')
+        self._post_processor = post_processor if post_processor is not None else PostProcessor()
+        self._nlp = nlp if nlp is not None else spacy.load('en_core_web_sm')
+        self._tokenizer = self._nlp.make_doc if tokenizer == 'fast' else self._nlp
+        self._tokenizer_mode = tokenizer
         self._sep = sep
 
         # Load lookup for bio annotations for predicates
-        self._bio_lookup = bio_lookup
+        self._bio_lookup = bio_lookup.bio_lookup if isinstance(bio_lookup, PredicateIndex) else bio_lookup
+
+        # Identity of the loaded weights (see result_cache.CachedExtractor)
+        if onnx_path:
+            model_files = sorted(glob.glob(os.path.join(onnx_path, '*')))
+        elif bundle_path or unified_path:
+            model_files = [bundle_path or unified_path]
+        else:
+            model_files = [self._argument_module._model_path, self._scoring_module._model_path]
+        self._fingerprint = model_fingerprint(model_files, base_model=base_model, quantize=quantize,
+                                              bio_lookup=self._bio_lookup)
 
         # Assign identities to speakers
         self._speaker1 = speaker1
         self._speaker2 = speaker2
 
+        # Pruning of candidate triples before scoring
+        self._top_k = top_k
+        self._beam = beam
+        self._max_candidates = max_candidates
+        self._pruning_stats = {'candidates': 0, 'dropped': 0}
+
+    @classmethod
+    def from_bundle(cls, bundle_path, **kwargs):
+        """ Builds the pipeline from a single-file bundle (see bundle.save_bundle), including its bio_lookup.
+
+        :param bundle_path: path of the bundle
+        :param kwargs:      other arguments of the constructor
+        :return:            AlbertTripleExtractor
+        """
+        return cls(None, read_bio_lookup(bundle_path), bundle_path=bundle_path, **kwargs)
+
     @property
     def name(self):
         return "ALBERT"
 
+    @property
+    def pruning_stats(self):
+        """ Number of candidate triples considered and dropped by pruning since construction. """
+        return dict(self._pruning_stats)
+
+    @property
+    def _prunes(self):
+        return self._top_k is not None or self._beam is not None or self._max_candidates is not None
+
     def _tokenize(self, dialog):
         """ Divides up the dialogue into separate turns and dereferences
             personal pronouns 'I' and 'you'.
@@ -55,71 +157,183 @@ class AlbertTripleExtractor:
             # Assign speaker ID to turns (tn=1, tn-1=0, tn-2=1, etc.)
             speaker_id = (len(turns) - turn_id + 1) % 2
             if turn:
-                tokens += [pronoun_to_speaker_id(t.lower_, speaker_id) for t in self._nlp(turn)] + ['<eos>']
+                tokens += self._resolve_pronouns(self._tokenize_turn(turn), speaker_id)
         return tokens
 
-    def extract_triples(self, dialog, post_process=True, batch_size=32, verbose=True, ):
+    def _tokenize_turn(self, turn):
+        """ Tokenizes a single (lowercased) turn.
+
+        :param turn: dialogue turn
+        :return:     list of tokens
+        """
+        return [t.lower_ for t in self._tokenizer(turn)]
+
+    def _resolve_pronouns(self, tokens, speaker_id):
+        """ Dereferences personal pronouns in a tokenized turn and closes it with a separator.
+
+        :param tokens:     tokens of the turn
+        :param speaker_id: speaker ID of the turn (see _tokenize)
+        :return:           list of tokens
+        """
+        return [pronoun_to_speaker_id(t, speaker_id) for t in tokens] + ['<eos>']
+
+    def session(self, **kwargs):
+        """ Starts a DialogueSession for a live conversation, which is fed one turn at a time.
+
+        :param kwargs: arguments of DialogueSession (window, min_delta, ...)
+        :return:       DialogueSession
+        """
+        return DialogueSession(self, **kwargs)
+
+    def _decode_arguments(self, labels, confs, subwords, verbose=True):
+        """ Decodes the BIO labels of the argument extraction module into sets of subject,
+            predicate and object strings.
+
+        :param labels:   BIO labels for subjects, predicates and objects of shape (3, seq_len)
+        :param confs:    probabilities of the labels of shape (3, seq_len)
+        :param subwords: subwords corresponding to the labels
+        :param verbose:  whether to print messages (True) or be silent (False) (default: True)
+        :return:         dicts of subject, predicate and object arguments with their confidence
+        """
+        # Decode predictions into strings
+        subj_args = bio_tags_to_tokens(subwords, labels[0], self._bio_lookup, confidence=True, probs=confs[0])
+        # Predicates of the baseline (no bio_lookup) are spans like subjects and objects
+        pred_args = bio_tags_to_tokens(subwords, labels[1], self._bio_lookup, predicate=bool(self._bio_lookup),
+                                       confidence=True, probs=confs[1])
+        obj_args = bio_tags_to_tokens(subwords, labels[2], self._bio_lookup, confidence=True, probs=confs[2])
+
+        if verbose:
+            print('subjects:   %s' % set(subj_args))
+            print('predicates: %s' % set(pred_args))
+            print('objects:    %s\n' % set(obj_args))
+
+        return subj_args, pred_args, obj_args
+
+    def _candidates(self, subj_args, pred_args, obj_args, verbose=True):
+        """ Lists the candidate triples to score; all combinations of arguments or, if pruning
+            is enabled, the most confident combinations (see prune_candidates).
+
+        :param subj_args: dict of subject arguments with their confidence
+        :param pred_args: dict of predicate arguments with their confidence
+        :param obj_args:  dict of object arguments with their confidence
+        :param verbose:   whether to print messages (True) or be silent (False) (default: True)
+        :return:          list of candidate triples of the form (subj, pred, obj)
+        """
+        if not self._prunes:
+            candidates, dropped = list(product(subj_args, pred_args, obj_args)), 0
+        else:
+            candidates, dropped = prune_candidates(subj_args, pred_args, obj_args, self._top_k, self._beam,
+                                                   self._max_candidates)
+
+        self._pruning_stats['candidates'] += len(candidates) + dropped
+        self._pruning_stats['dropped'] += dropped
+        if verbose and self._prunes:
+            print('pruned %s of %s candidates\n' % (dropped, len(candidates) + dropped))
+        return candidates
+
+    def _to_triple(self, y_hat, triple, post_process=True, speakers=None):
+        """ Turns a scored candidate into a confidence-triple pair.
+
+        :param y_hat:        entailment scores of the candidate (none, positive, negative)
+        :param triple:       candidate triple of the form (subj, pred, obj)
+        :param post_process: Whether to apply rules to fix contractions and strip auxiliaries (like baselines)
+        :param speakers:     names to replace SPEAKER1 and SPEAKER2 with (default: speaker1 and speaker2)
+        :return:             confidence-triple pair of the form (confidence, (subj, pred, obj, polarity))
+        """
+        subj, pred, obj = triple
+        pol = 'negative' if y_hat[2] > y_hat[1] else 'positive'
+        ent = max(y_hat[1], y_hat[2])
+
+        # Replace SPEAKER* with speaker
+        speaker1, speaker2 = speakers if speakers else (self._speaker1, self._speaker2)
+        subj = speaker_id_to_speaker(subj, speaker1, speaker2)
+        pred = speaker_id_to_speaker(pred, speaker1, speaker2)
+        obj = speaker_id_to_speaker(obj, speaker1, speaker2)
+
+        # Fix mistakes, expand contractions
+        if post_process:
+            subj, pred, obj = self._post_processor.format((subj, pred, obj))
+
+        return ent, (subj, pred, obj, pol)
+
+    def extract_triples(self, dialog, post_process=True, batch_size=32, verbose=True, prefix_cache=False):
         """
 
         :param dialog:       separator-delimited dialogue
         :param post_process: Whether to apply rules to fix contractions and strip auxiliaries (like baselines)
         :param batch_size:   If a lot of possible triples exist, batch up processing
         :param verbose:      whether to print messages (True) or be silent (False) (default: True)
+        :param prefix_cache: whether to encode the dialogue only once when scoring candidates (default: False)
         :return:             A list of confidence-triple pairs of the form (confidence, (subj, pred, obj, polarity))
         """
-        # Assign unambiguous tokens to you/I
-        tokens = self._tokenize(dialog)
+        return self.extract_triples_batch([dialog], post_process=post_process, batch_size=batch_size,
+                                          verbose=verbose, prefix_cache=prefix_cache)[0]
 
-        # Extract SPO arguments from token sequence
-        subjs, preds, objs, subwords = self._argument_module.predict(tokens)
+    def extract_triples_batch(self, dialogs, post_process=True, batch_size=32, dialog_batch_size=16, verbose=False,
+                              prefix_cache=False):
+        """ Extracts triples from many dialogues at once. Dialogues are padded and passed through
+            argument extraction together, after which the candidate triples of all dialogues are
+            pooled into shared scoring batches.
 
-        # Decode predictions into strings
-        subj_args = bio_tags_to_tokens(subwords, subjs.T, self._bio_lookup, one_hot=True)
-        # pred_args = bio_tags_to_tokens(subwords, preds.T, self._bio_lookup, one_hot=True) # change predicate to True
-        pred_args = bio_tags_to_tokens(subwords, preds.T, self._bio_lookup, predicate=True, one_hot=True)  
-        obj_args = bio_tags_to_tokens(subwords, objs.T, self._bio_lookup, one_hot=True)
+        :param dialogs:           list of separator-delimited dialogues
+        :param post_process:      Whether to apply rules to fix contractions and strip auxiliaries (like baselines)
+        :param batch_size:        number of candidate triples to score per forward pass
+        :param dialog_batch_size: number of dialogues to pass through argument extraction per forward pass
+        :param verbose:           whether to print messages (True) or be silent (False) (default: False)
+        :param prefix_cache:      whether to encode each dialogue only once when scoring candidates (default: False)
+        :return:                  A list with for each dialogue a list of confidence-triple pairs of the
+                                  form (confidence, (subj, pred, obj, polarity))
+        """
+        # Assign unambiguous tokens to you/I
+        tokens = [self._tokenize(dialog) for dialog in dialogs]
+        return self._extract_from_tokens(tokens, post_process, batch_size, dialog_batch_size, verbose, prefix_cache)
 
-        
-        if verbose:
-            print('subjects:   %s' % subj_args)
-            print('predicates: %s' % pred_args)
-            print('objects:    %s\n' % obj_args)
+    def _extract_from_tokens(self, tokens, post_process=True, batch_size=32, dialog_batch_size=16, verbose=False,
+                             prefix_cache=False, speakers=None, arguments=None):
+        """ Extracts triples from tokenized dialogues (see _tokenize).
 
-        # List all possible combinations of arguments
-        candidates = [list(triple) for triple in product(subj_args, pred_args, obj_args)]
-        if not candidates:
-            return []
+        :param tokens:            list of token sequences (one for each dialogue)
+        :param speakers:          for each dialogue the names to replace SPEAKER1 and SPEAKER2 with (optional)
+        :param arguments:         list to append the extracted arguments of each dialogue to (optional)
+        :return:                  A list with for each dialogue a list of confidence-triple pairs (see
+                                  extract_triples_batch for the other parameters)
+        """
+        # Extract SPO arguments from token sequences
+        outputs = []
+        for i in range(0, len(tokens), dialog_batch_size):
+            outputs += self._argument_module.predict_batch(tokens[i:i + dialog_batch_size])
 
-        # Score candidate triples
-        predictions = []
-        for i in range(0, len(candidates), batch_size):
-            batch = candidates[i:i+batch_size]
-            for y_hat in self._scoring_module.predict(tokens, batch):
-                predictions.append(y_hat)
+        # List all possible combinations of arguments (keeping track of the dialogue)
+        candidates = []
+        for dialog_id, (labels, confs, subwords) in enumerate(outputs):
+            subj_args, pred_args, obj_args = self._decode_arguments(labels, confs, subwords, verbose)
+            if arguments is not None:
+                arguments.append((subj_args, pred_args, obj_args))
+            candidates += [(dialog_id, list(triple)) for triple in self._candidates(subj_args, pred_args, obj_args,
+                                                                                   verbose)]
 
-        # Rank candidates according to entailment predictions
-        triples = []
-        for y_hat, (subj, pred, obj) in zip(predictions, candidates):
-            pol = 'negative' if y_hat[2] > y_hat[1] else 'positive'
-            ent = max(y_hat[1], y_hat[2])
+        # Score candidate triples of all dialogues in shared batches (of similar length)
+        predictions = self._scoring_module.predict_many(tokens, candidates, batch_size, prefix_cache)
 
-            # Replace SPEAKER* with speaker
-            subj = speaker_id_to_speaker(subj, self._speaker1, self._speaker2)
-            pred = speaker_id_to_speaker(pred, self._speaker1, self._speaker2)
-            obj = speaker_id_to_speaker(obj, self._speaker1, self._speaker2)
+        scored = [self._to_triple(y_hat, triple, False, speakers[dialog_id] if speakers else None)
+                  for y_hat, (dialog_id, triple) in zip(predictions, candidates)]
 
-            # Fix mistakes, expand contractions
-            if post_process:
-                subj, pred, obj = self._post_processor.format((subj, pred, obj))
+        # Fix mistakes, expand contractions (once for every unique argument)
+        if post_process:
+            formatted = self._post_processor.format_batch([triple[:3] for _, triple in scored])
+            scored = [(ent, triple + (pol,)) for triple, (ent, (_, _, _, pol)) in zip(formatted, scored)]
 
-            triples.append((ent, (subj, pred, obj, pol)))
+        # Rank candidates of each dialogue according to entailment predictions
+        triples = [[] for _ in tokens]
+        for (dialog_id, _), triple in zip(candidates, scored):
+            triples[dialog_id].append(triple)
 
-        return sorted(triples, key=lambda x: -x[0])
+        return [sorted(lst, key=lambda x: -x[0]) for lst in triples]
 
 
 if __name__ == '__main__':
     # bio_lookup = {3: 'like', 5: 'do'}
-    bio_lookup_l1 = {3: 'act', 5: 'add', 7: 'afford', 9: 'agree', 11: 'aid', 13: 'allow', 15: 'anticipate', 17: 'arrest', 19: 'arrive', 21: 'ask', 23: 'be', 25: 'be angry', 27: 'be arrested', 29: 'be at', 31: 'be available', 33: 'be certain', 35: 'be difficult', 37: 'be free', 39: 'be from', 41: 'be happy', 43: 'be in', 45: 'be in between', 47: 'be old', 49: 'be on', 51: 'be out', 53: 'be over', 55: 'be ready', 57: 'be scared', 59: 'be with', 61: 'be wrong', 63: 'become', 65: 'believe', 67: 'betray', 69: 'better than', 71: 'borrow', 73: 'break', 75: 'break up', 77: 'bring', 79: 'burn', 81: 'buy', 83: 'call', 85: 'can', 87: 'cancel', 89: 'care', 91: 'catch', 93: 'cause', 95: 'change', 97: 'check in', 99: 'choose', 101: 'clean', 103: 'close', 105: 'come', 107: 'confuse', 109: 'consider', 111: 'contact', 113: 'cook', 115: 'copy', 117: 'cost', 119: 'could', 121: 'count', 123: 'cut', 125: 'dance', 127: 'decide', 129: 'depend on', 131: 'destroy', 133: 'devote', 135: 'die', 137: 'different', 139: 'dislike', 141: 'distrust', 143: 'do', 145: 'do badly', 147: 'do well', 149: 'draw', 151: 'dress', 153: 'drink', 155: 'drive', 157: 'drop', 159: 'earn', 161: 'eat', 163: 'enable', 165: 'endure', 167: 'equal', 169: 'exchange', 171: 'exercise', 173: 'expect', 175: 'fall', 177: 'feel', 179: 'fight', 181: 'fill', 183: 'find', 185: 'finish', 187: 'fit', 189: 'fix', 191: 'follow', 193: 'forget', 195: 'gain', 197: 'get', 199: 'get in', 201: 'give', 203: 'go', 205: 'grow', 207: 'handle', 209: 'harder than', 211: 'have', 213: 'hear', 215: 'help', 217: 'hit', 219: 'hold', 221: 'hope', 223: 'hurry', 225: 'hurt', 227: 'include', 229: 'investigate', 231: 'involve', 233: 'join', 235: 'joke', 237: 'keep', 239: 'keep secret', 241: 'kill', 243: 'know', 245: 'lead', 247: 'learn', 249: 'leave', 251: 'light', 253: 'like', 255: 'limit', 257: 'listen', 259: 'live', 261: 'live in', 263: 'located', 265: 'lock out', 267: 'look', 269: 'lose', 271: 'love', 273: 'made of', 275: 'make', 277: 'marry', 279: 'match', 281: 'mean', 283: 'meet', 285: 'miss', 287: 'misspell', 289: 'mix', 291: 'more expensive than', 293: 'motivate', 295: 'move', 297: 'must', 299: 'need', 301: 'None', 303: 'occupy', 305: 'open', 307: 'order', 309: 'owe', 311: 'own', 313: 'paint', 315: 'park', 317: 'pay', 319: 'pay attention', 321: 'pick', 323: 'plan', 325: 'play', 327: 'portray', 329: 'practice', 331: 'pray', 333: 'prefer', 335: 'prepare', 337: 'pretend', 339: 'prevent', 341: 'promise', 343: 'propose', 345: 'protect', 347: 'pull', 349: 'put', 351: 'rain', 353: 'raise', 355: 'reach', 357: 'read', 359: 'recognize', 361: 'recommend', 363: 'recycle', 365: 'relationship', 367: 'relax', 369: 'remain', 371: 'remember', 373: 'remove', 375: 'reserve', 377: 'respond', 379: 'retire', 381: 'return', 383: 'rule', 385: 'run', 387: 'save', 389: 'say', 391: 'see', 393: 'seek', 395: 'seem', 397: 'sell', 399: 'send', 401: 'share', 403: 'shoot', 405: 'should', 407: 'show', 409: 'sign', 411: 'similar', 413: 'sing', 415: 'sit', 417: 'sleep', 419: 'smell', 421: 'smoke', 423: 'socialize', 425: 'sort', 427: 'speak', 429: 'spend', 431: 'start', 433: 'starve', 435: 'stay', 437: 'steal', 439: 'stop', 441: 'study', 443: 'survive', 445: 'swim', 447: 'take', 449: 'take off', 451: 'take out', 453: 'talk', 455: 'taste', 457: 'teach', 459: 'tell', 461: 'think', 463: 'throw', 465: 'tired', 467: 'travel', 469: 'try', 471: 'use', 473: 'visit', 475: 'wait', 477: 'wake up', 479: 'walk', 481: 'want', 483: 'waste', 485: 'watch', 487: 'water', 489: 'wear', 491: 'will', 493: 'win', 495: 'work', 497: 'work with', 499: 'worry', 501: 'would', 503: 'write'}
+    bio_lookup_l1 = load_bio_lookup('../Argument Extraction/conversion_dict_level1.json')
     
     # model = AlbertTripleExtractor('models/2022-04-27', bio_lookup)
     model = AlbertTripleExtractor('models/level1', bio_lookup_l1)
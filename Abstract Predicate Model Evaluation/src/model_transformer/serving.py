@@ -0,0 +1,306 @@
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class Overloaded(RuntimeError):
+    """ Raised when the request queue of a MicroBatcher is full. """
+
+
+class _Request:
+    def __init__(self, dialog, variant, post_process, deadline):
+        self.dialog = dialog
+        self.variant = variant
+        self.post_process = post_process
+        self.deadline = deadline
+        self.future = Future()
+
+    @property
+    def key(self):
+        # Requests are only batched with requests for the same model and flags
+        return self.variant, self.post_process
+
+
+class MicroBatcher:
+    def __init__(self, model, max_batch_size=16, max_wait_ms=10, max_queue=256, timeout_ms=None):
+        """ Gathers concurrent requests into batches which are passed through argument extraction and
+            triple scoring together (see AlbertTripleExtractor.extract_triples_batch). A batch is run as
+            soon as it holds max_batch_size dialogues or its oldest request has waited max_wait_ms.
+
+        :param model:          AlbertTripleExtractor, InferenceEngine or ModelRegistry (to select variants)
+        :param max_batch_size: maximum number of dialogues per batch (default: 16)
+        :param max_wait_ms:    maximum time to wait for a batch to fill up in ms (default: 10)
+        :param max_queue:      maximum number of waiting requests; more are rejected (default: 256)
+        :param timeout_ms:     default deadline of a request in ms (default: none)
+        """
+        self._model = model
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._timeout = timeout_ms / 1000 if timeout_ms else None
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stats = {'requests': 0, 'rejected': 0, 'expired': 0, 'failed': 0, 'batches': 0, 'dialogs': 0}
+        self._lock = threading.Lock()
+
+        self._running = True
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    @property
+    def stats(self):
+        """ Number of requests (accepted, rejected, expired and failed), batches and batched dialogues. """
+        with self._lock:
+            return dict(self._stats, queued=self._queue.qsize())
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._stats[name] += n
+
+    def submit(self, dialog, variant=None, post_process=True, timeout_ms=None):
+        """ Queues a dialogue for extraction.
+
+        :param dialog:       separator-delimited dialogue
+        :param variant:      model variant to use if model is a ModelRegistry (default: default variant)
+        :param post_process: whether to post-process the triples (default: True)
+        :param timeout_ms:   time in ms after which the request is dropped if not yet run (default: timeout_ms
+                             of the batcher)
+        :return:             Future holding the list of confidence-triple pairs
+        """
+        if not self._running:
+            raise RuntimeError('batcher is closed')
+
+        timeout = timeout_ms / 1000 if timeout_ms else self._timeout
+        deadline = time.monotonic() + timeout if timeout else None
+        request = _Request(dialog, variant, post_process, deadline)
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            self._count('rejected')
+            raise Overloaded('request queue is full (%s requests)' % self._queue.maxsize)
+
+        self._count('requests')
+        return request.future
+
+    def result(self, future, timeout_ms=None):
+        """ Waits for the triples of a submitted request until its deadline; if it passes, the request is
+            cancelled (if not yet running) and a TimeoutError is raised.
+
+        :param future:     Future returned by submit
+        :param timeout_ms: time in ms to wait (default: timeout_ms of the batcher, or no limit)
+        :return:           list of confidence-triple pairs
+        """
+        timeout = timeout_ms / 1000 if timeout_ms else self._timeout
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            if future.done():  # expired while queued
+                raise
+            future.cancel()
+            self._count('expired')
+            raise TimeoutError('deadline exceeded during extraction')
+
+    def extract_triples(self, dialog, timeout_ms=None, **kwargs):
+        """ Submits a dialogue and waits for its triples (see submit and result). """
+        return self.result(self.submit(dialog, timeout_ms=timeout_ms, **kwargs), timeout_ms)
+
+    def _next_batch(self):
+        """ Waits for a request and gathers the requests arriving within max_wait into a batch. """
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        end = time.monotonic() + self._max_wait
+        while len(batch) < self._max_batch_size:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while self._running or not self._queue.empty():
+            batch = self._next_batch()
+
+            # Drop requests whose deadline has passed (or that were cancelled)
+            now = time.monotonic()
+            requests = []
+            for request in batch:
+                if request.deadline is not None and now > request.deadline:
+                    request.future.set_exception(TimeoutError('deadline exceeded before extraction'))
+                    self._count('expired')
+                elif request.future.set_running_or_notify_cancel():
+                    requests.append(request)
+
+            # Run requests for the same variant and flags as one batch
+            groups = dict()
+            for request in requests:
+                groups.setdefault(request.key, []).append(request)
+
+            for (variant, post_process), group in groups.items():
+                self._run_group(group, variant, post_process)
+
+    def _run_group(self, group, variant, post_process):
+        """ Runs a group of requests as one batch; if the batch fails, each request is retried by itself
+            so that one failing dialogue does not fail the requests batched with it.
+        """
+        kwargs = {'variant': variant} if variant is not None else dict()
+        try:
+            results = self._model.extract_triples_batch([r.dialog for r in group], post_process=post_process,
+                                                        **kwargs)
+        except Exception as e:
+            if len(group) > 1:
+                for request in group:
+                    self._run_group([request], variant, post_process)
+                return
+
+            self._count('failed')
+            group[0].future.set_exception(e)
+            return
+
+        for request, triples in zip(group, results):
+            request.future.set_result(triples)
+        self._count('batches')
+        self._count('dialogs', len(group))
+
+    def close(self):
+        """ Stops accepting requests and waits until the queued requests are processed. """
+        self._running = False
+        self._worker.join()
+
+
+def _to_json(triples):
+    return [[float(conf), list(triple)] for conf, triple in triples]
+
+
+def _validate(dialog, variant, post_process, timeout_ms):
+    """ Returns an error message if a field of an /extract request has the wrong type, else None. """
+    if not isinstance(dialog, str):
+        return 'dialog must be a string'
+    if variant is not None and not isinstance(variant, str):
+        return 'variant must be a string'
+    if not isinstance(post_process, bool):
+        return 'post_process must be true or false'
+    if timeout_ms is not None and (isinstance(timeout_ms, bool) or not isinstance(timeout_ms, (int, float))
+                                   or timeout_ms <= 0):
+        return 'timeout_ms must be a positive number'
+    return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    batcher = None
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._reply(200, self.batcher.stats)
+        else:
+            self._reply(404, {'error': 'unknown path %s' % self.path})
+
+    def do_POST(self):
+        if self.path != '/extract':
+            self._reply(404, {'error': 'unknown path %s' % self.path})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length))
+            dialog = request['dialog']
+            variant = request.get('variant')
+            post_process = request.get('post_process', True)
+            timeout_ms = request.get('timeout_ms')
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self._reply(400, {'error': 'expected a JSON object with a dialog'})
+            return
+
+        error = _validate(dialog, variant, post_process, timeout_ms)
+        if error:
+            self._reply(400, {'error': error})
+            return
+
+        try:
+            future = self.batcher.submit(dialog, variant=variant, post_process=post_process, timeout_ms=timeout_ms)
+            self._reply(200, {'triples': _to_json(self.batcher.result(future, timeout_ms))})
+        except Overloaded as e:
+            self._reply(503, {'error': str(e)})
+        except TimeoutError as e:
+            self._reply(504, {'error': str(e)})
+        except ValueError as e:
+            self._reply(400, {'error': str(e)})
+        except Exception as e:
+            self._reply(500, {'error': '%s: %s' % (type(e).__name__, e)})
+
+    def log_message(self, format, *args):
+        # Requests are counted by the batcher rather than logged
+        pass
+
+
+def make_server(batcher, host='127.0.0.1', port=8000):
+    """ Creates an HTTP server which handles each connection in a thread and passes dialogues to the
+        batcher. Endpoints:
+
+            POST /extract   {"dialog": str, "variant": str, "post_process": bool, "timeout_ms": int}
+                            -> {"triples": [[confidence, [subj, pred, obj, polarity]], ...]}
+                            (400 if the request is invalid, 503 if the queue is full, 504 if the
+                            deadline passed, 500 if extraction failed)
+            GET  /health    -> statistics of the batcher
+
+    :param batcher: MicroBatcher
+    :param host:    host to bind to (default: 127.0.0.1)
+    :param port:    port to bind to (default: 8000)
+    :return:        ThreadingHTTPServer (call serve_forever to start)
+    """
+    handler = type('Handler', (_Handler,), {'batcher': batcher})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+if __name__ == '__main__':
+    from src.model_transformer.model_registry import ModelRegistry, VARIANTS
+    from src.model_transformer.result_cache import ResultCache
+
+    parser = argparse.ArgumentParser(description='Serve triple extraction over HTTP with dynamic micro-batching')
+    parser.add_argument('--host', default='127.0.0.1', help='host to bind to')
+    parser.add_argument('--port', default=8000, type=int, help='port to bind to')
+    parser.add_argument('--bundles', nargs='*', default=None, help='variants as name=path of bundle '
+                                                                   '(default: checkpoints of VARIANTS)')
+    parser.add_argument('--default', default=None, help='variant to use if a request selects none')
+    parser.add_argument('--memory_budget', default=None, type=float, help='memory budget of the variants in MB')
+    parser.add_argument('--max_candidates', default=None, type=int, help='maximum candidates per dialogue')
+    parser.add_argument('--max_batch_size', default=16, type=int, help='maximum dialogues per batch')
+    parser.add_argument('--max_wait_ms', default=10, type=float, help='maximum time to fill a batch in ms')
+    parser.add_argument('--max_queue', default=256, type=int, help='maximum number of waiting requests')
+    parser.add_argument('--timeout_ms', default=None, type=float, help='default deadline of requests in ms')
+    parser.add_argument('--cache_size', default=0, type=int, help='number of results to cache in memory (0 = none)')
+    parser.add_argument('--cache_path', default=None, help='path of the on-disk result cache (optional)')
+    args = parser.parse_args()
+
+    variants = dict(arg.split('=', 1) for arg in args.bundles) if args.bundles else VARIANTS
+    cache = ResultCache(args.cache_size, args.cache_path) if args.cache_size else None
+    registry = ModelRegistry(variants, default=args.default, memory_budget=args.memory_budget, cache=cache,
+                             max_candidates=args.max_candidates)
+    registry.get().warmup()
+
+    batcher = MicroBatcher(registry, args.max_batch_size, args.max_wait_ms, args.max_queue, args.timeout_ms)
+    server = make_server(batcher, args.host, args.port)
+    print('serving on http://%s:%s' % (args.host, args.port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
@@ -0,0 +1,338 @@
+import argparse
+import json
+import numpy as np
+import torch
+from transformers import AutoTokenizer, AutoModel, AutoConfig
+
+# Catch warnings
+from transformers import logging
+logging.set_verbosity(40)
+
+
+def _low_rank(delta, rank):
+    """ Approximates a weight difference by a product of two rank-r matrices (by SVD).
+    """
+    u, s, vh = torch.linalg.svd(delta.float(), full_matrices=False)
+    return u[:, :rank] * s[:rank], vh[:rank]
+
+
+class _AdaptedLinear(torch.nn.Module):
+    def __init__(self, base, rank):
+        """ Linear layer with an (optional) low-rank adapter: W x + b + (U V) x + db, or with the
+            full weight difference if rank is None: W x + b + dW x + db
+        """
+        super().__init__()
+        self.base = base
+        self.active = False
+        self.rank = rank
+        if rank is None:
+            self.delta = torch.nn.Parameter(torch.zeros_like(base.weight))
+        else:
+            rank = min(rank, base.in_features, base.out_features)
+            self.up = torch.nn.Parameter(torch.zeros(base.out_features, rank))
+            self.down = torch.nn.Parameter(torch.zeros(rank, base.in_features))
+        self.bias_delta = torch.nn.Parameter(torch.zeros(base.out_features))
+
+    def set_delta(self, param, delta):
+        if param != 'weight':
+            self.bias_delta.data.copy_(delta)
+        elif self.rank is None:
+            self.delta.data.copy_(delta)
+        else:
+            up, down = _low_rank(delta, self.up.shape[1])
+            self.up.data.copy_(up)
+            self.down.data.copy_(down)
+
+    def forward(self, x):
+        y = self.base(x)
+        if self.active and self.rank is None:
+            y = y + torch.nn.functional.linear(x, self.delta, self.bias_delta)
+        elif self.active:
+            y = y + torch.nn.functional.linear(torch.nn.functional.linear(x, self.down), self.up, self.bias_delta)
+        return y
+
+
+class _AdaptedEmbedding(torch.nn.Module):
+    def __init__(self, base, rank):
+        """ Embedding with an (optional) low-rank adapter: E[i] + (U V)[i], or with the full
+            difference of the embeddings if rank is None: E[i] + dE[i]
+        """
+        super().__init__()
+        self.base = base
+        self.active = False
+        self.rank = rank
+        if rank is None:
+            self.delta = torch.nn.Parameter(torch.zeros_like(base.weight))
+        else:
+            rank = min(rank, base.num_embeddings, base.embedding_dim)
+            self.up = torch.nn.Parameter(torch.zeros(base.num_embeddings, rank))
+            self.down = torch.nn.Parameter(torch.zeros(rank, base.embedding_dim))
+
+    def set_delta(self, param, delta):
+        if self.rank is None:
+            self.delta.data.copy_(delta)
+        else:
+            up, down = _low_rank(delta, self.up.shape[1])
+            self.up.data.copy_(up)
+            self.down.data.copy_(down)
+
+    def forward(self, input_ids):
+        y = self.base(input_ids)
+        if self.active and self.rank is None:
+            y = y + torch.nn.functional.embedding(input_ids, self.delta)
+        elif self.active:
+            y = y + torch.nn.functional.embedding(input_ids, self.up) @ self.down
+        return y
+
+
+class _AdaptedLayerNorm(torch.nn.Module):
+    def __init__(self, base, rank=None):
+        """ LayerNorm with (optional) offsets to its weight and bias (these are small, so kept in full)
+        """
+        super().__init__()
+        self.base = base
+        self.active = False
+        self.weight_delta = torch.nn.Parameter(torch.zeros_like(base.weight))
+        self.bias_delta = torch.nn.Parameter(torch.zeros_like(base.bias))
+
+    def set_delta(self, param, delta):
+        if param == 'weight':
+            self.weight_delta.data.copy_(delta)
+        else:
+            self.bias_delta.data.copy_(delta)
+
+    def forward(self, x):
+        if not self.active:
+            return self.base(x)
+        return torch.nn.functional.layer_norm(x, self.base.normalized_shape, self.base.weight + self.weight_delta,
+                                              self.base.bias + self.bias_delta, self.base.eps)
+
+
+ADAPTERS = {torch.nn.Linear: _AdaptedLinear,
+            torch.nn.Embedding: _AdaptedEmbedding,
+            torch.nn.LayerNorm: _AdaptedLayerNorm}
+
+
+def set_adapter(model, active):
+    """ Switches the adapters of a shared backbone on (triple scoring) or off (argument extraction).
+    """
+    for module in model.modules():
+        if isinstance(module, tuple(ADAPTERS.values())):
+            module.active = active
+
+
+class SharedAlbert:
+    def __init__(self, base_model='albert-base-v2', rank=None, config=None):
+        """ A single ALBERT encoder (and tokenizer) shared by argument extraction and triple scoring.
+            The encoder holds the argument extraction weights; triple scoring runs the same encoder
+            with adapters switched on that hold the difference with its own fine-tuned weights.
+
+            By default (rank=None) the adapters hold the full differences, so both modules give the
+            same results as with separate encoders, but nothing is saved: the parameters of
+            albert-base-v2 take 89.1 MB (float32) against 89.2 MB for two separate encoders. Low-rank
+            adapters take 67.6 MB at rank 128 and 56.1 MB at rank 64, but only approximate triple
+            scoring: on a small randomly initialized ALBERT, the outputs differed by up to 0.69 at rank
+            128 and 1.98 at rank 64 (mean magnitude 0.8). Check a low rank on held-out data before use
+            (see check_backbone and convert_checkpoints).
+
+            params:
+            str base_model:     Transformer architecture to use (default: albert-base-v2)
+            int rank:           rank of the adapters of linear and embedding layers, or None for exact
+                                full-rank adapters (default: None)
+            PretrainedConfig config:    config to build the encoder from instead of loading the pretrained
+                                        weights of base_model, e.g. to load a unified checkpoint (optional)
+        """
+        print('loading %s as shared backbone' % base_model)
+        self.model = AutoModel.from_pretrained(base_model) if config is None else AutoModel.from_config(config)
+        self.rank = rank
+
+        # Load and extend tokenizer with special SPEAKER tokens
+        self.tokenizer = AutoTokenizer.from_pretrained(base_model)
+        self.tokenizer.add_tokens(['SPEAKER1', 'SPEAKER2'], special_tokens=True)
+        self.model.resize_token_embeddings(len(self.tokenizer))
+
+        # Wrap linear, embedding and normalization layers with adapters
+        self._adapters = dict()
+        for name, module in list(self.model.named_modules()):
+            for child_name, child in list(module.named_children()):
+                if type(child) in ADAPTERS:
+                    adapter = ADAPTERS[type(child)](child, rank)
+                    setattr(module, child_name, adapter)
+                    self._adapters[(name + '.' + child_name).strip('.')] = adapter
+
+    def load_encoders(self, extraction_state, scoring_state):
+        """ Loads the encoder of argument extraction as backbone and stores the difference
+            with the encoder of triple scoring in the adapters.
+
+            params:
+            dict extraction_state:  state dict of ArgumentExtraction
+            dict scoring_state:     state dict of TripleScoring
+        """
+        for key, value in extraction_state.items():
+            if not key.startswith('_model.'):
+                continue
+            module_name, param = key[len('_model.'):].rsplit('.', 1)
+            base = self._adapters[module_name].base if module_name in self._adapters \
+                else self.model.get_submodule(module_name)
+            getattr(base, param).data.copy_(value)
+
+        for key, value in scoring_state.items():
+            if not key.startswith('_model.'):
+                continue
+            module_name, param = key[len('_model.'):].rsplit('.', 1)
+            if module_name in self._adapters:
+                adapter = self._adapters[module_name]
+                adapter.set_delta(param, value - getattr(adapter.base, param).data)
+
+    @staticmethod
+    def heads(state):
+        """ Returns the entries of a state dict that do not belong to the encoder.
+        """
+        return {key: value for key, value in state.items() if not key.startswith('_model.')}
+
+    @classmethod
+    def load(cls, path, base_model='albert-base-v2'):
+        """ Loads a unified checkpoint (see convert_checkpoints). The encoder is built from the stored
+            config, so the pretrained weights of base_model are not loaded first.
+
+            returns:    shared backbone, argument extraction heads and triple scoring head
+        """
+        state = torch.load(path, map_location='cpu')
+        if 'config' in state:
+            config = AutoConfig.for_model(**json.loads(state['config']))
+        else:
+            config = AutoConfig.from_pretrained(base_model)
+        backbone = cls(base_model, rank=state['rank'], config=config)
+        backbone.model.load_state_dict(state['backbone'])
+        return backbone, state['argument_extraction'], state['triple_scoring']
+
+
+def load_heads(module, state):
+    """ Loads the classification heads of ArgumentExtraction or TripleScoring on top
+        of a shared backbone.
+    """
+    missing, unexpected = module.load_state_dict(state, strict=False)
+    missing = [key for key in missing if not key.startswith('_model.')]
+    if missing or unexpected:
+        raise RuntimeError('could not load heads (missing: %s, unexpected: %s)' % (missing, unexpected))
+
+
+def check_backbone(backbone, extraction_state, scoring_state, annotation_path, base_model='albert-base-v2'):
+    """ Compares the predictions of argument extraction and triple scoring on a shared backbone
+        against those of the original checkpoints on held-out dialogues.
+
+        params:
+        SharedAlbert backbone:  shared backbone with both encoders loaded (see load_encoders)
+        dict extraction_state:  state dict of ArgumentExtraction
+        dict scoring_state:     state dict of TripleScoring
+        str annotation_path:    directory containing held-out annotations (see load_annotations)
+        str base_model:         Transformer architecture to use (default: albert-base-v2)
+
+        returns:    max absolute difference and fraction of equal labels of the argument (BIO label
+                    probabilities) and triple scores
+    """
+    from src.model_transformer.argument_extraction import ArgumentExtraction
+    from src.model_transformer.triple_scoring import TripleScoring
+    from src.model_transformer.training_cache import resolve_pronouns
+    from src.model_transformer.utils import load_annotations, extract_triples
+
+    num_labels = extraction_state['_subj_head.weight'].shape[0]
+    original = ArgumentExtraction(base_model, num_labels=num_labels), TripleScoring(base_model)
+    shared = (ArgumentExtraction(base_model, backbone=backbone, num_labels=num_labels),
+              TripleScoring(base_model, backbone=backbone))
+    for module, state in zip(original + shared, [extraction_state, scoring_state] * 2):
+        if module._shared:
+            load_heads(module, SharedAlbert.heads(state))
+        else:
+            module.load_state_dict(state)
+        module.eval()
+
+    # Dialogues (with pronouns replaced by speakers) and their annotated and crossover triples
+    annotations = [resolve_pronouns(ann) for ann in load_annotations(annotation_path)]
+    token_seqs = [[t for turn in ann['tokens'] for t in turn + [original[0]._sep]] for ann in annotations]
+    candidates = [(i, triple) for i, ann in enumerate(annotations) for triple in extract_triples(ann, weights=True)[1]]
+
+    with torch.no_grad():
+        args_original = original[0].predict_batch(token_seqs, full=True)
+        args_shared = shared[0].predict_batch(token_seqs, full=True)
+        y_original = original[1].predict_many(token_seqs, candidates)
+        y_shared = shared[1].predict_many(token_seqs, candidates)
+
+    # BIO label probabilities of subjects, predicates and objects of each subword
+    arg_diff, arg_same, arg_total = 0.0, 0, 0
+    for x, y in zip(args_original, args_shared):
+        for probs_x, probs_y in zip(x[:3], y[:3]):
+            if probs_x.size:
+                arg_diff = max(arg_diff, float(np.max(np.abs(probs_x - probs_y))))
+                arg_same += int(np.sum(np.argmax(probs_x, axis=0) == np.argmax(probs_y, axis=0)))
+                arg_total += probs_x.shape[1]
+    arg_agreement = arg_same / arg_total if arg_total else 1.0
+
+    score_diff = float(np.max(np.abs(y_original - y_shared))) if candidates else 0.0
+    score_agreement = float(np.mean(np.argmax(y_original, axis=1) == np.argmax(y_shared, axis=1))) if candidates else 1.0
+
+    print('argument extraction: max abs difference = %.4f, label agreement = %.4f' % (arg_diff, arg_agreement))
+    print('triple scoring:      max abs difference = %.4f, label agreement = %.4f' % (score_diff, score_agreement))
+    return arg_diff, arg_agreement, score_diff, score_agreement
+
+
+def convert_checkpoints(extraction_path, scoring_path, out_path, base_model='albert-base-v2', rank=None,
+                        annotation_path=None, atol=0.05):
+    """ Converts the separate ArgumentExtraction and TripleScoring checkpoints into a single
+        checkpoint with one shared backbone, adapters for triple scoring and both sets of heads.
+        Low-rank adapters approximate triple scoring (see SharedAlbert), so a rank is only accepted
+        if the scores on held-out annotations are within atol of those of the original checkpoints
+        (see check_backbone); otherwise a ValueError is raised and nothing is written.
+
+        params:
+        str extraction_path:    path to argument extraction checkpoint (.zip)
+        str scoring_path:       path to triple scoring checkpoint (.zip)
+        str out_path:           path to write the unified checkpoint to
+        str base_model:         Transformer architecture to use (default: albert-base-v2)
+        int rank:               rank of the adapters, or None for exact full-rank adapters (default: None)
+        str annotation_path:    directory containing held-out annotations to check the conversion on
+                                (required if rank is given)
+        float atol:             maximum absolute difference in probabilities and scores that is tolerated
+                                (default: 0.05)
+
+        returns:    result of check_backbone if annotation_path is given
+    """
+    if rank is not None and annotation_path is None:
+        raise ValueError('low-rank adapters approximate triple scoring; give annotation_path to check rank %s' % rank)
+
+    extraction_state = torch.load(extraction_path, map_location='cpu')
+    scoring_state = torch.load(scoring_path, map_location='cpu')
+
+    backbone = SharedAlbert(base_model, rank=rank)
+    backbone.load_encoders(extraction_state, scoring_state)
+
+    result = None
+    if annotation_path is not None:
+        result = check_backbone(backbone, extraction_state, scoring_state, annotation_path, base_model)
+        if max(result[0], result[2]) > atol:
+            raise ValueError('shared backbone of rank %s differs by %.4f from the original checkpoints (atol=%s)'
+                             % (rank, max(result[0], result[2]), atol))
+
+    torch.save({'rank': rank,
+                'config': backbone.model.config.to_json_string(),
+                'backbone': backbone.model.state_dict(),
+                'argument_extraction': SharedAlbert.heads(extraction_state),
+                'triple_scoring': SharedAlbert.heads(scoring_state)}, out_path)
+    print('saved unified checkpoint to %s' % out_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convert argument extraction and triple scoring '
+                                                 'checkpoints into a single shared-backbone checkpoint')
+    parser.add_argument('extraction_path', help='argument_extraction_albert-base-v2.zip')
+    parser.add_argument('scoring_path', help='candidate_scorer_albert-base-v2.zip')
+    parser.add_argument('out_path', help='path of the unified checkpoint')
+    parser.add_argument('--base_model', default='albert-base-v2')
+    parser.add_argument('--rank', type=int, default=None, help='rank of the adapters (default: exact, full rank)')
+    parser.add_argument('--annotation_path', help='held-out annotations to check the conversion on')
+    parser.add_argument('--atol', type=float, default=0.05, help='maximum tolerated difference in scores')
+    args = parser.parse_args()
+
+    convert_checkpoints(args.extraction_path, args.scoring_path, args.out_path, args.base_model, args.rank,
+                        args.annotation_path, args.atol)
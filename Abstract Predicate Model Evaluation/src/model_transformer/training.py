@@ -0,0 +1,141 @@
+import random
+import numpy as np
+import torch
+from torch.utils.data import Dataset, Sampler
+
+from src.model_transformer.post_processing import LRUCache
+
+
+# Label of padding, ignored by the loss
+IGNORE_INDEX = -100
+
+
+class BucketBatchSampler(Sampler):
+    def __init__(self, lengths, batch_size=8, bucket_size=50, shuffle=True, weights=None):
+        """ Samples batches of examples of similar length, so that little computation is spent on
+            padding: examples are shuffled, split into buckets of bucket_size batches, sorted by length
+            within each bucket and batched, after which the order of the batches is shuffled.
+
+            If weights are given, each epoch instead draws len(lengths) examples with replacement with
+            probability proportional to their weight, so that an example of weight k is seen as often
+            (in expectation) as k copies of it would be.
+
+        :param lengths:     length of each example
+        :param batch_size:  number of examples per batch (default: 8)
+        :param bucket_size: number of batches per bucket (default: 50)
+        :param shuffle:     whether to shuffle examples and batches every epoch (default: True)
+        :param weights:     sampling weight of each example (optional)
+        """
+        self._lengths = list(lengths)
+        self._batch_size = batch_size
+        self._bucket_size = bucket_size
+        self._shuffle = shuffle
+        self._weights = list(weights) if weights is not None else None
+
+    def __iter__(self):
+        indices = list(range(len(self._lengths)))
+        if self._weights is not None:
+            indices = random.choices(indices, weights=self._weights, k=len(indices))
+        elif self._shuffle:
+            random.shuffle(indices)
+
+        batches = []
+        step = self._batch_size * self._bucket_size
+        for i in range(0, len(indices), step):
+            bucket = sorted(indices[i:i + step], key=lambda j: self._lengths[j])
+            batches += [bucket[j:j + self._batch_size] for j in range(0, len(bucket), self._batch_size)]
+
+        if self._shuffle:
+            random.shuffle(batches)
+        return iter(batches)
+
+    def __len__(self):
+        return (len(self._lengths) + self._batch_size - 1) // self._batch_size
+
+
+def collate_padded(batch, pad_values, max_len=None):
+    """ Collates examples of NumPy arrays into a batch of tensors. Arrays are padded along their
+        last axis to the longest example in the batch (scalars, e.g. labels or weights, are stacked).
+        Fields of the examples beyond those in pad_values are left out.
+
+    :param batch:      list of examples, each a tuple of arrays (sequences have the subwords on the last axis)
+    :param pad_values: value to pad each field with
+    :param max_len:    length at which to cut off longer sequences (optional)
+    :return:           list with a LongTensor (FloatTensor for float scalars) for each field and the
+                       attention mask of the first field
+    """
+    lengths = [np.shape(example[0])[-1] for example in batch]
+    if max_len is not None:
+        lengths = [min(n, max_len) for n in lengths]
+    max_len = max(lengths)
+
+    fields = []
+    for k, pad_value in enumerate(pad_values):
+        arrays = [np.asarray(example[k]) for example in batch]
+        if arrays[0].ndim == 0:
+            stacked = np.stack(arrays)
+            dtype = np.float32 if np.issubdtype(stacked.dtype, np.floating) else np.int64
+            fields.append(torch.from_numpy(stacked.astype(dtype)))
+            continue
+
+        padded = np.full((len(arrays),) + arrays[0].shape[:-1] + (max_len,), pad_value, dtype=np.int64)
+        for i, (array, n) in enumerate(zip(arrays, lengths)):
+            padded[i, ..., :n] = array[..., :n]
+        fields.append(torch.from_numpy(padded))
+
+    attn_mask = np.zeros((len(batch), max_len), dtype=np.float32)
+    for i, n in enumerate(lengths):
+        attn_mask[i, :n] = 1
+    return fields + [torch.from_numpy(attn_mask)]
+
+
+class CandidateDataset(Dataset):
+    def __init__(self, scorer, tokens, triples, labels, cache_size=1024, weights=None):
+        """ Lazily encodes (dialogue, triple) candidates for training triple scoring: only the index of
+            each candidate is kept, and dialogues are re-tokenized on demand and kept in an LRU cache of
+            cache_size dialogues, so memory does not grow with the (oversampled) number of candidates.
+
+        :param scorer:     TripleScoring model whose tokenizer is used
+        :param tokens:     token sequences of the dialogues
+        :param triples:    list of triples of each dialogue
+        :param labels:     list of labels of the triples of each dialogue
+        :param cache_size: maximum number of re-tokenized dialogues to keep (default: 1024)
+        :param weights:    list of weights of the triples of each dialogue (see extract_triples), returned
+                           with each candidate as float (optional)
+        """
+        self._scorer = scorer
+        self._tokens = tokens
+        self._triples = triples
+        self._labels = labels
+        self._weights = weights
+        self._dialogs = LRUCache(cache_size)
+
+        self._index = [(i, j) for i, triple_lst in enumerate(triples) for j in range(len(triple_lst))]
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def weights(self):
+        """ Weight of each candidate (None if no weights were given) """
+        if self._weights is None:
+            return None
+        return [self._weights[i][j] for i, j in self._index]
+
+    @property
+    def lengths(self):
+        """ Approximate length of each candidate in words (to bucket candidates, see BucketBatchSampler) """
+        return [len(self._tokens[i]) + len(' '.join(self._triples[i][j]).split()) for i, j in self._index]
+
+    def __getitem__(self, k):
+        i, j = self._index[k]
+        dialog = self._dialogs.get(i)
+        if dialog is None:
+            dialog = self._scorer._retokenize_dialogue(self._tokens[i])
+            self._dialogs.put(i, dialog)
+
+        input_ids, speakers = self._scorer._encode_training_candidate(*dialog, self._triples[i][j])
+        example = np.array(input_ids, dtype=np.int64), np.array(speakers, dtype=np.int64), self._labels[i][j]
+        if self._weights is not None:
+            example += (float(self._weights[i][j]),)
+        return example
@@ -0,0 +1,299 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import random
+import shutil
+import numpy as np
+from torch.utils.data import Dataset
+
+from src.model_transformer.utils import load_annotations, triples_to_bio_tags, extract_triples, pronoun_to_speaker_id, \
+    get_predicate_tokens, UNKNOWN_PREDICATE_POLICIES
+from src.model_transformer.predicate_index import PredicateIndex
+
+
+CACHE_VERSION = '1'
+
+
+def tokenizer_fingerprint(tokenizer):
+    """ Computes a hash of a tokenizer (vocabulary, added tokens and special tokens), so that cached
+        subword IDs are not used with a different tokenizer.
+
+        params:
+        tokenizer:  HuggingFace tokenizer
+
+        returns:    hex digest
+    """
+    if tokenizer.is_fast:
+        data = tokenizer.backend_tokenizer.to_str()
+    else:
+        data = json.dumps(sorted(tokenizer.get_vocab().items()))
+    data += json.dumps(tokenizer.special_tokens_map, sort_keys=True)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def cache_key(annotation_path, conversion_dict_path, tokenizers, params=None):
+    """ Computes the key of a training cache from the contents of the annotation files and the
+        conversion dict, the tokenizers and the parameters of preprocessing.
+
+        params:
+        str annotation_path:        directory containing annotations (see load_annotations)
+        str conversion_dict_path:   conversion dict (.json) or compiled PredicateIndex (.npz)
+        list tokenizers:            tokenizers of argument extraction and triple scoring
+        dict params:                other settings that change the cache, e.g. the seed (optional)
+
+        returns:    hex digest
+    """
+    key = hashlib.sha1(CACHE_VERSION.encode('utf-8'))
+    for fname in sorted(glob.glob(annotation_path + '/*.json')):
+        key.update(os.path.basename(fname).encode('utf-8'))
+        with open(fname, 'rb') as file:
+            key.update(file.read())
+
+    with open(conversion_dict_path, 'rb') as file:
+        key.update(file.read())
+
+    for tokenizer in tokenizers:
+        key.update(tokenizer_fingerprint(tokenizer).encode('utf-8'))
+    key.update(json.dumps(sorted((params or dict()).items())).encode('utf-8'))
+    return key.hexdigest()
+
+
+def resolve_pronouns(annotation):
+    """ Replaces the personal pronouns in the turns of an annotation by SPEAKER1 and SPEAKER2 (as
+        AlbertTripleExtractor does at inference time). Token positions are unchanged.
+    """
+    annotation = dict(annotation)
+    annotation['tokens'] = [[pronoun_to_speaker_id(t, i) for t in turn] for i, turn in enumerate(annotation['tokens'])]
+    return annotation
+
+
+class RaggedDataset(Dataset):
+    def __init__(self, sequences, offsets, labels=None, weights=None, num_labels=None):
+        """ Examples stored as concatenated arrays (e.g. memory-mapped) with an offsets index: example
+            k spans offsets[k]:offsets[k + 1] along the last axis of each array in sequences.
+
+            params:
+            list sequences:     arrays with the subwords of all examples on the last axis
+            ndarray offsets:    start of each example (and the end of the last one)
+            ndarray labels:     label of each example, returned after the sequences (optional)
+            ndarray weights:    weight of each example, returned after the label (optional)
+            int num_labels:     number of BIO labels of the label sequences, checked by ArgumentExtraction.fit
+                                (optional)
+        """
+        self.num_labels = num_labels
+        self._sequences = sequences
+        self._offsets = offsets
+        self._labels = labels
+        self._weights = weights
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    @property
+    def lengths(self):
+        return np.diff(self._offsets).tolist()
+
+    @property
+    def weights(self):
+        return self._weights.tolist() if self._weights is not None else None
+
+    def __getitem__(self, k):
+        start, end = self._offsets[k], self._offsets[k + 1]
+        example = tuple(np.array(array[..., start:end], dtype=np.int64) for array in self._sequences)
+        if self._labels is not None:
+            example += (int(self._labels[k]),)
+        if self._weights is not None:
+            example += (float(self._weights[k]),)
+        return example
+
+
+class TrainingCache:
+    def __init__(self, path, tokenizer=None, num_labels=None):
+        """ Loads a training cache written by build_training_cache. Arrays are memory-mapped, so
+            loading takes milliseconds and examples are read from disk on demand.
+
+            params:
+            str path:   directory of the cache
+            tokenizer:  tokenizer of the model to train; raises a ValueError if the cache was built with
+                        another tokenizer (optional)
+            int num_labels: number of BIO labels of the model to train; raises a ValueError if the cache was
+                            built for another level (optional)
+
+            attributes:
+            RaggedDataset arguments:    (input_ids, speaker_ids, labels) of each dialogue (see ArgumentExtraction.fit)
+            RaggedDataset candidates:   (input_ids, speaker_ids, label, weight) of each candidate (see TripleScoring.fit)
+        """
+        with open(os.path.join(path, 'metadata.json'), 'r', encoding='utf-8') as file:
+            self.metadata = json.load(file)
+
+        if tokenizer is not None and tokenizer_fingerprint(tokenizer) not in self.metadata['tokenizers']:
+            raise ValueError('training cache %s was built with another tokenizer' % path)
+
+        if num_labels is not None and num_labels != self.metadata['num_labels']:
+            raise ValueError('training cache %s has %s BIO labels, not %s' % (path, self.metadata['num_labels'],
+                                                                            num_labels))
+
+        def load(name):
+            return np.load(os.path.join(path, name + '.npy'), mmap_mode='r')
+
+        self.arguments = RaggedDataset([load('arguments_input_ids'), load('arguments_speaker_ids'),
+                                        load('arguments_labels')], load('arguments_offsets'),
+                                       num_labels=self.metadata['num_labels'])
+        self.candidates = RaggedDataset([load('candidates_input_ids'), load('candidates_speaker_ids')],
+                                        load('candidates_offsets'), load('candidates_labels'),
+                                        load('candidates_weights'))
+
+
+def _save_ragged(path, name, arrays, dtype, axis_shape=()):
+    """ Saves arrays (with the subwords on the last axis) concatenated, and returns their offsets.
+    """
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([np.shape(array)[-1] for array in arrays])
+
+    data = np.empty(axis_shape + (offsets[-1],), dtype=dtype)
+    for array, start, end in zip(arrays, offsets[:-1], offsets[1:]):
+        data[..., start:end] = array
+    np.save(os.path.join(path, name + '.npy'), data)
+    return offsets
+
+
+def build_training_cache(annotation_path, conversion_dict_path, extractor, scorer, cache_dir='training_cache',
+                         seed=0, unknown_predicate='skip'):
+    """ Preprocesses annotations for training once: pronouns are resolved, BIO labels are created and
+        aligned with the subwords of argument extraction, and the candidates of triple scoring (with
+        negatives sampled from seed) are tokenized. The result is written as NumPy arrays with an
+        offsets index to cache_dir/<key> (see cache_key); if that cache exists, it is loaded instead.
+
+        params:
+        str annotation_path:        directory containing annotations (see load_annotations)
+        str conversion_dict_path:   conversion dict (.json) or compiled PredicateIndex (.npz)
+        ArgumentExtraction extractor:   model whose tokenizer aligns the BIO labels
+        TripleScoring scorer:           model whose tokenizer and max_len encode the candidates
+        str cache_dir:              directory holding the caches (default: training_cache)
+        int seed:                   seed of the sampled negative triples (default: 0)
+        unknown_predicate:          how to label predicate spans without abstract predicate: 'skip' (O),
+                                    'error' or a (B-tag, I-tag) tuple (see UNKNOWN_PREDICATE_POLICIES,
+                                    default: skip)
+
+        returns:    TrainingCache
+    """
+    if unknown_predicate not in UNKNOWN_PREDICATE_POLICIES and not isinstance(unknown_predicate, tuple):
+        raise ValueError('unknown_predicate must be one of %s or a (B-tag, I-tag) tuple' % UNKNOWN_PREDICATE_POLICIES)
+
+    index = PredicateIndex.from_file(conversion_dict_path)
+    if extractor._subj_head.out_features != index.num_labels:
+        raise ValueError('%s has %s BIO labels, but the extractor %s' % (conversion_dict_path, index.num_labels,
+                                                                        extractor._subj_head.out_features))
+
+    tokenizers = [extractor._tokenizer, scorer._tokenizer]
+    params = {'seed': seed, 'sep': extractor._sep, 'max_len': scorer._max_len, 'overflow': scorer._overflow,
+              'unknown_predicate': unknown_predicate}
+    key = cache_key(annotation_path, conversion_dict_path, tokenizers, params)
+    path = os.path.join(cache_dir, key)
+    if os.path.exists(os.path.join(path, 'metadata.json')):
+        return TrainingCache(path)
+
+    annotations = [resolve_pronouns(ann) for ann in load_annotations(annotation_path)]
+    tokens = [[t for turn in ann['tokens'] for t in turn + [extractor._sep]] for ann in annotations]
+
+    # Report predicate spans which have no abstract predicate (e.g. after pronoun resolution)
+    unknown = []
+    for ann in annotations:
+        for triple in ann['annotations']:
+            pred = get_predicate_tokens(ann, triple)
+            if pred is not None and pred not in index:
+                unknown.append(pred)
+    if unknown:
+        print('%s predicate spans without abstract predicate (%s): %s' % (len(unknown), unknown_predicate,
+                                                                          sorted(set(unknown))))
+
+    # Argument extraction: subwords and speakers of each dialogue with the BIO labels of each argument
+    arg_input_ids, arg_speaker_ids, arg_labels = [], [], []
+    for ann, (input_ids, speaker_ids, repeats) in zip(annotations, extractor._retokenize_batch(tokens)):
+        labels = [extractor._repeat_labels(arg_labels, repeats) for arg_labels in
+                  triples_to_bio_tags(ann, index, unknown_predicate)]
+        arg_input_ids.append(input_ids)
+        arg_speaker_ids.append(speaker_ids)
+        arg_labels.append(np.stack(labels))
+
+    # Triple scoring: each candidate (dialogue + [UNK] + triple) once, with its label and weight
+    cand_input_ids, cand_speaker_ids, cand_labels, cand_weights = [], [], [], []
+    state = random.getstate()
+    random.seed(seed)
+    for ann, seq in zip(annotations, tokens):
+        _, triples, labels, weights = extract_triples(ann, weights=True)
+        if not triples:
+            continue
+
+        dialog = scorer._retokenize_dialogue(seq)
+        for triple in triples:
+            input_ids, speaker_ids = scorer._encode_training_candidate(*dialog, triple)
+            cand_input_ids.append(input_ids)
+            cand_speaker_ids.append(speaker_ids)
+        cand_labels += labels
+        cand_weights += weights
+    random.setstate(state)
+
+    # Write to a temporary directory first, so that an interrupted run leaves no partial cache
+    tmp_path = path + '.tmp'
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    _save_ragged(tmp_path, 'arguments_input_ids', arg_input_ids, np.int32)
+    _save_ragged(tmp_path, 'arguments_speaker_ids', arg_speaker_ids, np.int8)
+    offsets = _save_ragged(tmp_path, 'arguments_labels', arg_labels, np.int16, axis_shape=(3,))
+    np.save(os.path.join(tmp_path, 'arguments_offsets.npy'), offsets)
+
+    _save_ragged(tmp_path, 'candidates_input_ids', cand_input_ids, np.int32)
+    offsets = _save_ragged(tmp_path, 'candidates_speaker_ids', cand_speaker_ids, np.int8)
+    np.save(os.path.join(tmp_path, 'candidates_offsets.npy'), offsets)
+    np.save(os.path.join(tmp_path, 'candidates_labels.npy'), np.array(cand_labels, dtype=np.int8))
+    np.save(os.path.join(tmp_path, 'candidates_weights.npy'), np.array(cand_weights, dtype=np.float32))
+
+    metadata = {'version': CACHE_VERSION,
+                'key': key,
+                'annotation_path': annotation_path,
+                'conversion_dict': conversion_dict_path,
+                'tokenizers': [tokenizer_fingerprint(tokenizer) for tokenizer in tokenizers],
+                'params': params,
+                'num_labels': index.num_labels,
+                'num_dialogs': len(annotations),
+                'num_candidates': len(cand_labels)}
+    with open(os.path.join(tmp_path, 'metadata.json'), 'w', encoding='utf-8') as file:
+        json.dump(metadata, file, indent=1)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+    return TrainingCache(path)
+
+
+if __name__ == '__main__':
+    from src.model_transformer.argument_extraction import ArgumentExtraction
+    from src.model_transformer.triple_scoring import TripleScoring
+
+    parser = argparse.ArgumentParser(description='Pre-tokenize annotations into a training cache')
+    parser.add_argument('--annotations', required=True, help='directory containing the annotations')
+    parser.add_argument('--level', default=1, type=int, choices=[1, 2], help='level of abstract predicates')
+    parser.add_argument('--conversion_dict', default=None, help='conversion dict (default: that of level)')
+    parser.add_argument('--cache_dir', default='training_cache', help='directory holding the caches')
+    parser.add_argument('--seed', default=0, type=int, help='seed of the sampled negative triples')
+    parser.add_argument('--unknown_predicate', default='skip', help='how to label predicate spans without abstract '
+                                                                    'predicate: skip, error or B-tag,I-tag')
+    args = parser.parse_args()
+
+    unknown_predicate = args.unknown_predicate
+    if unknown_predicate not in UNKNOWN_PREDICATE_POLICIES:
+        unknown_predicate = tuple(int(tag) for tag in unknown_predicate.split(','))
+
+    conversion_dict = args.conversion_dict
+    if conversion_dict is None:
+        conversion_dict = '../Argument Extraction/conversion_dict_level%s.json' % args.level
+
+    index = PredicateIndex.from_file(conversion_dict)
+    cache = build_training_cache(args.annotations, conversion_dict, ArgumentExtraction(num_labels=index.num_labels),
+                                 TripleScoring(), args.cache_dir, args.seed, unknown_predicate)
+    print('cached %s dialogues and %s candidates in %s' % (cache.metadata['num_dialogs'],
+                                                          cache.metadata['num_candidates'],
+                                                          os.path.join(args.cache_dir, cache.metadata['key'])))
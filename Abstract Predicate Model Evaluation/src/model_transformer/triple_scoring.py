@@ -1,5 +1,8 @@
 import glob
+import time
 import torch
+from functools import partial
+from torch.utils.data import DataLoader
 from transformers import AutoTokenizer, AutoModel, AutoConfig
 from tqdm import tqdm
 from pathlib import Path
@@ -9,26 +12,59 @@ from transformers import logging
 logging.set_verbosity(40)
 
 from src.model_transformer.utils import *
+from src.model_transformer.prefix_cache import encode_prefix, encode_suffix
+from src.model_transformer.shared_backbone import set_adapter
+from src.model_transformer.windowing import find_last, argument_window
+from src.model_transformer.training import BucketBatchSampler, CandidateDataset, collate_padded
+
+
+# Ways to handle candidates (dialogue + [UNK] + triple) longer than max_len
+OVERFLOW_POLICIES = ['truncate',           # cut off the end (may cut off the triple)
+                     'truncate_dialogue',  # drop the oldest dialogue subwords, keeping the triple
+                     'window',             # keep the window of the dialogue holding the arguments of the triple
+                     'error']              # raise a ValueError
+
+# Ways to rebalance classes with triple weights (see extract_triples) when fitting
+BALANCE_MODES = ['sampler',  # draw triples proportional to their weight (same expected gradient as copies)
+                 'loss']     # see every triple once per epoch with its weight on the loss
 
 
 class TripleScoring(torch.nn.Module):
-    def __init__(self, base_model='albert-base-v2', path=None, max_len=80, sep='<eos>'):
+    def __init__(self, base_model='albert-base-v2', path=None, max_len=80, sep='<eos>', backbone=None,
+                 overflow='truncate', model=None, tokenizer=None, model_path=None):
         super().__init__()
-        # Base model
-        print('loading %s for triple scoring' % base_model)
-        # Load base model
-        self._model = AutoModel.from_pretrained(base_model)
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('overflow must be one of %s' % OVERFLOW_POLICIES)
+
         self._max_len = max_len
+        self._overflow = overflow
         self._base = base_model
         self._sep = sep
-
-        # Load and extend tokenizer with SPEAKERS
-        self._tokenizer = AutoTokenizer.from_pretrained(base_model)
-        self._tokenizer.add_tokens(['SPEAKER1', 'SPEAKER2'], special_tokens=True)
-        self._model.resize_token_embeddings(len(self._tokenizer))
+        self._shared = backbone is not None
+
+        if model is not None:
+            # Encoder and tokenizer loaded elsewhere (see bundle.load_bundle)
+            self._model = model
+            self._tokenizer = tokenizer
+        elif backbone is None:
+            # Base model
+            print('loading %s for triple scoring' % base_model)
+            # Load base model
+            self._model = AutoModel.from_pretrained(base_model)
+
+            # Load and extend tokenizer with SPEAKERS (unless shared with other modules)
+            self._tokenizer = tokenizer
+            if tokenizer is None:
+                self._tokenizer = AutoTokenizer.from_pretrained(base_model)
+                self._tokenizer.add_tokens(['SPEAKER1', 'SPEAKER2'], special_tokens=True)
+            self._model.resize_token_embeddings(len(self._tokenizer))
+        else:
+            # Share encoder and tokenizer with argument extraction (see SharedAlbert)
+            self._model = backbone.model
+            self._tokenizer = backbone.tokenizer
 
         # SPO candidate scoring head
-        hidden_size = AutoConfig.from_pretrained(base_model).hidden_size
+        hidden_size = self._model.config.hidden_size
         self._head = torch.nn.Linear(hidden_size, 3)
         self._relu = torch.nn.ReLU()
         self._softmax = torch.nn.Softmax(dim=-1)
@@ -37,20 +73,33 @@ class TripleScoring(torch.nn.Module):
         self._device = torch.device('cuda') if torch.cuda.is_available() else torch.device('cpu')
         self.to(self._device)
 
-        # Load model / tokenizer if pretrained model is given
-        if path:
+        # Load model / tokenizer if pretrained model is given (heads of a shared backbone are loaded separately)
+        self._model_path = None
+        if (path or model_path) and not self._shared:
             print('\t- Loading pretrained')
             # model_path = glob.glob(path + '/candidate_scorer_' + base_model + '.zip')[0]
             # model_path = Path("src/model_transformer/models/2022-04-27/candidate_scorer_albert-base-v2.zip")
-            model_path = Path("src/model_transformer/models/TripleCandidateScorerLevel1/candidate_scorer_albert-base-v2.zip")
-            # model_path = Path("src/model_transformer/models/TripleCandidateScorerLevel2/candidate_scorer_albert-base-v2.zip")
+            if model_path is None:
+                model_path = Path("src/model_transformer/models/TripleCandidateScorerLevel1/candidate_scorer_albert-base-v2.zip")
             self.load_state_dict(torch.load(model_path, map_location=self._device))
+            self._model_path = model_path
 
     def forward(self, input_ids, speaker_ids, attn_mask):
         """ Computes the forward pass through the model
         """
+        self._use_adapter()
         out = self._model(input_ids=input_ids, token_type_ids=speaker_ids, attention_mask=attn_mask)
-        h = self._relu(out.last_hidden_state[:, 0])
+        return self._score(out.last_hidden_state)
+
+    def _use_adapter(self):
+        # A shared backbone runs triple scoring with its adapters switched on
+        if self._shared:
+            set_adapter(self._model, True)
+
+    def _score(self, hidden_state):
+        """ Computes entailment scores from the hidden state of the [CLS] token
+        """
+        h = self._relu(hidden_state[:, 0])
         return self._softmax(self._head(h))
 
     def _retokenize_dialogue(self, tokens, speaker=1):
@@ -71,6 +120,24 @@ class TripleScoring(torch.nn.Module):
         speaker_ids = [0] * len(f_input_ids)
         return f_input_ids, speaker_ids
 
+    def _truncate(self, input_ids, speakers, triple_len):
+        """ Applies the overflow policy to a dialogue + [UNK] + triple sequence longer than max_len
+        """
+        overflow = len(input_ids) - self._max_len
+        if overflow <= 0:
+            return input_ids, speakers
+
+        if self._overflow == 'error':
+            raise ValueError('candidate of %s subwords exceeds max_len=%s' % (len(input_ids), self._max_len))
+
+        # Drop the oldest dialogue subwords (after [CLS]), keeping [UNK] and the triple intact
+        dialog_len = len(input_ids) - triple_len - 2
+        if self._overflow in ['truncate_dialogue', 'window'] and overflow <= dialog_len:
+            return input_ids[:1] + input_ids[1 + overflow:], speakers[:1] + speakers[1 + overflow:]
+
+        # Otherwise (or if the triple does not fit by itself) cut off the end
+        return input_ids[:self._max_len], speakers[:self._max_len]
+
     def _add_padding(self, sequence, pad_token):
         # If sequence is too long, cut off end
         sequence = sequence[:self._max_len]
@@ -83,106 +150,322 @@ class TripleScoring(torch.nn.Module):
         attn_mask = [1] * len(sequence) + [0] * padding
         return new_sequence, attn_mask
 
-    def fit(self, tokens, triples, labels, epochs=2, lr=1e-6):
-        """ Fits the model to the annotations
+    def _encode_training_candidate(self, dialog_input_ids, dialog_speakers, triple):
+        """ Tokenizes a candidate for training: dialogue (without its last separator) + [UNK] + triple
         """
-        X = []
-        for tokens, triple_lst, triple_labels in zip(tokens, triples, labels):
-
-            # Tokenize dialogue
-            dialog_input_ids, dialog_speakers = self._retokenize_dialogue(tokens)
-
-            for triple, label in zip(triple_lst, triple_labels):
-                # Tokenize triple
-                triple_input_ids, triple_speakers = self._retokenize_triple(triple)
-
-                # Concatenate dialogue + [UNK] + triple
-                input_ids = dialog_input_ids[:-1] + [self._tokenizer.unk_token_id] + triple_input_ids
-                speakers = dialog_speakers[:-1] + [0] + triple_speakers
-
-                # Pad sequence with [PAD] to max_len
-                input_ids, _ = self._add_padding(input_ids, self._tokenizer.pad_token_id)
-                speakers, attn_mask = self._add_padding(speakers, 0)
+        triple_input_ids, triple_speakers = self._retokenize_triple(triple)
+
+        # Concatenate dialogue + [UNK] + triple
+        input_ids = dialog_input_ids[:-1] + [self._tokenizer.unk_token_id] + triple_input_ids
+        speakers = dialog_speakers[:-1] + [0] + triple_speakers
+        input_ids, speakers = self._truncate(input_ids, speakers, len(triple_input_ids))
+        return input_ids[:self._max_len], speakers[:self._max_len]
+
+    def fit(self, tokens=None, triples=None, labels=None, epochs=2, lr=1e-6, batch_size=16, cache_size=1024,
+            num_workers=0, weights=None, balance='sampler', dataset=None):
+        """ Fits the model to the annotations. Candidates are encoded on demand (see CandidateDataset)
+            and trained on in mini-batches padded to the longest candidate in the batch. Instead of
+            repeating triples to counter class imbalance, they can be given weights (see extract_triples).
+
+        :param tokens:      token sequences of the dialogues
+        :param triples:     list of triples of each dialogue
+        :param labels:      list of labels of the triples of each dialogue
+        :param epochs:      number of passes over the data (default: 2)
+        :param lr:          learning rate (default: 1e-6)
+        :param batch_size:  number of candidates per mini-batch (default: 16)
+        :param cache_size:  number of re-tokenized dialogues to keep in memory (default: 1024)
+        :param num_workers: number of worker processes encoding candidates (default: 0, i.e. in the main process)
+        :param weights:     list of weights of the triples of each dialogue (optional)
+        :param balance:     how to apply the weights (see BALANCE_MODES, default: sampler)
+        :param dataset:     pre-tokenized (input_ids, speaker_ids, label, weight) candidates to use instead of
+                            tokens, triples, labels and weights, e.g. TrainingCache.candidates (optional)
+        """
+        if balance not in BALANCE_MODES:
+            raise ValueError('balance must be one of %s' % BALANCE_MODES)
 
-                # Push Tensor to GPU
-                input_ids = torch.LongTensor([input_ids]).to(self._device)
-                speakers = torch.LongTensor([speakers]).to(self._device)
-                attn_mask = torch.FloatTensor([attn_mask]).to(self._device)
-                label_ids = torch.LongTensor([label]).to(self._device)
+        if dataset is None:
+            dataset = CandidateDataset(self, tokens, triples, labels, cache_size, weights)
+        weights = dataset.weights
+        use_loss_weights = weights is not None and balance == 'loss'
 
-                X.append((input_ids, speakers, attn_mask, label_ids))
+        # Batch candidates of similar length (keeping candidates of the same dialogue together)
+        sampler = BucketBatchSampler(dataset.lengths, batch_size, weights=None if use_loss_weights else weights)
+        pad_values = (self._tokenizer.pad_token_id, 0, None) + ((None,) if use_loss_weights else ())
+        collate = partial(collate_padded, pad_values=pad_values)
+        loader = DataLoader(dataset, batch_sampler=sampler, collate_fn=collate, num_workers=num_workers)
 
         # Set up optimizer and objective
         optimizer = torch.optim.Adam(self.parameters(), lr=lr)
-        criterion = torch.nn.CrossEntropyLoss()
+        criterion = torch.nn.CrossEntropyLoss(reduction='none')
 
         for epoch in range(epochs):
-            random.shuffle(X)
-
             losses = []
-            for input_ids, speaker_ids, attn_mask, y in tqdm(X):
+            start = time.perf_counter()
+            for batch in tqdm(loader):
+                input_ids, speaker_ids, y, *w, attn_mask = [t.to(self._device) for t in batch]
+
                 # Was the triple entailed? Positively? Negatively?
                 y_hat = self(input_ids, speaker_ids, attn_mask)
                 loss = criterion(y_hat, y)
+                loss = (loss * w[0]).sum() / w[0].sum() if w else loss.mean()
                 losses.append(loss.item())
 
                 optimizer.zero_grad()
                 loss.backward()
                 optimizer.step()
 
-            print("mean loss =", np.mean(losses))
+            elapsed = time.perf_counter() - start
+            print("mean loss = %s (%.1f examples/s)" % (np.mean(losses), len(dataset) / elapsed))
 
         # Save model to file
         torch.save(self.state_dict(), 'candidate_scorer_%s' % self._base)
 
-    def predict(self, tokens, triples):
-        # Re-tokenize dialogue
-        dialog_input_ids, dialog_speakers = self._retokenize_dialogue(tokens)
+    def _window_dialogue(self, dialog_input_ids, dialog_speakers, triple, triple_len, positions):
+        """ Cuts the dialogue down to the window holding the arguments of the triple which fits in max_len
+            together with the triple (see windowing.argument_window).
+        """
+        size = self._max_len - triple_len - 1  # room for [UNK]
+        if len(dialog_input_ids) <= size or size < 2:
+            return dialog_input_ids, dialog_speakers
+
+        # Find the last mention of each argument in the dialogue (once per argument)
+        positions = positions if positions is not None else dict()
+        ids = np.asarray(dialog_input_ids)
+        spans = []
+        for arg in triple:
+            if arg not in positions:
+                arg_ids = self._tokenizer.encode(arg, add_special_tokens=False)
+                positions[arg] = find_last(ids, arg_ids), len(arg_ids)
+            start, arg_len = positions[arg]
+            if start > 0:
+                spans.append((start, start + arg_len))
+
+        turn_starts = np.flatnonzero(ids == self._tokenizer.sep_token_id) + 1
+        start, end = argument_window(turn_starts, len(ids), spans, size)
+        return dialog_input_ids[:1] + dialog_input_ids[start:end], dialog_speakers[:1] + dialog_speakers[start:end]
+
+    def _encode_candidate(self, dialog_input_ids, dialog_speakers, triple, positions=None):
+        # Tokenize triple
+        triple_input_ids, triple_speakers = self._retokenize_triple(triple)
+
+        # Select the part of a long dialogue which mentions the arguments
+        if self._overflow == 'window':
+            dialog_input_ids, dialog_speakers = self._window_dialogue(dialog_input_ids, dialog_speakers, triple,
+                                                                      len(triple_input_ids), positions)
+
+        # Concatenate dialogue tokens, [UNK] and triple
+        input_ids = dialog_input_ids + [self._tokenizer.unk_token_id] + triple_input_ids
+        speakers = dialog_speakers + [0] + triple_speakers
+        return self._truncate(input_ids, speakers, len(triple_input_ids))
+
+    def _encode_candidates(self, token_seqs, candidates):
+        """ Tokenizes candidates (without padding), re-tokenizing each dialogue only once
+        """
+        dialogs = dict()
+        rows = []
+        for dialog_id, triple in candidates:
+            if dialog_id not in dialogs:
+                dialogs[dialog_id] = self._retokenize_dialogue(token_seqs[dialog_id]) + (dict(),)
+            dialog_input_ids, dialog_speakers, positions = dialogs[dialog_id]
+            rows.append(self._encode_candidate(dialog_input_ids, dialog_speakers, triple, positions))
+        return rows
+
+    def _predict_rows(self, rows):
+        """ Pads a batch of tokenized candidates to the longest sequence in the batch and scores them
+        """
+        max_len = max([len(input_ids) for input_ids, _ in rows])
+
+        batch_input_ids = np.full((len(rows), max_len), self._tokenizer.pad_token_id, dtype=np.int64)
+        batch_speakers = np.zeros((len(rows), max_len), dtype=np.int64)
+        batch_attn_mask = np.zeros((len(rows), max_len), dtype=np.float32)
+        for i, (input_ids, speakers) in enumerate(rows):
+            # Pad sequence with [PAD] to longest sequence
+            batch_input_ids[i, :len(input_ids)] = input_ids
+            batch_speakers[i, :len(input_ids)] = speakers
+            batch_attn_mask[i, :len(input_ids)] = 1
+        return self._run(batch_input_ids, batch_speakers, batch_attn_mask)
+
+    def _run(self, input_ids, speaker_ids, attn_mask):
+        """ Runs the model on padded NumPy arrays, returning entailment scores on the host
+        """
+        # Push batches to GPU
+        input_ids = torch.from_numpy(input_ids).to(self._device)
+        speaker_ids = torch.from_numpy(speaker_ids).to(self._device)
+        attn_mask = torch.from_numpy(attn_mask).to(self._device)
 
-        batch_input_ids = []
-        batch_speakers = []
-        batch_attn_mask = []
+        label = self(input_ids, speaker_ids, attn_mask)
+        label = label.cpu().detach().numpy()
+        return label
 
-        for triple in triples:
-            # Tokenize triple
-            triple_input_ids, triple_speakers = self._retokenize_triple(triple)
+    def predict(self, tokens, triples):
+        return self.predict_batch([tokens], [(0, triple) for triple in triples])
+
+    def predict_batch(self, token_seqs, candidates, prefix_cache=False, prefixes=None):
+        """ Scores candidate triples drawn from one or more dialogues in a single
+            forward pass. Each dialogue is re-tokenized only once.
+
+        :param token_seqs:   list of token sequences (one for each dialogue)
+        :param candidates:   list of (dialogue index, triple) pairs
+        :param prefix_cache: whether to encode each dialogue once and only run the triples per
+                             candidate (approximate, see check_prefix_cache) (default: False)
+        :param prefixes:     dict to keep encoded dialogues in across calls (prefix_cache only)
+        :return:             ndarray of shape (len(candidates), 3) with entailment scores
+        """
+        if not candidates:
+            return np.zeros((0, 3), dtype=np.float32)
 
-            # Concatenate dialogue tokens, [UNK] and triple
-            input_ids = dialog_input_ids + [self._tokenizer.unk_token_id] + triple_input_ids
-            speakers = dialog_speakers + [0] + triple_speakers
+        if prefix_cache:
+            return self._predict_batch_cached(token_seqs, candidates, prefixes)
 
-            # Pad sequence with [PAD] to max_len
-            input_ids, _ = self._add_padding(input_ids, self._tokenizer.pad_token_id)
-            speakers, attn_mask = self._add_padding(speakers, 0)
+        return self._predict_rows(self._encode_candidates(token_seqs, candidates))
 
-            batch_input_ids.append(input_ids)
-            batch_speakers.append(speakers)
-            batch_attn_mask.append(attn_mask)
+    def predict_many(self, token_seqs, candidates, batch_size=32, prefix_cache=False):
+        """ Scores any number of candidate triples in batches of candidates of similar length,
+            so that little computation is spent on padding.
 
-        # Push batches to GPU
-        batch_input_ids = torch.LongTensor(batch_input_ids).to(self._device)
-        batch_speakers = torch.LongTensor(batch_speakers).to(self._device)
-        batch_attn_mask = torch.FloatTensor(batch_attn_mask).to(self._device)
+        :param token_seqs:   list of token sequences (one for each dialogue)
+        :param candidates:   list of (dialogue index, triple) pairs
+        :param batch_size:   number of candidates to score per forward pass
+        :param prefix_cache: whether to encode each dialogue once (see predict_batch) (default: False)
+        :return:             ndarray of shape (len(candidates), 3) with entailment scores
+        """
+        label = np.zeros((len(candidates), 3), dtype=np.float32)
+
+        if prefix_cache:
+            prefixes = dict()
+            for i in range(0, len(candidates), batch_size):
+                batch = candidates[i:i + batch_size]
+                label[i:i + batch_size] = self._predict_batch_cached(token_seqs, batch, prefixes)
+            return label
+
+        # Sort candidates by length and score them in buckets of similar length
+        rows = self._encode_candidates(token_seqs, candidates)
+        order = sorted(range(len(rows)), key=lambda i: len(rows[i][0]))
+        for i in range(0, len(order), batch_size):
+            bucket = order[i:i + batch_size]
+            label[bucket] = self._predict_rows([rows[j] for j in bucket])
+        return label
 
-        label = self(batch_input_ids, batch_speakers, batch_attn_mask)
-        label = label.cpu().detach().numpy()
+    def _encode_dialogue_prefix(self, dialog_input_ids, dialog_speakers):
+        """ Encodes the dialogue (without [CLS]) once as a prefix shared by all candidates.
+        """
+        self._use_adapter()
+
+        # Dialogue tokens occupy positions 1..n (or up to max_len) of each candidate
+        input_ids = dialog_input_ids[1:self._max_len]
+        speakers = dialog_speakers[1:self._max_len]
+        positions = list(range(1, len(input_ids) + 1))
+
+        input_ids = torch.LongTensor([input_ids]).to(self._device)
+        speakers = torch.LongTensor([speakers]).to(self._device)
+        positions = torch.LongTensor([positions]).to(self._device)
+        return encode_prefix(self._model, input_ids, speakers, positions)
+
+    def _predict_batch_cached(self, token_seqs, candidates, prefixes=None):
+        """ Scores candidate triples by running only [CLS] and the [UNK]-separated triple
+            of each candidate through the model, attending to the cached dialogue. Candidates
+            exceeding max_len are encoded in full unless the overflow policy is 'truncate'.
+        """
+        if prefixes is None:
+            prefixes = dict()
+
+        # Group candidates by dialogue
+        groups = defaultdict(list)
+        for i, (dialog_id, triple) in enumerate(candidates):
+            groups[dialog_id].append((i, triple))
+
+        label = np.zeros((len(candidates), 3), dtype=np.float32)
+        overflowing = []
+        for dialog_id, rows in groups.items():
+            # Encode dialogue once (or reuse from earlier batch)
+            if dialog_id not in prefixes:
+                dialog_input_ids, dialog_speakers = self._retokenize_dialogue(token_seqs[dialog_id])
+                cache = self._encode_dialogue_prefix(dialog_input_ids, dialog_speakers)
+                prefixes[dialog_id] = (dialog_input_ids, dialog_speakers, cache)
+            dialog_input_ids, dialog_speakers, cache = prefixes[dialog_id]
+            prefix_len = cache[0][0].shape[2]
+
+            batch_input_ids = []
+            batch_speakers = []
+            batch_positions = []
+            batch_rows = []
+            for i, triple in rows:
+                # Same concatenation as full re-encoding; as the dialogue prefix is shared, it can only be
+                # cut off at the end. Overflowing candidates under another overflow policy are therefore
+                # encoded in full below (which also rejects them with overflow='error')
+                triple_input_ids, triple_speakers = self._retokenize_triple(triple)
+                input_ids = dialog_input_ids + [self._tokenizer.unk_token_id] + triple_input_ids
+                speakers = dialog_speakers + [0] + triple_speakers
+                if len(input_ids) > self._max_len and self._overflow != 'truncate':
+                    overflowing.append(i)
+                    continue
+                input_ids, speakers = input_ids[:self._max_len], speakers[:self._max_len]
+                batch_rows.append(i)
+
+                # Keep [CLS] and everything following the dialogue prefix
+                batch_input_ids.append(input_ids[:1] + input_ids[1 + prefix_len:])
+                batch_speakers.append(speakers[:1] + speakers[1 + prefix_len:])
+                batch_positions.append([0] + list(range(1 + prefix_len, len(input_ids))))
+
+            if not batch_rows:
+                continue
+
+            # Pad suffixes to the longest suffix
+            max_len = max([len(ids) for ids in batch_input_ids])
+            batch_attn_mask = [[1] * len(ids) + [0] * (max_len - len(ids)) for ids in batch_input_ids]
+            batch_input_ids = [ids + [self._tokenizer.pad_token_id] * (max_len - len(ids)) for ids in batch_input_ids]
+            batch_speakers = [ids + [0] * (max_len - len(ids)) for ids in batch_speakers]
+            batch_positions = [ids + [0] * (max_len - len(ids)) for ids in batch_positions]
+
+            # Push batches to GPU
+            batch_input_ids = torch.LongTensor(batch_input_ids).to(self._device)
+            batch_speakers = torch.LongTensor(batch_speakers).to(self._device)
+            batch_positions = torch.LongTensor(batch_positions).to(self._device)
+            batch_attn_mask = torch.FloatTensor(batch_attn_mask).to(self._device)
+
+            self._use_adapter()
+            h = encode_suffix(self._model, cache, batch_input_ids, batch_speakers, batch_positions, batch_attn_mask)
+            y_hat = self._score(h).cpu().detach().numpy()
+            label[batch_rows] = y_hat
+
+        if overflowing:
+            label[overflowing] = self._predict_rows(self._encode_candidates(token_seqs,
+                                                                            [candidates[i] for i in overflowing]))
         return label
 
+    def check_prefix_cache(self, token_seqs, candidates, atol=0.05):
+        """ Compares the scores obtained with a cached dialogue prefix against full
+            re-encoding of every candidate. As ALBERT attends bidirectionally, the cached
+            dialogue does not see the triple and the scores differ somewhat.
+
+        :param token_seqs: list of token sequences (one for each dialogue)
+        :param candidates: list of (dialogue index, triple) pairs
+        :param atol:       maximum absolute difference in scores that is tolerated
+        :return:           max absolute difference, fraction of candidates with the same label
+                           and whether all differences are within tolerance
+        """
+        y_full = self.predict_batch(token_seqs, candidates)
+        y_cached = self.predict_batch(token_seqs, candidates, prefix_cache=True)
+
+        max_diff = float(np.max(np.abs(y_full - y_cached))) if candidates else 0.0
+        agreement = float(np.mean(np.argmax(y_full, axis=1) == np.argmax(y_cached, axis=1))) if candidates else 1.0
+        print('max abs difference = %.4f (atol=%s)' % (max_diff, atol))
+        print('label agreement    = %.4f' % agreement)
+        return max_diff, agreement, max_diff <= atol
 
 if __name__ == '__main__':
-    annotations = load_annotations('<path_to_annotations')
+    import argparse
+    from src.model_transformer.training_cache import TrainingCache
 
-    # Extract annotation triples and compute negative triples
-    tokens, triples, labels = [], [], []
-    for ann in annotations:
-        ann_tokens, ann_triples, triple_labels = extract_triples(ann)
-        triples.append(ann_triples)
-        labels.append(triple_labels)
-        tokens.append([t for ts in ann_tokens for t in ts + ['<eos>']])
+    parser = argparse.ArgumentParser(description='Train triple scoring on a training cache')
+    parser.add_argument('cache', help='directory of the training cache (see training_cache)')
+    parser.add_argument('--out', default='models/scorer_albert-v2_31_03_2022', help='path of the model')
+    args = parser.parse_args()
 
-    # Fit model
+    # Load pre-tokenized candidates with their labels and weights (see training_cache)
     scorer = TripleScoring()
-    scorer.fit(tokens, triples, labels)
-    torch.save(scorer.state_dict(), 'models/scorer_albert-v2_31_03_2022')
-
+    cache = TrainingCache(args.cache, scorer._tokenizer)
 
+    # Fit model
+    scorer.fit(dataset=cache.candidates)
+    torch.save(scorer.state_dict(), args.out)
@@ -1,5 +1,6 @@
 import re
 import glob
+import heapq
 import json
 import random
 import numpy as np
@@ -8,6 +9,8 @@ import pandas as pd
 from collections import defaultdict
 from copy import deepcopy
 
+from src.model_transformer.predicate_index import load_predicate_index
+
 
 def get_predicate_tokens(annotation, triple):
     """ Finds the predicate token from an annotated triple.
@@ -48,6 +51,19 @@ def find_unique_predicates(path):
     return unique_predicates
 
 
+def load_bio_lookup(path):
+    """ Loads the abstract predicates of a conversion dict (e.g. conversion_dict_level1.json
+        in 'Argument Extraction') as a bio_lookup; predicates are numbered in order of the file
+        with B-tags 3, 5, 7, etc. (see PredicateIndex)
+
+        params:
+        str path:    path to conversion dict (or compiled PredicateIndex)
+
+        returns:    dict with B-tag as key and abstract predicate as value
+    """
+    return load_predicate_index(path).bio_lookup
+
+
 def load_annotations(path, remove_unk=True, keep_skipped=False):
     """ Reads all annotation files from path. By default, it filters skipped
         files and removes the [unk] tokens appended at the end of each turn.
@@ -75,42 +91,185 @@ def load_annotations(path, remove_unk=True, keep_skipped=False):
     return annotations
 
 
-def triple_to_bio_tags(annotation, arg, lookup):
+# Ways to handle predicate spans without (B-tag, I-tag) in the lookup; a (B-tag, I-tag) tuple labels them as that class
+UNKNOWN_PREDICATE_POLICIES = ['error',  # raise a KeyError
+                              'skip']   # leave the span unlabeled (O)
+
+
+def _predicate_tags(lookup, pred):
+    # PredicateIndex normalizes the span before lookup
+    return lookup.tags(pred) if hasattr(lookup, 'tags') else lookup.get(pred)
+
+
+def triple_to_bio_spans(annotation, lookup, args=(0, 1, 2), unknown='error'):
+    """ Converts the token indices of the annotations to BIO label spans of all arguments in a single
+        pass, without creating label vectors (see bio_spans_to_tags).
+
+        params:
+        dict annotation:    loaded annotation file (see load_annotations)
+        dict lookup:        dict with unique predicate as key and tuple (B-tag, I-tag) as value, or
+                            PredicateIndex (which normalizes predicates before lookup)
+        tuple args:         arguments to create spans for (subj=0, pred=1, obj=2; default: all)
+        unknown:            how to handle predicate spans missing from lookup (see UNKNOWN_PREDICATE_POLICIES,
+                            default: error)
+
+        returns:    number of tokens in the dialogue (including <eos>) and list of (arg, positions, B-tag, I-tag)
+                    spans in order of the annotations, with positions the indices of the tokens in the dialogue
+    """
+    # Index of the first token of each turn in the dialogue (+1 for <eos>)
+    turns = annotation['tokens']
+    offsets = np.cumsum([0] + [len(turn) + 1 for turn in turns])
+
+    spans = []
+    for triple in annotation['annotations']:
+        for arg in args:
+            if not triple[arg]:
+                continue
+
+            if arg == 1:
+                pred = get_predicate_tokens(annotation, triple)
+                tags = _predicate_tags(lookup, pred)
+                if tags is None:
+                    if unknown == 'skip':
+                        continue
+                    if unknown == 'error':
+                        raise KeyError(pred)
+                    tags = unknown
+                b_tag, i_tag = tags
+            else:
+                b_tag, i_tag = 1, 2
+
+            indices = np.array(triple[arg], dtype=np.int64).reshape(-1, 2)
+            spans.append((arg, offsets[indices[:, 0]] + indices[:, 1], b_tag, i_tag))
+    return int(offsets[-1]), spans
+
+
+def bio_spans_to_tags(num_tokens, spans, dtype=np.int16):
+    """ Expands BIO label spans (see triple_to_bio_spans) into label vectors. Later spans overwrite
+        earlier ones, as do the I-tags of a span its B-tag.
+
+        params:
+        int num_tokens:     number of tokens in the dialogue
+        list spans:         list of (arg, positions, B-tag, I-tag) spans
+        dtype:              dtype of the labels; int16 holds the labels of all abstract predicate levels
+
+        returns:    ndarray of shape (3, num_tokens) with the BIO labels of the subject, predicate and object
+    """
+    mask = np.zeros((3, num_tokens), dtype=dtype)
+    for arg, positions, b_tag, i_tag in spans:
+        mask[arg, positions[0]] = b_tag
+        mask[arg, positions[1:]] = i_tag
+    return mask
+
+
+def triples_to_bio_tags(annotation, lookup, unknown='error'):
+    """ Converts the token indices of the annotations to vectors of BIO labels for all
+        arguments at once.
+
+        params:
+        dict annotation:    loaded annotation file (see load_annotations)
+        dict lookup:        dict with unique predicate as key and tuple (B-tag, I-tag) as value, or
+                            PredicateIndex (which normalizes predicates before lookup)
+        unknown:            how to handle predicate spans missing from lookup (see UNKNOWN_PREDICATE_POLICIES)
+
+        returns:    ndarray of shape (3, num_tokens) with BIO labels (subj, pred, obj)
+    """
+    return bio_spans_to_tags(*triple_to_bio_spans(annotation, lookup, unknown=unknown))
+
+
+def triple_to_bio_tags(annotation, arg, lookup, unknown='error'):
     """ Converts the token indices of the annotations to a vector of BIO labels
-        for an argument.
+        for an argument (see triples_to_bio_tags to convert all arguments at once).
 
         params:
         dict annotation:    loaded annotation file (see load_annotations)
         int arg:            argument to create tag sequence for (subj=0, pred=1, obj=2)
-        dict lookup:        dict with unique predicate as key and tuple (B-tag, I-tag) as value
+        dict lookup:        dict with unique predicate as key and tuple (B-tag, I-tag) as value, or
+                            PredicateIndex (which normalizes predicates before lookup)
+        unknown:            how to handle predicate spans missing from lookup (see UNKNOWN_PREDICATE_POLICIES)
 
         returns:    ndarray with BIO labels
     """
-    # Determine length of dialogue
-    turns = annotation['tokens']
-    triples = annotation['annotations']
-    num_tokens = sum([len(turn) + 1 for turn in turns])  # +1 for <eos>
+    return bio_spans_to_tags(*triple_to_bio_spans(annotation, lookup, args=(arg,), unknown=unknown))[arg]
 
-    # Create vector same size as dialogue
-    mask = np.zeros(num_tokens, dtype=np.uint8)
 
-    # Label annotated arguments as BIO tags
-    for triple in triples:
-        if arg == 1:
-            pred = get_predicate_tokens(annotation, triple)
-            if pred is not None:
-                b_tag, i_tag = lookup[pred]
-                for j, (turn_id, token_id) in enumerate(triple[arg]):
-                    k = sum([len(t) + 1 for t in turns[:turn_id]]) + token_id  # k = index of token in dialogue
-                    mask[k] = b_tag if j == 0 else i_tag
-        else:
-            for j, (turn_id, token_id) in enumerate(triple[arg]):
-                k = sum([len(t) + 1 for t in turns[:turn_id]]) + token_id  # k = index of token in dialogue
-                mask[k] = 1 if j == 0 else 2
-    return mask
+# Predicates which are kept as abstract predicate (rather than the tokens of their span)
+ABSTRACT_SPAN_PREDICATES = ['be', 'like', 'have']
+
+_NON_WORD = re.compile('[^\w\d\-\']+')
+
+
+def _clean_span(text):
+    """ Turns concatenated subwords into a whitespace-delimited span.
+    """
+    span = _NON_WORD.sub(' ', text).strip()
+    return span.replace('SPEAKER', ' SPEAKER').replace('speaker', ' speaker').strip()
+
+
+def bio_tags_to_labels(mask, one_hot=False, probs=None):
+    """ Obtains the BIO label of each token and its probability.
+
+        params:
+        ndarray mask:       BIO labels of shape |sequence| or label probabilities of shape |sequence|x|C|
+        bool one_hot:       whether mask holds label probabilities (True) or labels (False)
+        ndarray probs:      probability of each label if mask holds labels (default: ones)
+
+        returns:    ndarray of labels and ndarray of their probabilities
+    """
+    mask = np.asarray(mask)
+    if not one_hot:
+        probs = np.ones(mask.shape[0], dtype=np.float32) if probs is None else np.asarray(probs)
+        return mask.astype(np.int64), probs
+
+    labels = np.argmax(mask, axis=1)
+    return labels, mask[np.arange(mask.shape[0]), labels]
+
+
+def bio_tags_to_spans(labels, probs, bio_lookup, predicate=False):
+    """ Finds the spans in a sequence of BIO labels. A span starts at a B-tag and contains
+        all following I-tags up to the next B-tag (I-tags before the first B-tag form a span
+        of their own). For predicates, only the B-tag is kept and spans of the predicates in
+        ABSTRACT_SPAN_PREDICATES are dropped if directly preceding one of those.
+
+        params:
+        ndarray labels:     BIO label of each token (see bio_tags_to_labels)
+        ndarray probs:      probability of each label
+        dict bio_lookup:    dict with B-tag as key and abstract predicate as value
+        bool predicate:     whether the conversion is done for predicates or not
+
+        returns:    ndarrays with the start, end (exclusive), class ID of the first label and confidence
+                    (mean label probability) of each span
+    """
+    labels = np.asarray(labels)
+    probs = np.asarray(probs, dtype=np.float64)
+    is_b = labels % 2 == 1
+
+    if predicate:
+        starts = np.flatnonzero(is_b)
+        abstract = [k for k, v in bio_lookup.items() if v in ABSTRACT_SPAN_PREDICATES]
+        is_abstract = np.isin(labels[starts], abstract)
+
+        # Spans are emitted when followed by a non-abstract predicate (or at the end)
+        keep = is_abstract | ~np.append(is_abstract[1:], False)
+        starts = starts[keep]
+        return starts, starts + 1, labels[starts], probs[starts]
+
+    # Spans consist of B- and I-tags; O-tags do not close a span
+    members = np.flatnonzero(labels != 0)
+    if not members.size:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, np.zeros(0)
+
+    span_ids = np.cumsum(is_b)[members]
+    first = np.flatnonzero(np.append(True, span_ids[1:] != span_ids[:-1]))
+    last = np.append(first[1:], members.size) - 1
+
+    confs = np.add.reduceat(probs[members], first) / (last - first + 1)
+    starts = members[first]
+    return starts, members[last] + 1, labels[starts], confs
 
 
-def bio_tags_to_tokens(tokens, mask, bio_lookup, predicate=False, one_hot=False):
+def bio_tags_to_tokens(tokens, mask, bio_lookup, predicate=False, one_hot=False, confidence=False, probs=None):
     """ Converts a vector of BIO-tags into spans of tokens. If BIO-tags are one-hot encoded,
         one_hot=True will first perform an argmax to obtain the BIO labels.
 
@@ -120,44 +279,93 @@ def bio_tags_to_tokens(tokens, mask, bio_lookup, predicate=False, one_hot=False)
         dict bio_lookup:    dict with B-tag as key and abstract predicate as value
         bool predicate:     whether the conversion is done for predicates or not
         bool one_hot:       whether to interpret mask as a one-hot encoded sequence of shape |sequence|x3
+        bool confidence:    whether to return the confidence of each span (mean probability of its labels)
+        ndarray probs:      probability of each label if mask holds labels (default: ones)
+
+        returns:    set of spans, or dict with span as key and confidence as value if confidence=True
     """
-    out = []
-    span = []
+    labels, probs = bio_tags_to_labels(mask, one_hot, probs)
+    starts, ends, class_ids, confs = bio_tags_to_spans(labels, probs, bio_lookup, predicate)
+    return spans_to_tokens(tokens, labels, starts, ends, class_ids, confs, bio_lookup, predicate, confidence)
 
-    for i, token in enumerate(tokens):
-        pred = mask[i]
 
-        # Reverse one-hot encoding (optional)
-        if one_hot:
-            pred = np.argmax(pred)
+def spans_to_tokens(tokens, labels, starts, ends, class_ids, confs, bio_lookup, predicate=False, confidence=False):
+    """ Materializes spans found by bio_tags_to_spans as strings.
 
-        if pred % 2 == 1:  # B
-            if predicate and (bio_lookup[pred] == 'be' or bio_lookup[pred] == 'like' or bio_lookup[pred] == 'have'):
-                span = bio_lookup[pred]
-                out.append(span)
-                # print(span)
-            else:
-                span = re.sub('[^\w\d\-\']+', ' ', ''.join(span)).strip()
-                span = span.replace('SPEAKER', ' SPEAKER').replace('speaker', ' speaker').strip()
-                out.append(span)
-                span = [token]
+        params:
+        list tokens:        list of subwords or tokens (as tokenized by Albert/AutoTokenizer)
+        ndarray labels:     BIO label of each token
+        ndarray starts:     start of each span
+        ndarray ends:       end of each span (exclusive)
+        ndarray class_ids:  class ID of each span
+        ndarray confs:      confidence of each span
+        dict bio_lookup:    dict with B-tag as key and abstract predicate as value
+        bool predicate:     whether the conversion is done for predicates or not
+        bool confidence:    whether to return the confidence of each span
 
-        elif pred != 0 and pred % 2 == 0:  # I
-            if predicate:
-                continue
-            else:
-                span.append(token)
+        returns:    set of spans, or dict with span as key and confidence as value if confidence=True
+    """
+    spans = dict()
+    for start, end, class_id, conf in zip(starts.tolist(), ends.tolist(), class_ids.tolist(), confs.tolist()):
+        if predicate and bio_lookup.get(class_id) in ABSTRACT_SPAN_PREDICATES:
+            span = bio_lookup[class_id]
+        else:
+            span = _clean_span(''.join([tokens[i] for i in range(start, end) if labels[i] != 0]))
+
+        # Remove empty strings and duplicates (keeping the highest confidence)
+        if span.strip():
+            spans[span] = max(spans.get(span, 0.0), conf)
 
-    if span:
-        span = re.sub('[^\w\d\-\']+', ' ', ''.join(span)).strip()
-        span = span.replace('SPEAKER', ' SPEAKER').replace('speaker', ' speaker').strip()
-        out.append(span)
+    if confidence:
+        return spans
+    return set(spans)
 
-    # Remove empty strings and duplicates
-    return set([span for span in out if span.strip()])
 
+def prune_candidates(subj_args, pred_args, obj_args, top_k=None, beam=None, max_candidates=None):
+    """ Selects candidate triples from the cartesian product of the extracted arguments
+        in order of their joint span confidence (the product of the span confidences),
+        without listing the full product.
 
-def extract_triples(annotation, neg_oversampling=7, contr_oversampling=0.7, ellipsis_oversampling=3):
+        params:
+        dict subj_args:         dict with subject span as key and confidence as value
+        dict pred_args:         dict with predicate span as key and confidence as value
+        dict obj_args:          dict with object span as key and confidence as value
+        int top_k:              number of most confident spans to keep per argument (default: all)
+        float beam:             drop candidates with a joint confidence below beam times that of the
+                                best candidate (default: keep all)
+        int max_candidates:     maximum number of candidates to keep (default: all)
+
+        returns:    list of (subj, pred, obj) candidates and the number of candidates dropped
+    """
+    total = len(subj_args) * len(pred_args) * len(obj_args)
+    args = [sorted(arg.items(), key=lambda x: -x[1])[:top_k] for arg in (subj_args, pred_args, obj_args)]
+    if not all(args):
+        return [], total
+
+    def joint_confidence(idx):
+        return args[0][idx[0]][1] * args[1][idx[1]][1] * args[2][idx[2]][1]
+
+    # Enumerate candidates best-first by expanding one argument at a time
+    best = joint_confidence((0, 0, 0))
+    heap = [(-best, (0, 0, 0))]
+    seen = {(0, 0, 0)}
+    candidates = []
+    while heap and (max_candidates is None or len(candidates) < max_candidates):
+        conf, idx = heapq.heappop(heap)
+        if beam is not None and -conf < beam * best:
+            break
+        candidates.append(tuple(args[j][idx[j]][0] for j in range(3)))
+
+        for j in range(3):
+            next_idx = idx[:j] + (idx[j] + 1,) + idx[j + 1:]
+            if next_idx[j] < len(args[j]) and next_idx not in seen:
+                seen.add(next_idx)
+                heapq.heappush(heap, (-joint_confidence(next_idx), next_idx))
+
+    return candidates, total - len(candidates)
+
+
+def extract_triples(annotation, neg_oversampling=7, contr_oversampling=0.7, ellipsis_oversampling=3, weights=False):
     """ Extracts plain-text triples from an annotation file and samples 'negative' examples by
         crossover. By default, the function will over-extract triples with negative polarity and
         elliptical constructions to counter class imbalance.
@@ -167,6 +375,10 @@ def extract_triples(annotation, neg_oversampling=7, contr_oversampling=0.7, elli
         int neg_oversampling:       how much to over-sample triples with negative polarity
         float contr_oversampling:   how much to sample contrast/invalid triples relative to true triples
         int ellipsis_oversampling:  how much to over-sample elliptical triples
+        bool weights:               whether to return each triple once with its number of copies as weight
+                                    instead of repeating it (default: False)
+
+        returns:    turns, triples and labels (and weights if weights=True)
     """
     turns = annotation['tokens']
     triple_ids = [t[:4] for t in annotation['annotations']]
@@ -174,6 +386,8 @@ def extract_triples(annotation, neg_oversampling=7, contr_oversampling=0.7, elli
     arguments = defaultdict(list)
     triples = []
     labels = []
+    counts = []
+    index = dict()
 
     # Oversampling of elliptical triples
     for triple in deepcopy(triple_ids):
@@ -189,13 +403,16 @@ def extract_triples(annotation, neg_oversampling=7, contr_oversampling=0.7, elli
         obj = ' '.join(turns[i][j] for i, j in obj) if obj else ''
 
         if subj or pred or obj:
+            label, copies = (2, neg_oversampling) if polar else (1, 1)  # Oversampling negative polarities
 
-            if not polar:
-                triples += [(subj, pred, obj)]
-                labels += [1]
-            else:
-                triples += [(subj, pred, obj)] * neg_oversampling  # Oversampling negative polarities
-                labels += [2] * neg_oversampling
+            # Count copies of the same triple rather than repeating it
+            key = (subj, pred, obj), label
+            if key not in index:
+                index[key] = len(triples)
+                triples.append((subj, pred, obj))
+                labels.append(label)
+                counts.append(0)
+            counts[index[key]] += copies
 
             arguments['subjs'].append(subj)
             arguments['preds'].append(pred)
@@ -203,10 +420,10 @@ def extract_triples(annotation, neg_oversampling=7, contr_oversampling=0.7, elli
 
     # Skip if the annotation file was blank
     if not triples:
-        return [], [], []
+        return ([], [], [], []) if weights else ([], [], [])
 
     # Sample fake contrast examples (invalid extractions)
-    n = int(len(triples) * contr_oversampling)
+    n = int(sum(counts) * contr_oversampling)
     for i in range(50):
         s = random.choice(arguments['subjs'])
         p = random.choice(arguments['preds'])
@@ -216,12 +433,19 @@ def extract_triples(annotation, neg_oversampling=7, contr_oversampling=0.7, elli
         if (s, p, o) not in triples and s and p and o:
             triples += [(s, p, o)]
             labels += [0]
+            counts += [1]
             n -= 1
 
         # Create as many fake examples as there were 'real' triples
         if n == 0:
             break
 
+    if weights:
+        return turns, triples, labels, counts
+
+    # Repeat each triple by its number of copies
+    triples = [triple for triple, k in zip(triples, counts) for _ in range(k)]
+    labels = [label for label, k in zip(labels, counts) for _ in range(k)]
     return turns, triples, labels
 
 
@@ -270,9 +494,7 @@ if __name__ == "__main__":
     tokens, labels = [], []
     for ann in anns:
         # Map triple arguments to BIO tagged masks
-        labels.append((triple_to_bio_tags(ann, 0, lookup),
-                       triple_to_bio_tags(ann, 1, lookup),
-                       triple_to_bio_tags(ann, 2, lookup)))
+        labels.append(triples_to_bio_tags(ann, lookup))
 
         # Flatten turn sequence
         tokens.append([t for ts in ann['tokens'] for t in ts + ['<eos>']])
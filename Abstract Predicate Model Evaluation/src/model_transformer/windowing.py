@@ -0,0 +1,127 @@
+import numpy as np
+
+
+def turn_windows(turn_starts, length, size, overlap=128):
+    """ Splits a sequence of subwords starting with [CLS] into overlapping windows which fit the
+        encoder together with [CLS]. Windows end at turn boundaries and start at turn boundaries
+        where possible; a turn is only cut if it does not fit in a window by itself.
+
+        params:
+        ndarray turn_starts:    positions at which a turn starts (i.e. following a separator)
+        int length:             length of the sequence (including [CLS] at position 0)
+        int size:               maximum length of a window including [CLS]
+        int overlap:            minimum number of subwords shared by consecutive windows (< (size - 1) / 2)
+
+        returns:    list of (start, end) pairs of positions (end exclusive), excluding [CLS]
+    """
+    body = size - 1
+    if length - 1 <= body:
+        return [(1, length)]
+    if not 0 <= overlap < body // 2:
+        raise ValueError('overlap must be smaller than half of the window size')
+
+    boundaries = np.unique(np.asarray(turn_starts, dtype=np.int64))
+    boundaries = boundaries[(boundaries > 1) & (boundaries < length)]
+
+    windows = []
+    start = 1
+    while True:
+        end = start + body
+        if end >= length:
+            windows.append((start, length))
+            return windows
+
+        # End at the last turn boundary in the window (if the window stays at least half full)
+        aligned = boundaries[(boundaries > start + body // 2) & (boundaries <= end)]
+        if aligned.size:
+            end = int(aligned[-1])
+        windows.append((start, end))
+
+        # Start the next window at the last turn boundary giving enough overlap
+        aligned = boundaries[(boundaries > start) & (boundaries <= end - overlap)]
+        start = int(aligned[-1]) if aligned.size else end - overlap
+
+
+def merge_windows(windows, outputs, length):
+    """ Merges the predictions of overlapping windows (see turn_windows). Each subword takes the
+        prediction of the window in which it has the most context, i.e. is farthest from an edge of
+        the window that is not an edge of the sequence.
+
+        params:
+        list windows:   list of (start, end) pairs
+        list outputs:   predictions of each window with the subwords on the last axis, [CLS] first
+        int length:     length of the sequence (including [CLS])
+
+        returns:    ndarray with the predictions of the sequence
+    """
+    merged = np.zeros(outputs[0].shape[:-1] + (length,), dtype=outputs[0].dtype)
+    merged[..., 0] = outputs[0][..., 0]
+
+    best = np.full(length, -1, dtype=np.int64)
+    for (start, end), output in zip(windows, outputs):
+        positions = np.arange(start, end)
+        left = positions - start if start > 1 else np.full(len(positions), length)
+        right = end - 1 - positions if end < length else np.full(len(positions), length)
+        context = np.minimum(left, right)
+
+        better = context > best[start:end]
+        best[start:end][better] = context[better]
+        merged[..., start:end][..., better] = output[..., 1:end - start + 1][..., better]
+    return merged
+
+
+def find_last(ids, sub):
+    """ Finds the last occurrence of a sequence of subword IDs in another.
+
+        params:
+        ndarray ids:    sequence to search in
+        list sub:       sequence to search for
+
+        returns:    position of the last occurrence, or -1 if it does not occur
+    """
+    if not len(sub) or len(sub) > len(ids):
+        return -1
+    views = np.lib.stride_tricks.sliding_window_view(ids, len(sub))
+    found = np.flatnonzero((views == np.asarray(sub)).all(axis=1))
+    return int(found[-1]) if found.size else -1
+
+
+def argument_window(turn_starts, length, spans, size):
+    """ Selects the window of a sequence starting with [CLS] which contains the given argument spans,
+        ending at the end of the turn holding the last argument and extending back as far as the
+        window allows (starting at a turn boundary where possible). If no argument is found or they
+        do not fit in one window, the most recent subwords are selected.
+
+        params:
+        ndarray turn_starts:    positions at which a turn starts
+        int length:             length of the sequence (including [CLS] at position 0)
+        list spans:             (start, end) positions of the arguments found in the sequence
+        int size:               maximum length of the window including [CLS]
+
+        returns:    (start, end) positions of the window, excluding [CLS]
+    """
+    body = size - 1
+    if length - 1 <= body:
+        return 1, length
+
+    recent = (length - body, length)
+    if not spans:
+        return recent
+
+    lo = min(start for start, _ in spans)
+    hi = max(end for _, end in spans)
+    if hi - lo > body:
+        return recent
+
+    # End at the end of the turn holding the last argument
+    boundaries = np.asarray(turn_starts, dtype=np.int64)
+    following = boundaries[(boundaries >= hi) & (boundaries < length)]
+    end = int(following[0]) if following.size else length
+    end = min(end, lo + body)
+
+    # Start at the first turn boundary within reach (keeping the first argument)
+    start = max(1, end - body)
+    aligned = boundaries[(boundaries >= start) & (boundaries <= lo)]
+    if aligned.size:
+        start = int(aligned[0])
+    return start, end
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Modules are imported as src.model_transformer.* from the root of the evaluation tree
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Annotations and conversion dicts
+DATA_DIR = os.path.join(os.path.dirname(ROOT), 'Argument Extraction')
@@ -0,0 +1,31 @@
+import glob
+import os
+
+import pytest
+
+from conftest import ROOT
+from src.model_transformer.check_tokenizer import TEST_FILES, load_dialogs, check_tokenizer
+
+FILES = sorted(fname for pattern in TEST_FILES for fname in glob.glob(os.path.join(ROOT, pattern)))
+
+
+@pytest.fixture(scope='module')
+def nlp():
+    # Requires the en_core_web_sm pipeline (python -m spacy download en_core_web_sm)
+    spacy = pytest.importorskip('spacy')
+    try:
+        return spacy.load('en_core_web_sm')
+    except OSError as e:
+        pytest.skip('en_core_web_sm is not available: %s' % e)
+
+
+def test_test_files():
+    assert any('test_jaap' in fname for fname in FILES)
+
+
+@pytest.mark.parametrize('fname', FILES, ids=[os.path.relpath(fname, ROOT) for fname in FILES])
+def test_fast_tokenizer(nlp, fname):
+    # The tokenizer-only ('fast') mode yields the same tokens as the full pipeline for every turn
+    dialogs = load_dialogs(fname)
+    assert dialogs
+    assert check_tokenizer(dialogs, nlp) == []
@@ -0,0 +1,53 @@
+import pytest
+import torch
+from transformers import AlbertConfig, AlbertModel
+
+from src.model_transformer.prefix_cache import check_model, encode_prefix, encode_suffix
+
+
+@pytest.fixture(scope='module')
+def model():
+    # Small randomly initialized ALBERT (no download needed)
+    torch.manual_seed(0)
+    config = AlbertConfig(vocab_size=100, embedding_size=16, hidden_size=32, num_attention_heads=4,
+                          intermediate_size=64, num_hidden_layers=3)
+    return AlbertModel(config).eval()
+
+
+def encode(model, input_ids, speaker_ids, position_ids, attn_mask):
+    with torch.no_grad():
+        return model(input_ids=input_ids, token_type_ids=speaker_ids, position_ids=position_ids,
+                     attention_mask=attn_mask).last_hidden_state
+
+
+def test_empty_prefix(model):
+    # Without a prefix, encode_suffix must reproduce the ALBERT layers of transformers exactly
+    input_ids = torch.randint(5, 100, (3, 12))
+    speaker_ids = torch.randint(0, 2, (3, 12))
+    position_ids = torch.arange(12).expand(3, -1)
+    attn_mask = torch.ones((3, 12))
+    attn_mask[1, 8:] = 0
+
+    with torch.no_grad():
+        cache = encode_prefix(model, input_ids[:1, :0], speaker_ids[:1, :0], position_ids[:1, :0])
+        h = encode_suffix(model, cache, input_ids, speaker_ids, position_ids, attn_mask)
+
+    expected = encode(model, input_ids, speaker_ids, position_ids, attn_mask)
+    mask = attn_mask.bool()
+    assert torch.allclose(h[mask], expected[mask], atol=1e-5)
+
+
+def test_check_model(model):
+    check_model(model)
+
+    # A layer without the expected submodules is rejected
+    layer = model.encoder.albert_layer_groups[0].albert_layers[0]
+    ffn = layer.ffn
+    try:
+        del layer.ffn
+        layer.dense = ffn
+        with pytest.raises(NotImplementedError):
+            check_model(model)
+    finally:
+        del layer.dense
+        layer.ffn = ffn
@@ -0,0 +1,126 @@
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.model_transformer.serving import MicroBatcher, Overloaded, make_server
+
+
+class StubModel:
+    """ Stands in for AlbertTripleExtractor: returns one triple per dialogue, fails on 'fail' and
+        blocks on 'block' until released. """
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+
+    def extract_triples_batch(self, dialogs, post_process=True):
+        self.batches.append(list(dialogs))
+        if 'block' in dialogs:
+            self.release.wait(5)
+        if 'fail' in dialogs:
+            raise RuntimeError('model failed')
+        return [[(0.9, (dialog, 'be', 'fine', 'positive'))] for dialog in dialogs]
+
+
+@pytest.fixture
+def model():
+    model = StubModel()
+    yield model
+    model.release.set()
+
+
+def serve(batcher):
+    server = make_server(batcher, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def post(server, body, path='/extract'):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+    data = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+    connection.request('POST', path, data, {'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+@pytest.fixture
+def server(model):
+    batcher = MicroBatcher(model, max_batch_size=8, max_wait_ms=50)
+    server = serve(batcher)
+    yield server
+    server.shutdown()
+    server.server_close()
+    batcher.close()
+
+
+def test_extract(server):
+    status, body = post(server, {'dialog': 'i like dogs'})
+    assert status == 200
+    assert body == {'triples': [[0.9, ['i like dogs', 'be', 'fine', 'positive']]]}
+
+
+@pytest.mark.parametrize('body', [b'not json', {'text': 'no dialog'}, [1, 2], {'dialog': 3},
+                                  {'dialog': 'hi', 'timeout_ms': 'soon'}, {'dialog': 'hi', 'timeout_ms': -1},
+                                  {'dialog': 'hi', 'post_process': 'yes'}, {'dialog': 'hi', 'variant': 1}])
+def test_invalid_request(server, body):
+    status, body = post(server, body)
+    assert status == 400 and 'error' in body
+
+
+def test_model_error(server):
+    status, body = post(server, {'dialog': 'fail'})
+    assert status == 500 and 'model failed' in body['error']
+
+    # The handler survives the failure
+    assert post(server, {'dialog': 'hi'})[0] == 200
+
+
+def test_batching(server, model):
+    dialogs = ['dialog %s' % i for i in range(6)] + ['fail']
+    with ThreadPoolExecutor(len(dialogs)) as executor:
+        responses = list(executor.map(lambda dialog: post(server, {'dialog': dialog}), dialogs))
+
+    # Requests arriving within max_wait_ms share a batch; a failing dialogue only fails its own request
+    assert any(len(batch) > 1 for batch in model.batches)
+    assert [status for status, _ in responses] == [200] * 6 + [500]
+    assert [body['triples'][0][1][0] for _, body in responses[:6]] == dialogs[:6]
+
+
+def test_deadline(model):
+    batcher = MicroBatcher(model, max_batch_size=1, max_wait_ms=1)
+    server = serve(batcher)
+    try:
+        status, body = post(server, {'dialog': 'block', 'timeout_ms': 100})
+        assert status == 504
+        assert batcher.stats['expired'] == 1
+    finally:
+        model.release.set()
+        server.shutdown()
+        server.server_close()
+        batcher.close()
+
+
+def test_overloaded(model):
+    batcher = MicroBatcher(model, max_batch_size=1, max_wait_ms=1, max_queue=1)
+    server = serve(batcher)
+    try:
+        # One request blocks the worker and one waits in the queue, so the next one is rejected
+        running = batcher.submit('block')
+        while not model.batches:
+            threading.Event().wait(0.01)
+        queued = batcher.submit('hi')
+        with pytest.raises(Overloaded):
+            batcher.submit('hi')
+
+        status, body = post(server, {'dialog': 'hi'})
+        assert status == 503
+
+        model.release.set()
+        assert running.result(5) and queued.result(5)
+    finally:
+        model.release.set()
+        server.shutdown()
+        server.server_close()
+        batcher.close()
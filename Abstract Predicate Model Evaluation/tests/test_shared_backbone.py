@@ -0,0 +1,41 @@
+import inspect
+
+import pytest
+import torch
+
+from src.model_transformer.shared_backbone import ADAPTERS, SharedAlbert, convert_checkpoints
+
+DEFAULT_RANK = inspect.signature(SharedAlbert).parameters['rank'].default
+
+
+@pytest.mark.parametrize('base', [torch.nn.Linear(96, 64), torch.nn.Embedding(100, 32)])
+def test_adapter_rank(base):
+    torch.manual_seed(0)
+    target = torch.randn_like(base.weight)
+    delta = target - base.weight.data
+    linear = isinstance(base, torch.nn.Linear)
+    x = torch.randn(8, 96) if linear else torch.randint(0, 100, (8,))
+
+    errors = dict()
+    with torch.no_grad():
+        expected = x @ target.T + base.bias if linear else target[x]
+        for rank in [8, DEFAULT_RANK]:
+            adapter = ADAPTERS[type(base)](base, rank)
+            adapter.set_delta('weight', delta)
+            adapter.active = True
+            errors[rank] = torch.abs(adapter(x) - expected).max().item()
+
+    # The default adapters are exact
+    assert DEFAULT_RANK is None
+    assert errors[DEFAULT_RANK] < 1e-4
+
+    # A rank-8 adapter errs by at most the first discarded singular value of the difference (times |x|)
+    sigma = torch.linalg.svdvals(delta)[8].item()
+    norm = x.norm(dim=1).max().item() if linear else 1.0
+    assert 0 < errors[8] <= sigma * norm + 1e-4
+
+
+def test_convert_low_rank_requires_check(tmp_path):
+    # A low rank is only accepted after checking it against the original checkpoints
+    with pytest.raises(ValueError):
+        convert_checkpoints('extraction.zip', 'scoring.zip', str(tmp_path / 'unified.pt'), rank=64)
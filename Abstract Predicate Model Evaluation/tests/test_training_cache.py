@@ -0,0 +1,67 @@
+import os
+import pytest
+
+from conftest import DATA_DIR
+from src.model_transformer.predicate_index import PredicateIndex
+from src.model_transformer.training_cache import resolve_pronouns
+from src.model_transformer.utils import load_annotations, triples_to_bio_tags
+
+TRAINVAL = os.path.join(DATA_DIR, 'annotated_data', 'trainval')
+
+
+@pytest.fixture(scope='module')
+def annotations():
+    return [resolve_pronouns(ann) for ann in load_annotations(TRAINVAL)]
+
+
+@pytest.mark.parametrize('level', [1, 2])
+def test_trainval_labels(annotations, level):
+    # Some predicate spans have no abstract predicate after pronoun resolution (e.g. 'gave to SPEAKER1')
+    index = PredicateIndex.from_file(os.path.join(DATA_DIR, 'conversion_dict_level%s.json' % level))
+    with pytest.raises(KeyError):
+        for ann in annotations:
+            triples_to_bio_tags(ann, index)
+
+    for ann in annotations:
+        for unknown in ['skip', (3, 4)]:
+            labels = triples_to_bio_tags(ann, index, unknown)
+            assert labels.shape == (3, sum(len(turn) + 1 for turn in ann['tokens']))
+            assert 0 <= labels.min() and labels.max() < index.num_labels
+            assert labels[[0, 2]].max(initial=0) <= 2
+
+
+@pytest.mark.parametrize('level', [1, 2])
+def test_build_trainval(tmp_path, level):
+    # Requires the albert-base-v2 tokenizer and encoder (downloaded from the HuggingFace hub)
+    try:
+        from src.model_transformer.argument_extraction import ArgumentExtraction
+        from src.model_transformer.triple_scoring import TripleScoring
+        conversion_dict = os.path.join(DATA_DIR, 'conversion_dict_level%s.json' % level)
+        num_labels = PredicateIndex.from_file(conversion_dict).num_labels
+        extractor, scorer = ArgumentExtraction(num_labels=num_labels), TripleScoring()
+    except OSError as e:
+        pytest.skip('albert-base-v2 is not available: %s' % e)
+
+    from src.model_transformer.training_cache import build_training_cache, TrainingCache
+    cache = build_training_cache(TRAINVAL, conversion_dict, extractor, scorer, str(tmp_path))
+    assert cache.metadata['num_dialogs'] == len(load_annotations(TRAINVAL)) == len(cache.arguments)
+    assert cache.metadata['num_labels'] == num_labels
+    assert len(cache.candidates) == cache.metadata['num_candidates'] > 0
+
+    input_ids, speaker_ids, labels = cache.arguments[0]
+    assert labels.shape == (3, len(input_ids)) == (3, len(speaker_ids))
+
+    # Loaded from disk the second time
+    reloaded = build_training_cache(TRAINVAL, conversion_dict, extractor, scorer, str(tmp_path))
+    assert reloaded.metadata['key'] == cache.metadata['key']
+    assert isinstance(reloaded, TrainingCache)
+
+    # A cache of one level cannot be used to train a model of the other
+    other = PredicateIndex.from_file(os.path.join(DATA_DIR, 'conversion_dict_level%s.json' % (3 - level))).num_labels
+    path = os.path.join(str(tmp_path), cache.metadata['key'])
+    with pytest.raises(ValueError):
+        TrainingCache(path, num_labels=other)
+    with pytest.raises(ValueError):
+        ArgumentExtraction(num_labels=other).fit(dataset=cache.arguments)
+    with pytest.raises(ValueError):
+        build_training_cache(TRAINVAL, conversion_dict, ArgumentExtraction(num_labels=other), scorer, str(tmp_path))
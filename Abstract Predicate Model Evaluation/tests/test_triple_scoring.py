@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+import torch
+
+
+# Dialogue which (with a triple) exceeds max_len=80 subwords
+LONG = ['word%s' % i for i in range(60)] + ['<eos>', 'i', 'like', 'dogs', '<eos>']
+SHORT = ['i', 'like', 'cats', '<eos>', 'me', 'too', '<eos>']
+CANDIDATES = [(0, ('i', 'like', 'dogs')), (0, ('word1', 'be', 'word2')), (1, ('i', 'like', 'cats'))]
+
+
+def scorer(overflow):
+    # Requires the albert-base-v2 tokenizer and encoder (downloaded from the HuggingFace hub)
+    try:
+        from src.model_transformer.triple_scoring import TripleScoring
+        model = TripleScoring(overflow=overflow)
+    except OSError as e:
+        pytest.skip('albert-base-v2 is not available: %s' % e)
+    model.eval()
+    return model
+
+
+@pytest.mark.parametrize('overflow', ['truncate_dialogue', 'window'])
+def test_prefix_cache_overflow(overflow):
+    model = scorer(overflow)
+    with torch.no_grad():
+        full = model.predict_batch([LONG, SHORT], CANDIDATES)
+        cached = model.predict_batch([LONG, SHORT], CANDIDATES, prefix_cache=True)
+
+    # Overflowing candidates are encoded in full rather than cut off to [CLS] at the end
+    assert np.allclose(full[:2], cached[:2], atol=1e-4)
+    assert not np.allclose(cached[0], cached[1])
+
+
+def test_prefix_cache_overflow_error():
+    model = scorer('error')
+    with pytest.raises(ValueError):
+        model.predict_batch([LONG, SHORT], CANDIDATES, prefix_cache=True)
+
+
+def test_check_prefix_cache():
+    model = scorer('truncate')
+    dialogs = [SHORT, ['i', 'have', 'a', 'dog', '<eos>', 'what', 'is', 'its', 'name', '?', '<eos>', 'max', '<eos>']]
+    candidates = [(0, ('i', 'like', 'cats')), (0, ('me', 'like', 'cats')), (1, ('i', 'have', 'a dog')),
+                  (1, ('dog', 'be', 'max'))]
+    with torch.no_grad():
+        _, _, within_tolerance = model.check_prefix_cache(dialogs, candidates)
+
+    # Scores with a cached dialogue are within the documented tolerance (atol=0.05) of full re-encoding
+    assert within_tolerance
@@ -1,6 +1,7 @@
 from src.model_transformer.run_transformer_pipeline import AlbertTripleExtractor
 from src.evaluation.benchmark_evaluation.metrics import classification_report
 from src.model_transformer.utils import abstract_predicates_triples
+from src.model_transformer.predicate_index import load_predicate_index
 from pathlib import Path
 import json
 import spacy
@@ -57,12 +58,13 @@ def lemmatize_triple(subj, pred, obj, polar, nlp):
     return subj, pred, obj, polar
 
 
-def evaluate(test_file, model, abstract_dict, lookup, bio_lookup, num_samples=-1, k=0.9, deduplication=True):
+def evaluate(test_file, model, index, num_samples=-1, k=0.9, deduplication=True):
     """ Evaluates the model on a test file, yielding scores for precision@k,
         recall@k, F1@k and PR-AUC.
 
     :param test_file:     Test file from '/test_examples'
     :param model:         Albert, Dependency or baseline model instance
+    :param index:         PredicateIndex to map predicates to abstract predicates of level 1 or 2
     :param num_samples:   The maximum number of samples to evaluate (default: all)
     :param k:             Confidence level at which to evaluate models
     :param deduplication: Whether to lemmatize predicates to make sure duplicate predicates such as "is"
@@ -87,7 +89,7 @@ def evaluate(test_file, model, abstract_dict, lookup, bio_lookup, num_samples=-1
         #transform to abstract predicates level 1 or 2
         #use abstract_predicate_triples from anniek
         #extractions is een lijst met triples in de vorm van (confidence, (subj, pred, obj, polarity))
-        extractions = abstract_predicates_triples(extractions, abstract_dict, lookup, bio_lookup)
+        extractions = abstract_predicates_triples(extractions, index)
 
         # Check for error in test set formatting
         error = False
@@ -123,16 +125,8 @@ def evaluate(test_file, model, abstract_dict, lookup, bio_lookup, num_samples=-1
 
 
 if __name__ == '__main__':
-
-
-    lookup_l1 = {'roleplaying as': (3, 4), 'add': (5, 6), 'could add': (5, 6), 'can afford': (7, 8), 'ca afford': (7, 8), 'ca afford to': (7, 8), 'accept': (9, 10), 'align with': (9, 10), 'ca imagine': (9, 10), 'comes in': (11, 12), 'is going to make easy': (11, 12), 'is serious business for': (11, 12), 'good for': (11, 12), 'allow': (13, 14), 'allow SPEAKER1': (13, 14), 'allowed': (13, 14), 'allowed to': (13, 14), 'let': (13, 14), 'let SPEAKER1': (13, 14), 'let SPEAKER2 do': (13, 14), 'permitted in': (13, 14), 'been looking forward to': (15, 16), 'look forward to': (15, 16), 'looking forward to': (15, 16), 'arrested': (27, 28), 'arrives at': (19, 20), 'arriving at': (19, 20), 'came back in': (19, 20), 'came here to be': (19, 20), 'came to': (19, 20), 'is arriving': (19, 20), 're arriving': (19, 20), 'land': (19, 20), 'will request hr to': (21, 22), 'ask if': (21, 22), 'being': (23, 24), 'is': (23, 24), 'm': (23, 24), 's': (23, 24), 'ai': (23, 24), 'am': (23, 24), 'are': (23, 24), 'are from': (23, 24), 'are over weight': (23, 24), 'be': (23, 24), 'be a type of': (23, 24), 'be for': (23, 24), 'be for SPEAKER1': (23, 24), 'be there before': (23, 24), 'be with': (23, 24), 'been': (23, 24), 'been for': (23, 24), 'can be': (23, 24), 'is about': (23, 24), 'is away': (23, 24), 'is below': (23, 24), 'is color': (23, 24), 'is considered': (23, 24), 'is far away from': (23, 24), 'is for': (23, 24), 'is one of': (23, 24), 'is set on': (23, 24), 'its': (23, 24), 'm at': (23, 24), 'm part of': (23, 24), 'must be': (23, 24), 're': (23, 24), 're on': (23, 24), 's for': (23, 24), 's going': (23, 24), 's naturally': (23, 24), 's on': (23, 24), 'setting with': (23, 24), 'use to': (23, 24), 'used': (23, 24), 'used to': (23, 24), 'used to be': (23, 24), 'was': (23, 24), 'was for a long time': (23, 24), 'was on': (23, 24), 'wass': (23, 24), 'were': (23, 24), 'were members': (23, 24), 'would be': (23, 24), 'happen to': (23, 24), 'frustrated with': (25, 26), 'am at': (29, 30), 'am at the weekend': (29, 30), 'be at': (29, 30), 'came from': (29, 30), 'is at': (29, 30), 'available at': (31, 32), 'be around for': (31, 32), 'be available': (31, 32), 'are sure': (33, 34), 'hard for': (35, 36), 'hard to': (35, 36), 'am off for': (37, 38), 'take off': (37, 38), 'being from': (39, 40), 'born in': (39, 40), 'grew up in': (39, 40), 'grow up in': (39, 40), 'm from': (39, 40), 'move from': (39, 40), 'moved from': (39, 40), 'am from': (39, 40), 'migrate from': (39, 40), 'moved back from': (39, 40), 'are glad': (41, 42), 'are glad is over': (41, 42), 'glad': (41, 42), 'glad SPEAKER1': (41, 42), 'glad to': (41, 42), 'pleased that': (41, 42), 'm in': (43, 44), 'am in': (43, 44), 'are in': (43, 44), 'be in': (43, 44), 'been in': (43, 44), 'is in': (43, 44), 's in': (43, 44), 'was in': (43, 44), 'm in between': (45, 46), 'is old': (47, 48), 'is on': (49, 50), 'm out': (51, 52), 'is over': (53, 54), 'are ready to': (55, 56), 'get ready': (55, 56), 'ready for': (55, 56), 'ready to': (55, 56), 'afraid of': (57, 58), 'm scared of': (57, 58), 'nervous for': (57, 58), 'scared to': (57, 58), 'scares': (57, 58), 'was with': (59, 60), 'is wrong with': (61, 62), 'become': (63, 64), 'turning': (63, 64), 'believe in': (65, 66), 'double cross': (67, 68), 'would stab in the back': (67, 68), 'better than': (69, 70), 'beat': (69, 70), 'do better than': (69, 70), 'may borrow': (71, 72), 'leaking for': (73, 74), 'tore off': (73, 74), 'wrecked': (73, 74), 'divorced': (75, 76), 'broke up with': (75, 76), 'bring': (77, 78), 'bring in': (77, 78), 'bring over': (77, 78), 'bring SPEAKER1': (77, 78), 'bring SPEAKER2': (77, 78), 'brought': (77, 78), 'will bring back': (77, 78), 'scalded on': (79, 80), 'are shopping for': (81, 82), 'bought': (81, 82), 'buy': (81, 82), 'buying': (81, 82), 'd tike to buy': (81, 82), "do SPEAKER1's shopping through": (81, 82), 'like to buy': (81, 82), "like to buy for SPEAKER1's girlfriend": (81, 82), 'like to purchase': (81, 82), 'purchased from ikea': (81, 82), 'purchasing': (81, 82), 'shop': (81, 82), 'shopping for': (81, 82), 'should buy': (81, 82), 'should go to buy': (81, 82), 'use to buy': (81, 82), 'call SPEAKER2': (83, 84), 'called': (83, 84), 'calling from': (83, 84), 'can call in': (83, 84), 'can phone': (83, 84), 'dial': (83, 84), 'should call': (83, 84), 'able to': (85, 86), 'been able to': (85, 86), "ca n't": (85, 86), 'can': (85, 86), 'can accommodate': (85, 86), 'can do': (85, 86), 'have experience': (85, 86), 'have experience in': (85, 86), 'is room for': (85, 86), 'might': (85, 86), 'cancelled': (87, 88), 'care if': (89, 90), 'take care of': (89, 90), 'pet sitting': (89, 90), 'can catch': (91, 92), 'catches': (91, 92), 'catching up on': (91, 92), 'caught on': (91, 92), 'have caught': (91, 92), 'caused': (93, 94), 'be deciding about switching': (95, 96), 'change': (95, 96), 'charge': (95, 96), 'would change': (95, 96), 'switched': (95, 96), 'switched from': (95, 96), 'checked in': (97, 98), 'should choose from': (99, 100), 'vote for': (99, 100), 'voted for': (99, 100), 'exfoliating': (101, 102), 'washed': (101, 102), 'washing': (101, 102), 'is near': (103, 104), 'close': (103, 104), 'shuts down in': (103, 104), 'come': (105, 106), 'come and': (105, 106), 'come to': (105, 106), 'come with': (105, 106), 'comes by': (105, 106), 'imported from': (105, 106), 'is coming to get': (105, 106), 'show up for': (105, 106), 'will come': (105, 106), 'will comes': (105, 106), 'throw off': (107, 108), 'may consider': (109, 110), 'considered': (109, 110), 'should consider': (109, 110), 'can get in touch with': (111, 112), 'can help SPEAKER1 contact': (111, 112), 'have contact with': (111, 112), 'in touch with': (111, 112), 'should sms over': (111, 112), 'bake': (113, 114), 'cook': (113, 114), 'cook for': (113, 114), 'cook to': (113, 114), 'cooking': (113, 114), 'like to cook for': (113, 114), 'copy': (115, 116), 'cost': (117, 118), 'cost SPEAKER1': (117, 118), 'costs': (117, 118), 'could': (119, 120), 'count': (121, 122), 'like it cut': (123, 124), 'mow': (123, 124), 'dance': (125, 126), 'dancing': (125, 126), 'dancing in': (125, 126), 'dancing on': (125, 126), 'decided': (127, 128), 'depends on': (129, 130), 'burn down': (131, 132), 'burned down': (131, 132), 'devote more time to': (133, 134), 'died': (135, 136), 'pass': (135, 136), 'passing': (135, 136), 'different from': (137, 138), 'dislike': (139, 140), 'hate': (139, 140), 'hated': (139, 140), 'hates': (139, 140), 'have reason to distrust': (141, 142), 'am on': (143, 144), 'are on': (143, 144), 'are up to': (143, 144), 'been up to': (143, 144), 'ca do': (143, 144), 'did': (143, 144), 'do': (143, 144), 'do for SPEAKER1': (143, 144), 'do remotely': (143, 144), 'does': (143, 144), 'doing': (143, 144), 'll make work': (143, 144), 'bad at': (145, 146), 'aced': (147, 148), 'could make it as': (147, 148), 'distinguished for': (147, 148), 'doing good': (147, 148), 'get real good at': (147, 148), 'good at': (147, 148), 'passed': (147, 148), 'proficiency in': (147, 148), 'went to town on': (147, 148), 'draw': (149, 150), 'draw over': (149, 150), 'dressed as a lion': (151, 152), 'ca drink': (153, 154), 'drink': (153, 154), 'drinking': (153, 154), 'like to drink': (153, 154), 'should drink more': (153, 154), 'drive': (155, 156), 'drive around': (155, 156), 'drives': (155, 156), 'driving under': (155, 156), 'race': (155, 156), 'race for a living': (155, 156), 'ride to': (155, 156), 'dropped': (157, 158), 'make bank': (159, 160), 'need to make per year': (159, 160), 'ca eat': (161, 162), 'eat': (161, 162), 'eat at': (161, 162), 'eaten': (161, 162), 'eating': (161, 162), 'eats': (161, 162), 'like to eat at': (161, 162), 'only eat': (161, 162), 'would eat': (161, 162), 'give time to do': (163, 164), 'ca endure': (165, 166), 'ca put up with': (165, 166), 'ca stand': (165, 166), 'matched': (167, 168), 'exchange': (169, 170), 'breakdance': (171, 172), 'exercise': (171, 172), 'work out': (171, 172), 'expect to': (173, 174), 'll be expecting': (173, 174), 'falling in': (175, 176), 'fell': (175, 176), 'fell on': (175, 176), 'feel': (177, 178), 'feel about': (177, 178), 'feel like': (177, 178), 'felt': (177, 178), 'felt connected to': (177, 178), 'was feeling': (177, 178), 'fighting off': (179, 180), 'could fill out': (181, 182), 'fill up': (181, 182), 'able to find': (183, 184), 'can find': (183, 184), 'dig': (183, 184), 'find': (183, 184), 'find out': (183, 184), 'found': (183, 184), 'found in': (183, 184), 'like to find': (183, 184), 'finished': (185, 186), 'finished up': (185, 186), 'got done': (185, 186), 'graduated': (185, 186), 'graduated from': (185, 186), 'fit in': (187, 188), 'fit right': (187, 188), 'goes great with': (187, 188), 'fix': (189, 190), 'about to fix': (189, 190), 'be lead by': (191, 192), 'chase': (191, 192), 'follow in': (191, 192), 'followed': (191, 192), 'forget': (193, 194), 'forget to': (193, 194), 'forgot': (193, 194), 'lose track of': (193, 194), 'got more': (195, 196), 'put on': (195, 196), 'can get': (197, 198), 'could get': (197, 198), 'could go': (203, 204), 'get': (197, 198), 'get at the clinic': (197, 198), 'get enough of': (197, 198), 'get in english 101': (197, 198), 'get out': (197, 198), 'gets': (197, 198), 'getting': (197, 198), 'got SPEAKER1': (197, 198), 'got ta': (197, 198), 'got ta go get': (197, 198), 'got us': (197, 198), 'll get SPEAKER2': (197, 198), 'should get': (197, 198), 'to withdraw': (197, 198), 'are trying to get': (197, 198), 'getting to': (197, 198), 'getting into': (199, 200), 'got in because': (199, 200), 'got in that class': (199, 200), 'can give SPEAKER2': (201, 202), 'could supply': (201, 202), 'gave SPEAKER1': (201, 202), 'gave to us': (201, 202), 'give': (201, 202), 'give SPEAKER2': (201, 202), 'gives SPEAKER1': (201, 202), 'have to give SPEAKER1': (201, 202), 'provide': (201, 202), 'would give SPEAKER1': (201, 202), 'going to across': (203, 204), 'am sneaking away to': (203, 204), 'backed into': (203, 204), 'can go': (203, 204), 'go for': (203, 204), 'go in': (203, 204), 'go often': (203, 204), 'go out to': (203, 204), 'go there': (203, 204), 'go there with': (203, 204), 'go to far from': (203, 204), 'going': (203, 204), 'going at': (203, 204), 'going for': (203, 204), 'going on': (203, 204), 'going thru': (203, 204), 'gon na be': (203, 204), 'gone': (203, 204), 'gone to': (203, 204), 'like to go further in': (203, 204), 'm going to': (203, 204), 'was planning on going': (203, 204), 'went': (203, 204), 'went for': (203, 204), 'need to go back to': (203, 204), 're going to': (203, 204), 'go to': (203, 204), 'going to': (203, 204), 'go': (203, 204), 'going out to': (203, 204), 'gone out on': (203, 204), 'goes to': (203, 204), 'get to': (203, 204), 'go next': (203, 204), 'grow': (205, 206), 'grow well in': (205, 206), 'growing up as': (205, 206), 'ca handle': (207, 208), 'harder than': (209, 210), 'been having': (211, 212), 'can have': (211, 212), 'can have free': (211, 212), 'got': (211, 212), 'had': (211, 212), 'had 3 shoots': (211, 212), 'had at a great restaurant': (211, 212), 'had time for': (211, 212), 'has': (211, 212), 'has been': (211, 212), 'has from surgery': (211, 212), 'has SPEAKER1': (211, 212), 'has to': (211, 212), 'have': (211, 212), 'have available': (211, 212), 'have family': (211, 212), 'have got': (211, 212), 'have in the area': (211, 212), 'have in them': (211, 212), 'have seats for': (211, 212), 'have under SPEAKER1': (211, 212), 'have with that': (211, 212), 'having': (211, 212), 'may have': (211, 212), 's got': (211, 212), 's out for': (211, 212), 'serve': (211, 212), 'should have': (211, 212), 'use to have': (211, 212), 've': (211, 212), 've got': (211, 212), 've to': (211, 212), 'will have': (211, 212), 'will have to take': (211, 212), 'will hold': (211, 212), 'will open': (211, 212), 'hear': (213, 214), 'hear about': (213, 214), 'hear clearly': (213, 214), 'heard': (213, 214), 'heard about': (213, 214), 'heard of': (213, 214), 'assist': (215, 216), 'can help': (215, 216), 'help': (215, 216), 'help in': (215, 216), 'help in this city': (215, 216), 'help out': (215, 216), 'help SPEAKER1': (215, 216), 'help SPEAKER2': (215, 216), 'help with': (215, 216), 'helped': (215, 216), 'helped out with': (215, 216), 'need help': (215, 216), 'support': (215, 216), 'supporting': (215, 216), 'can kick': (217, 218), 'can hold': (219, 220), 'hold': (219, 220), 'kept in': (219, 220), 'hope': (221, 222), 'hope SPEAKER2': (221, 222), 'rush': (223, 224), 'hurts': (225, 226), 'include': (227, 228), 'looking in to': (229, 230), 'involve': (231, 232), 'joined': (233, 234), 'should join': (233, 234), 'joining': (233, 234), 'kidding': (235, 236), 'would keep': (237, 238), 'keep': (237, 238), 'keep SPEAKER2': (237, 238), 'kept SPEAKER1 all night': (237, 238), 'kept up all night': (237, 238), 'took to her grave': (239, 240), 'killed': (241, 242), 'knew': (243, 244), 'knew it was': (243, 244), 'know': (243, 244), 'know a lot about': (243, 244), 'know about': (243, 244), 'know about that': (243, 244), 'know by face': (243, 244), 'know how to use': (243, 244), 'know much about': (243, 244), 'm familar with': (243, 244), 'learned': (243, 244), 'lead': (245, 246), 'guided': (245, 246), 'been learning': (247, 248), 'learning': (247, 248), 'would learn to': (247, 248), 'practiced as a kid': (247, 248), 'should leave': (249, 250), 'should leave for a tip': (249, 250), 'got off': (249, 250), 'be gone in': (249, 250), 'get off': (249, 250), 'get off on': (249, 250), 'is to leave for a tip': (249, 250), 'left': (249, 250), 'like to depart': (249, 250), 'like to leave on': (249, 250), 'must leave for': (249, 250), 'should light': (251, 252), 'are a fan of': (253, 254), 'like going to': (253, 254), 'like to do for fun': (253, 254), 'like to go': (253, 254), 'like to go for': (253, 254), 'like to go to': (253, 254), 'like going out to': (253, 254), 'am a fan of': (253, 254), 'am into': (253, 254), 'am more in to': (253, 254), 'am obsessed with': (253, 254), 'are in to': (253, 254), 'are into': (253, 254), 'can deal with': (253, 254), 'can handle': (253, 254), 'could stand': (253, 254), 'do for fun': (253, 254), 'enjoy': (253, 254), 'enjoy working with': (253, 254), 'enjoyed': (253, 254), 'enjoying': (253, 254), 'enjoys': (253, 254), 'excited to': (253, 254), 'fancy': (253, 254), 'get along': (253, 254), 'get along with': (253, 254), 'got SPEAKER1 interested in': (253, 254), 'had fun at': (253, 254), 'interest': (253, 254), 'interested in': (253, 254), 'interested in going to': (253, 254), 'into': (253, 254), 'keen on': (253, 254), 'like': (253, 254), 'like back': (253, 254), 'like being': (253, 254), 'like being at': (253, 254), 'like doing': (253, 254), 'like having around SPEAKER1': (253, 254), 'like SPEAKER1': (253, 254), 'like to do': (253, 254), 'likes': (253, 254), 'm a fan': (253, 254), 'm a huge fan of': (253, 254), 'm content': (253, 254), 'm excited to': (253, 254), 'm into': (253, 254), 'mind going on': (253, 254), 'open about': (253, 254), 'open to': (253, 254), 'passionate about': (253, 254), 'should appreciate': (253, 254), 've a crush on': (253, 254), 'was for': (253, 254), 'will suit best': (253, 254), 'would like': (253, 254), 'would like to': (253, 254), 'would love': (253, 254), 'would love to': (253, 254), 'would mind': (253, 254), 'love to live on': (253, 254), 'obsessed with': (253, 254), 'love to own': (253, 254), 'should limit': (255, 256), 'can listen to': (257, 258), 'like listening to': (257, 258), 'listen to': (257, 258), 'listened to': (257, 258), 'listening to': (257, 258), 'love listening to': (257, 258), 'meditate to': (257, 258), 'been living': (259, 260), 'could live': (259, 260), 'live': (259, 260), 'live above': (259, 260), 'live around': (259, 260), 'live by': (259, 260), 'live with': (259, 260), 'lived': (259, 260), 'lived for a month': (259, 260), "lived SPEAKER1's whole life": (259, 260), 'lived there': (259, 260), 'lived there for': (259, 260), 'living': (259, 260), 'living for a long time': (259, 260), 'living here for': (259, 260), 'living on': (259, 260), 'like to live in': (261, 262), 'live in': (261, 262), 'lives in': (261, 262), 'living in': (261, 262), 'm on': (263, 264), 'located': (263, 264), 'located in': (263, 264), 's off of': (263, 264), 'set in': (263, 264), 'locked out': (265, 266), 'look': (267, 268), 'look like': (267, 268), 'check out': (267, 268), 'love to look at': (267, 268), 'sheds': (269, 270), 'loses': (269, 270), 'lost': (269, 270), 'love to go with': (271, 272), 'love to go to': (271, 272), 'love': (271, 272), 'love being with': (271, 272), 'love to': (271, 272), 'loved': (271, 272), 'loves': (271, 272), 'made of': (273, 274), 'made in': (275, 276), 'build': (275, 276), 'build upon request': (275, 276), 'built': (275, 276), 'can make': (275, 276), 'can seem to make': (275, 276), 'have made': (275, 276), 'like to make': (275, 276), 'made': (275, 276), 'made some for': (275, 276), 'made up': (275, 276), 'make': (275, 276), 'make for SPEAKER1': (275, 276), 'make it': (275, 276), 'make it between us': (275, 276), 'make SPEAKER1': (275, 276), 'make SPEAKER2': (275, 276), 'makes': (275, 276), 'makes SPEAKER1': (275, 276), 'making': (275, 276), 'making more than': (275, 276), 'would make SPEAKER1': (275, 276), 'married': (277, 278), 'married SPEAKER1 for': (277, 278), 'suitable for': (279, 280), 'mean': (281, 282), 'stand for': (281, 282), 'bumped into': (283, 284), 'like to meet for a drink': (283, 284), 'like to meet up with': (283, 284), 'meet': (283, 284), 'meet for': (283, 284), 'meet up for': (283, 284), 'should meet': (283, 284), 'meet up with': (283, 284), 'miss': (285, 286), 'missed': (285, 286), 'spell wrong': (287, 288), 'mixing': (289, 290), 's mixed with': (289, 290), 'is more expensive than': (291, 292), 'inspired SPEAKER1 to': (293, 294), 'going to transfer': (295, 296), 'migrated to': (295, 296), 'move with': (295, 296), 'moved': (295, 296), 'moved back to': (295, 296), 'moved in': (295, 296), 'moved to': (295, 296), 'moved when': (295, 296), 'transferred into': (295, 296), 'turn': (295, 296), 'turn right at': (295, 296), 'need to be': (297, 298), 'are required to': (297, 298), 'had to': (297, 298), 'have to': (297, 298), 'have to be': (297, 298), 'needed to': (297, 298), 'require': (297, 298), 'need to': (297, 298), 'in need of': (299, 300), 'need': (299, 300), 'need for health insurance': (299, 300), 'need quickly': (299, 300), 'need right away': (299, 300), 'is a need for': (299, 300), 'about': (301, 302), 'church on': (301, 302), 'close to': (301, 302), 'faster than': (301, 302), 'fine for': (301, 302), 'for': (301, 302), 'from': (301, 302), 'good': (301, 302), 'here for': (301, 302), 'in': (301, 302), 'in between': (301, 302), 'it': (301, 302), 'like some magic to take away': (301, 302), 'named': (301, 302), 'never': (301, 302), 'new to': (301, 302), 'on': (301, 302), 'play off': (301, 302), 's for SPEAKER1': (301, 302), 's plenty for': (301, 302), 'SPEAKER1': (301, 302), 'to': (301, 302), 'with': (301, 302), 'busy with': (303, 304), 'take up': (303, 304), 'opened up': (305, 306), 'order': (307, 308), 'ordered': (307, 308), 'ordering': (307, 308), 'owe SPEAKER1': (309, 310), 'adopted': (311, 312), 'inherited': (311, 312), 'own': (311, 312), 'owns': (311, 312), 'dye': (313, 314), 'dye red': (313, 314), 'paint': (313, 314), 'parked in': (315, 316), 'can pay with': (317, 318), 'can refund': (317, 318), 'charge to': (317, 318), 'depositing': (317, 318), 'like to pay': (317, 318), 'must pay': (317, 318), 'pay': (317, 318), 'pay by': (317, 318), 'pay for': (317, 318), 'pays': (317, 318), 'should pay': (317, 318), 'would pay': (317, 318), 'paying attention to': (319, 320), 'pay attention to': (319, 320), 'have picked': (321, 322), 'arrange': (323, 324), 'have planned to go': (323, 324), 'plan on making': (323, 324), 'plan to': (323, 324), 'plan to go': (323, 324), 'planing on watching': (323, 324), 'planned': (323, 324), 'planning': (323, 324), 'planning on': (323, 324), 're planning': (323, 324), 'can play': (325, 326), 'geocache': (325, 326), 'is to play': (325, 326), 'play': (325, 326), 'play hoops with': (325, 326), 'play in': (325, 326), 'play loud': (325, 326), 'play on': (325, 326), 'play soccer on': (325, 326), 'played': (325, 326), 'played on': (325, 326), 'played piano in': (325, 326), 'playing': (325, 326), 'playing with': (325, 326), 'plays': (325, 326), 'replaying': (325, 326), 'blast': (325, 326), 'portray as weak': (327, 328), 'll learn to deal with': (329, 330), 'pray for': (331, 332), 'prefer': (333, 334), 'prefer to': (333, 334), 'prefer to bother': (333, 334), 'would rather': (333, 334), 'need to get ready': (335, 336), 'getting ready for': (335, 336), 'getting ready to': (335, 336), 'getting ready to take': (335, 336), 'imagining': (337, 338), 'keep SPEAKER2 from': (339, 340), 'guaranteed': (341, 342), 'proposed to': (343, 344), 'keep safe': (345, 346), 'wo pull': (347, 348), 'll put away': (349, 350), 'rained': (351, 352), 'raise': (353, 354), 'reach': (355, 356), 'comes to': (355, 356), 'coming to': (355, 356), 'like reading': (357, 358), 'like to read': (357, 358), 'read': (357, 358), 'read as a child': (357, 358), 'read in college': (357, 358), 'read often': (357, 358), 'read to': (357, 358), 'reading': (357, 358), 'could recognize': (359, 360), 'can recommend SPEAKER2': (361, 362), 'recommend': (361, 362), 'recycle': (363, 364), 'been together': (365, 366), 'relaxing with': (367, 368), 'calms down': (367, 368), 'can relax': (367, 368), 'relaxing': (367, 368), 'stick to': (369, 370), 'remember': (371, 372), 'cut out': (373, 374), 'scrap': (373, 374), 'booked': (375, 376), 'reserved': (375, 376), 'responding to': (377, 378), 'retired': (379, 380), 'retired for': (379, 380), 'retired from': (379, 380), 'got back from': (381, 382), 'got home from': (381, 382), 'like to return': (381, 382), 'rule': (383, 384), 'ran': (385, 386), 'run': (385, 386), 'runs': (385, 386), 'rather save': (387, 388), 'saves': (387, 388), 'saving for': (387, 388), 'said': (389, 390), 'say': (389, 390), 'says': (389, 390), 'allow people to check out': (391, 392), 'be seen': (391, 392), 'can see': (391, 392), 'get a good look at': (391, 392), 'like to see in beijing': (391, 392), 'saw': (391, 392), 'see': (391, 392), 'seeing tomorrow': (391, 392), 'seen': (391, 392), 'should see': (391, 392), 'am looking for': (393, 394), 'are looking for': (393, 394), 'look for': (393, 394), 'looking for': (393, 394), 's looking good for': (393, 394), 'seeking': (393, 394), 'make SPEAKER1 look': (395, 396), 'seem to': (395, 396), 'seemed': (395, 396), 'seems': (395, 396), 'sound appealing to': (395, 396), 'sounds': (395, 396), 'sounds like': (395, 396), 'looks': (395, 396), 'looks like': (395, 396), 'sell': (397, 398), 'selling': (397, 398), 'should sell': (397, 398), 'like to send': (399, 400), 'send': (399, 400), 'send by airmail': (399, 400), 'send over': (399, 400), 'send to': (399, 400), 'sent to be fixed': (399, 400), 'share': (401, 402), 'share with': (401, 402), 'shooting': (403, 404), 'should': (405, 406), 'show on': (407, 408), 'can show': (407, 408), 'can show SPEAKER2': (407, 408), 'displays': (407, 408), 'presented': (407, 408), 'sign': (409, 410), 'is like': (411, 412), 'similar to': (411, 412), 'like to sing': (413, 414), 'love to sing': (413, 414), 'sing': (413, 414), 'sing in': (413, 414), 'singing': (413, 414), 'love to sit around': (415, 416), 'must sit on': (415, 416), 'sit on': (415, 416), 'were in the chair': (415, 416), 'pass out': (417, 418), 'sleep': (417, 418), 'sleep with': (417, 418), 'slept like': (417, 418), 'smells': (419, 420), 'smoke': (421, 422), 'smoking': (421, 422), 'hang': (423, 424), 'hanging with': (423, 424), 'can alphabetize': (425, 426), 'sort': (425, 426), 'can speak': (427, 428), 'could speak to': (427, 428), 'may speak to': (427, 428), 'speak': (427, 428), 'speak to': (427, 428), 'speaking of': (427, 428), 'stand up at': (427, 428), 'can spend': (429, 430), 'spend': (429, 430), 'spend on shopping': (429, 430), "spend SPEAKER1's holidays from": (429, 430), 'spending': (429, 430), 'spent': (429, 430), 'spent the day in': (429, 430), 'spent too much on': (429, 430), 'will spend most of the weekend with': (429, 430), 'began': (431, 432), 'could start with': (431, 432), 'start': (431, 432), 'start in': (431, 432), 'started': (431, 432), 'started as': (431, 432), 'started in': (431, 432), 'starving': (433, 434), 'still at': (435, 436), 'rather stay': (435, 436), 'can stay': (435, 436), 'can stay for hours': (435, 436), 'like to stay': (435, 436), 'stay': (435, 436), 'stay at': (435, 436), 'stay in': (435, 436), 'stay with': (435, 436), 'stayed in': (435, 436), 'staying': (435, 436), 'staying at': (435, 436), 'staying in': (435, 436), 'staying with': (435, 436), 've stay with': (435, 436), 'robbed': (437, 438), 'quit': (439, 440), 'stop for': (439, 440), 'majored in': (441, 442), 'majoring in': (441, 442), 'studied': (441, 442), 'study': (441, 442), 'studying': (441, 442), 'survived': (443, 444), 'swim': (445, 446), 'be able to take again': (447, 448), 'can take': (447, 448), 'can take again': (447, 448), 'could take': (447, 448), 'going to be taking': (447, 448), 'm taking the kids to': (447, 448), 'may take': (447, 448), 'take': (447, 448), 'take at the bar': (447, 448), 'take SPEAKER1 to': (447, 448), 'take SPEAKER2': (447, 448), 'taken': (447, 448), 'takes': (447, 448), 'taking': (447, 448), 'took': (447, 448), 'will take': (447, 448), 'should take off': (449, 450), 'pull out': (451, 452), 's taking out': (451, 452), 'describe': (453, 454), 'can talk about': (453, 454), 'interviewed with': (453, 454), 'talk to': (453, 454), 'talking about': (453, 454), 'talking to': (453, 454), 'like talking about': (453, 454), 'taste like': (455, 456), 'tastes like': (455, 456), 'taught': (457, 458), 'taught in': (457, 458), 'teach': (457, 458), 'teach at': (457, 458), 'teach during': (457, 458), 'teach in': (457, 458), 'teaches': (457, 458), 'teaching': (457, 458), 'teaching at': (457, 458), 'train': (457, 458), 'tutor': (457, 458), 'tell': (459, 460), 'tell SPEAKER1': (459, 460), 'tell SPEAKER1 to': (459, 460), 'told': (459, 460), 'daydream about': (461, 462), 'have ideas about': (461, 462), 'think': (461, 462), 'think about': (461, 462), 'thinking': (461, 462), 'thinking about': (461, 462), 'thought about': (461, 462), 'threw at SPEAKER1': (463, 464), 'exhausted from': (465, 466), 'tired': (465, 466), 'tired from': (465, 466), 'travel': (467, 468), 'travel for': (467, 468), 'can try': (469, 470), 'could try on': (469, 470), 'like to try': (469, 470), 'should try': (469, 470), 'tried': (469, 470), 'tried to': (469, 470), 'try': (469, 470), 'try out': (469, 470), 'try to': (469, 470), 'trying': (469, 470), "trying on SPEAKER1's travels": (469, 470), 'trying to': (469, 470), 'trying to be': (469, 470), 'take advantage of': (471, 472), 'can use': (471, 472), 'like to use': (471, 472), 'ride': (471, 472), 'use': (471, 472), 'uses': (471, 472), 'went to': (473, 474), 'were in attendance at': (473, 474), 'been to': (473, 474), 'm coming for': (473, 474), 'tour': (473, 474), 'visit': (473, 474), 'visiting from': (473, 474), 'ca wait for': (475, 476), 'waiting': (475, 476), 'waiting in': (475, 476), 'wake up': (477, 478), 'wake up at': (477, 478), 'hike': (479, 480), 'hiked': (479, 480), 'hiking with': (479, 480), 'mind if SPEAKER2 walk to': (479, 480), 'walking around': (479, 480), 'was walking': (479, 480), 'like to be': (481, 482), 'about to': (481, 482), 'd like': (481, 482), 'd like to be': (481, 482), 'deserving of': (481, 482), 'have dreamed of going': (481, 482), 'hope to': (481, 482), 'intend to': (481, 482), 'like to': (481, 482), 'like to have': (481, 482), 'like us to': (481, 482), 'm hoping to visit': (481, 482), 'mean to': (481, 482), 'wanna talk about': (481, 482), 'wanna try out': (481, 482), 'want': (481, 482), 'want in fifties': (481, 482), 'want it': (481, 482), 'want SPEAKER2 to sign': (481, 482), 'want to': (481, 482), 'want to be': (481, 482), 'want to be tomorrow': (481, 482), 'want to be transferred': (481, 482), 'want to do': (481, 482), 'want to extend': (481, 482), 'want to go out to': (481, 482), 'want to pay': (481, 482), 'want to take': (481, 482), 'want to watch together': (481, 482), 'wanted to': (481, 482), 'wanting': (481, 482), 'wanting to': (481, 482), 'wants': (481, 482), 'wants to': (481, 482), 'wants to be': (481, 482), 'willing to do': (481, 482), 'wish': (481, 482), 'wasted': (483, 484), 'binging': (485, 486), 'like watching': (485, 486), 'love watching from indoors': (485, 486), 'watch': (485, 486), 'watched': (485, 486), 'watching': (485, 486), 'went to watch out of curiosity': (485, 486), 'must water': (487, 488), 'wear that way': (489, 490), 'wearing': (489, 490), 'wears': (489, 490), 'worn much': (489, 490), 'll': (491, 492), 'll be': (491, 492), 'll be at': (491, 492), 'will': (491, 492), 'will be': (491, 492), 'wo': (491, 492), 'won': (493, 494), 'love working on': (495, 496), 'always worked in': (495, 496), 'been an employee of': (495, 496), 'been employed': (495, 496), 'code': (495, 496), 'do for a job': (495, 496), 'do for a living': (495, 496), 'have worked in': (495, 496), 'manage': (495, 496), 'market for': (495, 496), 'serving in': (495, 496), 'volunteer': (495, 496), 'volunteer at': (495, 496), 'volunteer with': (495, 496), 'work': (495, 496), 'work as': (495, 496), 'work at': (495, 496), 'work during': (495, 496), 'work for': (495, 496), 'work in': (495, 496), 'worked': (495, 496), 'worked in': (495, 496), 'worked long time': (495, 496), 'worked with': (495, 496), 'working': (495, 496), 'working at': (495, 496), 'working in': (495, 496), 'working nights at': (495, 496), 'working on': (495, 496), 'works': (495, 496), 'works in': (495, 496), 'work with': (497, 498), 'concerned about': (499, 500), 'worried about': (499, 500), 'worry about': (499, 500), 'would': (501, 502), 'note': (503, 504), 'post': (503, 504), 'type': (503, 504), 'write': (503, 504), 'write to': (503, 504), 'writing': (503, 504)}
-    bio_lookup_l1 = {3: 'act', 5: 'add', 7: 'afford', 9: 'agree', 11: 'aid', 13: 'allow', 15: 'anticipate', 17: 'arrest', 19: 'arrive', 21: 'ask', 23: 'be', 25: 'be angry', 27: 'be arrested', 29: 'be at', 31: 'be available', 33: 'be certain', 35: 'be difficult', 37: 'be free', 39: 'be from', 41: 'be happy', 43: 'be in', 45: 'be in between', 47: 'be old', 49: 'be on', 51: 'be out', 53: 'be over', 55: 'be ready', 57: 'be scared', 59: 'be with', 61: 'be wrong', 63: 'become', 65: 'believe', 67: 'betray', 69: 'better than', 71: 'borrow', 73: 'break', 75: 'break up', 77: 'bring', 79: 'burn', 81: 'buy', 83: 'call', 85: 'can', 87: 'cancel', 89: 'care', 91: 'catch', 93: 'cause', 95: 'change', 97: 'check in', 99: 'choose', 101: 'clean', 103: 'close', 105: 'come', 107: 'confuse', 109: 'consider', 111: 'contact', 113: 'cook', 115: 'copy', 117: 'cost', 119: 'could', 121: 'count', 123: 'cut', 125: 'dance', 127: 'decide', 129: 'depend on', 131: 'destroy', 133: 'devote', 135: 'die', 137: 'different', 139: 'dislike', 141: 'distrust', 143: 'do', 145: 'do badly', 147: 'do well', 149: 'draw', 151: 'dress', 153: 'drink', 155: 'drive', 157: 'drop', 159: 'earn', 161: 'eat', 163: 'enable', 165: 'endure', 167: 'equal', 169: 'exchange', 171: 'exercise', 173: 'expect', 175: 'fall', 177: 'feel', 179: 'fight', 181: 'fill', 183: 'find', 185: 'finish', 187: 'fit', 189: 'fix', 191: 'follow', 193: 'forget', 195: 'gain', 197: 'get', 199: 'get in', 201: 'give', 203: 'go', 205: 'grow', 207: 'handle', 209: 'harder than', 211: 'have', 213: 'hear', 215: 'help', 217: 'hit', 219: 'hold', 221: 'hope', 223: 'hurry', 225: 'hurt', 227: 'include', 229: 'investigate', 231: 'involve', 233: 'join', 235: 'joke', 237: 'keep', 239: 'keep secret', 241: 'kill', 243: 'know', 245: 'lead', 247: 'learn', 249: 'leave', 251: 'light', 253: 'like', 255: 'limit', 257: 'listen', 259: 'live', 261: 'live in', 263: 'located', 265: 'lock out', 267: 'look', 269: 'lose', 271: 'love', 273: 'made of', 275: 'make', 277: 'marry', 279: 'match', 281: 'mean', 283: 'meet', 285: 'miss', 287: 'misspell', 289: 'mix', 291: 'more expensive than', 293: 'motivate', 295: 'move', 297: 'must', 299: 'need', 301: 'None', 303: 'occupy', 305: 'open', 307: 'order', 309: 'owe', 311: 'own', 313: 'paint', 315: 'park', 317: 'pay', 319: 'pay attention', 321: 'pick', 323: 'plan', 325: 'play', 327: 'portray', 329: 'practice', 331: 'pray', 333: 'prefer', 335: 'prepare', 337: 'pretend', 339: 'prevent', 341: 'promise', 343: 'propose', 345: 'protect', 347: 'pull', 349: 'put', 351: 'rain', 353: 'raise', 355: 'reach', 357: 'read', 359: 'recognize', 361: 'recommend', 363: 'recycle', 365: 'relationship', 367: 'relax', 369: 'remain', 371: 'remember', 373: 'remove', 375: 'reserve', 377: 'respond', 379: 'retire', 381: 'return', 383: 'rule', 385: 'run', 387: 'save', 389: 'say', 391: 'see', 393: 'seek', 395: 'seem', 397: 'sell', 399: 'send', 401: 'share', 403: 'shoot', 405: 'should', 407: 'show', 409: 'sign', 411: 'similar', 413: 'sing', 415: 'sit', 417: 'sleep', 419: 'smell', 421: 'smoke', 423: 'socialize', 425: 'sort', 427: 'speak', 429: 'spend', 431: 'start', 433: 'starve', 435: 'stay', 437: 'steal', 439: 'stop', 441: 'study', 443: 'survive', 445: 'swim', 447: 'take', 449: 'take off', 451: 'take out', 453: 'talk', 455: 'taste', 457: 'teach', 459: 'tell', 461: 'think', 463: 'throw', 465: 'tired', 467: 'travel', 469: 'try', 471: 'use', 473: 'visit', 475: 'wait', 477: 'wake up', 479: 'walk', 481: 'want', 483: 'waste', 485: 'watch', 487: 'water', 489: 'wear', 491: 'will', 493: 'win', 495: 'work', 497: 'work with', 499: 'worry', 501: 'would', 503: 'write'}
-    abstract_dict_l1 = {(3, 4): ['roleplaying as'], (5, 6): ['add', 'could add'], (7, 8): ['can afford', 'ca afford', 'ca afford to'], (9, 10): ['accept', 'align with', 'ca imagine'], (11, 12): ['comes in', 'is going to make easy', 'is serious business for', 'good for'], (13, 14): ['allow', 'allow SPEAKER1', 'allowed', 'allowed to', 'let', 'let SPEAKER1', 'let SPEAKER2 do', 'permitted in'], (15, 16): ['been looking forward to', 'look forward to', 'looking forward to'], (17, 18): ['arrested'], (19, 20): ['arrives at', 'arriving at', 'came back in', 'came here to be', 'came to', 'is arriving', 're arriving', 'land'], (21, 22): ['will request hr to', 'ask if'], (23, 24): ['being', 'is', 'm', 's', 'ai', 'am', 'are', 'are from', 'are over weight', 'be', 'be a type of', 'be for', 'be for SPEAKER1', 'be there before', 'be with', 'been', 'been for', 'can be', 'is about', 'is away', 'is below', 'is color', 'is considered', 'is far away from', 'is for', 'is one of', 'is set on', 'its', 'm at', 'm part of', 'must be', 're', 're on', 's for', 's going', 's naturally', 's on', 'setting with', 'use to', 'used', 'used to', 'used to be', 'was', 'was for a long time', 'was on', 'wass', 'were', 'were members', 'would be', 'happen to'], (25, 26): ['frustrated with'], (27, 28): ['arrested'], (29, 30): ['am at', 'am at the weekend', 'be at', 'came from', 'is at'], (31, 32): ['available at', 'be around for', 'be available'], (33, 34): ['are sure'], (35, 36): ['hard for', 'hard to'], (37, 38): ['am off for', 'take off'], (39, 40): ['being from', 'born in', 'grew up in', 'grow up in', 'm from', 'move from', 'moved from', 'am from', 'migrate from', 'moved back from'], (41, 42): ['are glad', 'are glad is over', 'glad', 'glad SPEAKER1', 'glad to', 'pleased that'], (43, 44): ['m in', 'am in', 'are in', 'be in', 'been in', 'is in', 's in', 'was in'], (45, 46): ['m in between'], (47, 48): ['is old'], (49, 50): ['is on'], (51, 52): ['m out'], (53, 54): ['is over'], (55, 56): ['are ready to', 'get ready', 'ready for', 'ready to'], (57, 58): ['afraid of', 'm scared of', 'nervous for', 'scared to', 'scares'], (59, 60): ['was with'], (61, 62): ['is wrong with'], (63, 64): ['become', 'turning'], (65, 66): ['believe in'], (67, 68): ['double cross', 'would stab in the back'], (69, 70): ['better than', 'beat', 'do better than'], (71, 72): ['may borrow'], (73, 74): ['leaking for', 'tore off', 'wrecked'], (75, 76): ['divorced', 'broke up with'], (77, 78): ['bring', 'bring in', 'bring over', 'bring SPEAKER1', 'bring SPEAKER2', 'brought', 'will bring back'], (79, 80): ['scalded on'], (81, 82): ['are shopping for', 'bought', 'buy', 'buying', 'd tike to buy', "do SPEAKER1's shopping through", 'like to buy', "like to buy for SPEAKER1's girlfriend", 'like to purchase', 'purchased from ikea', 'purchasing', 'shop', 'shopping for', 'should buy', 'should go to buy', 'use to buy'], (83, 84): ['call SPEAKER2', 'called', 'calling from', 'can call in', 'can phone', 'dial', 'should call'], (85, 86): ['able to', 'been able to', "ca n't", 'can', 'can accommodate', 'can do', 'have experience', 'have experience in', 'is room for', 'might'], (87, 88): ['cancelled'], (89, 90): ['care if', 'take care of', 'pet sitting'], (91, 92): ['can catch', 'catches', 'catching up on', 'caught on', 'have caught'], (93, 94): ['caused'], (95, 96): ['be deciding about switching', 'change', 'charge', 'would change', 'switched', 'switched from'], (97, 98): ['checked in'], (99, 100): ['should choose from', 'vote for', 'voted for'], (101, 102): ['exfoliating', 'washed', 'washing'], (103, 104): ['is near', 'close', 'shuts down in'], (105, 106): ['come', 'come and', 'come to', 'come with', 'comes by', 'imported from', 'is coming to get', 'show up for', 'will come', 'will comes'], (107, 108): ['throw off'], (109, 110): ['may consider', 'considered', 'should consider'], (111, 112): ['can get in touch with', 'can help SPEAKER1 contact', 'have contact with', 'in touch with', 'should sms over'], (113, 114): ['bake', 'cook', 'cook for', 'cook to', 'cooking', 'like to cook for'], (115, 116): ['copy'], (117, 118): ['cost', 'cost SPEAKER1', 'costs'], (119, 120): ['could'], (121, 122): ['count'], (123, 124): ['like it cut', 'mow'], (125, 126): ['dance', 'dancing', 'dancing in', 'dancing on'], (127, 128): ['decided'], (129, 130): ['depends on'], (131, 132): ['burn down', 'burned down'], (133, 134): ['devote more time to'], (135, 136): ['died', 'pass', 'passing'], (137, 138): ['different from'], (139, 140): ['dislike', 'hate', 'hated', 'hates'], (141, 142): ['have reason to distrust'], (143, 144): ['am on', 'are on', 'are up to', 'been up to', 'ca do', 'did', 'do', 'do for SPEAKER1', 'do remotely', 'does', 'doing', 'll make work'], (145, 146): ['bad at'], (147, 148): ['aced', 'could make it as', 'distinguished for', 'doing good', 'get real good at', 'good at', 'passed', 'proficiency in', 'went to town on'], (149, 150): ['draw', 'draw over'], (151, 152): ['dressed as a lion'], (153, 154): ['ca drink', 'drink', 'drinking', 'like to drink', 'should drink more'], (155, 156): ['drive', 'drive around', 'drives', 'driving under', 'race', 'race for a living', 'ride to'], (157, 158): ['dropped'], (159, 160): ['make bank', 'need to make per year'], (161, 162): ['ca eat', 'eat', 'eat at', 'eaten', 'eating', 'eats', 'like to eat at', 'only eat', 'would eat'], (163, 164): ['give time to do'], (165, 166): ['ca endure', 'ca put up with', 'ca stand'], (167, 168): ['matched'], (169, 170): ['exchange'], (171, 172): ['breakdance', 'exercise', 'work out'], (173, 174): ['expect to', 'll be expecting'], (175, 176): ['falling in', 'fell', 'fell on'], (177, 178): ['feel', 'feel about', 'feel like', 'felt', 'felt connected to', 'was feeling'], (179, 180): ['fighting off'], (181, 182): ['could fill out', 'fill up'], (183, 184): ['able to find', 'can find', 'dig', 'find', 'find out', 'found', 'found in', 'like to find'], (185, 186): ['finished', 'finished up', 'got done', 'graduated', 'graduated from'], (187, 188): ['fit in', 'fit right', 'goes great with'], (189, 190): ['fix', 'about to fix'], (191, 192): ['be lead by', 'chase', 'follow in', 'followed'], (193, 194): ['forget', 'forget to', 'forgot', 'lose track of'], (195, 196): ['got more', 'put on'], (197, 198): ['can get', 'could get', 'could go', 'get', 'get at the clinic', 'get enough of', 'get in english 101', 'get out', 'gets', 'getting', 'got SPEAKER1', 'got ta', 'got ta go get', 'got us', 'll get SPEAKER2', 'should get', 'to withdraw', 'are trying to get', 'getting to'], (199, 200): ['getting into', 'got in because', 'got in that class'], (201, 202): ['can give SPEAKER2', 'could supply', 'gave SPEAKER1', 'gave to us', 'give', 'give SPEAKER2', 'gives SPEAKER1', 'have to give SPEAKER1', 'provide', 'would give SPEAKER1'], (203, 204): ['going to across', 'am sneaking away to', 'backed into', 'can go', 'could go', 'go for', 'go in', 'go often', 'go out to', 'go there', 'go there with', 'go to far from', 'going', 'going at', 'going for', 'going on', 'going thru', 'gon na be', 'gone', 'gone to', 'like to go further in', 'm going to', 'was planning on going', 'went', 'went for', 'need to go back to', 're going to', 'go to', 'going to', 'go', 'going out to', 'gone out on', 'goes to', 'get to', 'go next'], (205, 206): ['grow', 'grow well in', 'growing up as'], (207, 208): ['ca handle'], (209, 210): ['harder than'], (211, 212): ['been having', 'can have', 'can have free', 'got', 'had', 'had 3 shoots', 'had at a great restaurant', 'had time for', 'has', 'has been', 'has from surgery', 'has SPEAKER1', 'has to', 'have', 'have available', 'have family', 'have got', 'have in the area', 'have in them', 'have seats for', 'have under SPEAKER1', 'have with that', 'having', 'may have', 's got', 's out for', 'serve', 'should have', 'use to have', 've', 've got', 've to', 'will have', 'will have to take', 'will hold', 'will open'], (213, 214): ['hear', 'hear about', 'hear clearly', 'heard', 'heard about', 'heard of'], (215, 216): ['assist', 'can help', 'help', 'help in', 'help in this city', 'help out', 'help SPEAKER1', 'help SPEAKER2', 'help with', 'helped', 'helped out with', 'need help', 'support', 'supporting'], (217, 218): ['can kick'], (219, 220): ['can hold', 'hold', 'kept in'], (221, 222): ['hope', 'hope SPEAKER2'], (223, 224): ['rush'], (225, 226): ['hurts'], (227, 228): ['include'], (229, 230): ['looking in to'], (231, 232): ['involve'], (233, 234): ['joined', 'should join', 'joining'], (235, 236): ['kidding'], (237, 238): ['would keep', 'keep', 'keep SPEAKER2', 'kept SPEAKER1 all night', 'kept up all night'], (239, 240): ['took to her grave'], (241, 242): ['killed'], (243, 244): ['knew', 'knew it was', 'know', 'know a lot about', 'know about', 'know about that', 'know by face', 'know how to use', 'know much about', 'm familar with', 'learned'], (245, 246): ['lead', 'guided'], (247, 248): ['been learning', 'learning', 'would learn to', 'practiced as a kid'], (249, 250): ['should leave', 'should leave for a tip', 'got off', 'be gone in', 'get off', 'get off on', 'is to leave for a tip', 'left', 'like to depart', 'like to leave on', 'must leave for'], (251, 252): ['should light'], (253, 254): ['are a fan of', 'like going to', 'like to do for fun', 'like to go', 'like to go for', 'like to go to', 'like going out to', 'am a fan of', 'am into', 'am more in to', 'am obsessed with', 'are in to', 'are into', 'can deal with', 'can handle', 'could stand', 'do for fun', 'enjoy', 'enjoy working with', 'enjoyed', 'enjoying', 'enjoys', 'excited to', 'fancy', 'get along', 'get along with', 'got SPEAKER1 interested in', 'had fun at', 'interest', 'interested in', 'interested in going to', 'into', 'keen on', 'like', 'like back', 'like being', 'like being at', 'like doing', 'like having around SPEAKER1', 'like SPEAKER1', 'like to do', 'likes', 'm a fan', 'm a huge fan of', 'm content', 'm excited to', 'm into', 'mind going on', 'open about', 'open to', 'passionate about', 'should appreciate', 've a crush on', 'was for', 'will suit best', 'would like', 'would like to', 'would love', 'would love to', 'would mind', 'love to live on', 'obsessed with', 'love to own'], (255, 256): ['should limit'], (257, 258): ['can listen to', 'like listening to', 'listen to', 'listened to', 'listening to', 'love listening to', 'meditate to'], (259, 260): ['been living', 'could live', 'live', 'live above', 'live around', 'live by', 'live with', 'lived', 'lived for a month', "lived SPEAKER1's whole life", 'lived there', 'lived there for', 'living', 'living for a long time', 'living here for', 'living on'], (261, 262): ['like to live in', 'live in', 'lives in', 'living in'], (263, 264): ['m on', 'located', 'located in', 's off of', 'set in'], (265, 266): ['locked out'], (267, 268): ['look', 'look like', 'check out', 'love to look at'], (269, 270): ['sheds', 'loses', 'lost'], (271, 272): ['love to go with', 'love to go to', 'love', 'love being with', 'love to', 'loved', 'loves'], (273, 274): ['made of'], (275, 276): ['made in', 'build', 'build upon request', 'built', 'can make', 'can seem to make', 'have made', 'like to make', 'made', 'made some for', 'made up', 'make', 'make for SPEAKER1', 'make it', 'make it between us', 'make SPEAKER1', 'make SPEAKER2', 'makes', 'makes SPEAKER1', 'making', 'making more than', 'would make SPEAKER1'], (277, 278): ['married', 'married SPEAKER1 for'], (279, 280): ['suitable for'], (281, 282): ['mean', 'stand for'], (283, 284): ['bumped into', 'like to meet for a drink', 'like to meet up with', 'meet', 'meet for', 'meet up for', 'should meet', 'meet up with'], (285, 286): ['miss', 'missed'], (287, 288): ['spell wrong'], (289, 290): ['mixing', 's mixed with'], (291, 292): ['is more expensive than'], (293, 294): ['inspired SPEAKER1 to'], (295, 296): ['going to transfer', 'migrated to', 'move with', 'moved', 'moved back to', 'moved in', 'moved to', 'moved when', 'transferred into', 'turn', 'turn right at'], (297, 298): ['need to be', 'are required to', 'had to', 'have to', 'have to be', 'needed to', 'require', 'need to'], (299, 300): ['in need of', 'need', 'need for health insurance', 'need quickly', 'need right away', 'is a need for'], (301, 302): ['about', 'church on', 'close to', 'faster than', 'fine for', 'for', 'from', 'good', 'here for', 'in', 'in between', 'it', 'like some magic to take away', 'named', 'never', 'new to', 'on', 'play off', 's for SPEAKER1', 's plenty for', 'SPEAKER1', 'to', 'with'], (303, 304): ['busy with', 'take up'], (305, 306): ['opened up'], (307, 308): ['order', 'ordered', 'ordering'], (309, 310): ['owe SPEAKER1'], (311, 312): ['adopted', 'inherited', 'own', 'owns'], (313, 314): ['dye', 'dye red', 'paint'], (315, 316): ['parked in'], (317, 318): ['can pay with', 'can refund', 'charge to', 'depositing', 'like to pay', 'must pay', 'pay', 'pay by', 'pay for', 'pays', 'should pay', 'would pay'], (319, 320): ['paying attention to', 'pay attention to'], (321, 322): ['have picked'], (323, 324): ['arrange', 'have planned to go', 'plan on making', 'plan to', 'plan to go', 'planing on watching', 'planned', 'planning', 'planning on', 're planning'], (325, 326): ['can play', 'geocache', 'is to play', 'play', 'play hoops with', 'play in', 'play loud', 'play on', 'play soccer on', 'played', 'played on', 'played piano in', 'playing', 'playing with', 'plays', 'replaying', 'blast'], (327, 328): ['portray as weak'], (329, 330): ['ll learn to deal with'], (331, 332): ['pray for'], (333, 334): ['prefer', 'prefer to', 'prefer to bother', 'would rather'], (335, 336): ['need to get ready', 'getting ready for', 'getting ready to', 'getting ready to take'], (337, 338): ['imagining'], (339, 340): ['keep SPEAKER2 from'], (341, 342): ['guaranteed'], (343, 344): ['proposed to'], (345, 346): ['keep safe'], (347, 348): ['wo pull'], (349, 350): ['ll put away'], (351, 352): ['rained'], (353, 354): ['raise'], (355, 356): ['reach', 'comes to', 'coming to'], (357, 358): ['like reading', 'like to read', 'read', 'read as a child', 'read in college', 'read often', 'read to', 'reading'], (359, 360): ['could recognize'], (361, 362): ['can recommend SPEAKER2', 'recommend'], (363, 364): ['recycle'], (365, 366): ['been together'], (367, 368): ['relaxing with', 'calms down', 'can relax', 'relaxing'], (369, 370): ['stick to'], (371, 372): ['remember'], (373, 374): ['cut out', 'scrap'], (375, 376): ['booked', 'reserved'], (377, 378): ['responding to'], (379, 380): ['retired', 'retired for', 'retired from'], (381, 382): ['got back from', 'got home from', 'like to return'], (383, 384): ['rule'], (385, 386): ['ran', 'run', 'runs'], (387, 388): ['rather save', 'saves', 'saving for'], (389, 390): ['said', 'say', 'says'], (391, 392): ['allow people to check out', 'be seen', 'can see', 'get a good look at', 'like to see in beijing', 'saw', 'see', 'seeing tomorrow', 'seen', 'should see'], (393, 394): ['am looking for', 'are looking for', 'look for', 'looking for', 's looking good for', 'seeking'], (395, 396): ['make SPEAKER1 look', 'seem to', 'seemed', 'seems', 'sound appealing to', 'sounds', 'sounds like', 'looks', 'looks like'], (397, 398): ['sell', 'selling', 'should sell'], (399, 400): ['like to send', 'send', 'send by airmail', 'send over', 'send to', 'sent to be fixed'], (401, 402): ['share', 'share with'], (403, 404): ['shooting'], (405, 406): ['should'], (407, 408): ['show on', 'can show', 'can show SPEAKER2', 'displays', 'presented'], (409, 410): ['sign'], (411, 412): ['is like', 'similar to'], (413, 414): ['like to sing', 'love to sing', 'sing', 'sing in', 'singing'], (415, 416): ['love to sit around', 'must sit on', 'sit on', 'were in the chair'], (417, 418): ['pass out', 'sleep', 'sleep with', 'slept like'], (419, 420): ['smells'], (421, 422): ['smoke', 'smoking'], (423, 424): ['hang', 'hanging with'], (425, 426): ['can alphabetize', 'sort'], (427, 428): ['can speak', 'could speak to', 'may speak to', 'speak', 'speak to', 'speaking of', 'stand up at'], (429, 430): ['can spend', 'spend', 'spend on shopping', "spend SPEAKER1's holidays from", 'spending', 'spent', 'spent the day in', 'spent too much on', 'will spend most of the weekend with'], (431, 432): ['began', 'could start with', 'start', 'start in', 'started', 'started as', 'started in'], (433, 434): ['starving'], (435, 436): ['still at', 'rather stay', 'can stay', 'can stay for hours', 'like to stay', 'stay', 'stay at', 'stay in', 'stay with', 'stayed in', 'staying', 'staying at', 'staying in', 'staying with', 've stay with'], (437, 438): ['robbed'], (439, 440): ['quit', 'stop for'], (441, 442): ['majored in', 'majoring in', 'studied', 'study', 'studying'], (443, 444): ['survived'], (445, 446): ['swim'], (447, 448): ['be able to take again', 'can take', 'can take again', 'could take', 'going to be taking', 'm taking the kids to', 'may take', 'take', 'take at the bar', 'take SPEAKER1 to', 'take SPEAKER2', 'taken', 'takes', 'taking', 'took', 'will take'], (449, 450): ['should take off'], (451, 452): ['pull out', 's taking out'], (453, 454): ['describe', 'can talk about', 'interviewed with', 'talk to', 'talking about', 'talking to', 'like talking about'], (455, 456): ['taste like', 'tastes like'], (457, 458): ['taught', 'taught in', 'teach', 'teach at', 'teach during', 'teach in', 'teaches', 'teaching', 'teaching at', 'train', 'tutor'], (459, 460): ['tell', 'tell SPEAKER1', 'tell SPEAKER1 to', 'told'], (461, 462): ['daydream about', 'have ideas about', 'think', 'think about', 'thinking', 'thinking about', 'thought about'], (463, 464): ['threw at SPEAKER1'], (465, 466): ['exhausted from', 'tired', 'tired from'], (467, 468): ['travel', 'travel for'], (469, 470): ['can try', 'could try on', 'like to try', 'should try', 'tried', 'tried to', 'try', 'try out', 'try to', 'trying', "trying on SPEAKER1's travels", 'trying to', 'trying to be'], (471, 472): ['take advantage of', 'can use', 'like to use', 'ride', 'use', 'uses'], (473, 474): ['went to', 'were in attendance at', 'been to', 'm coming for', 'tour', 'visit', 'visiting from'], (475, 476): ['ca wait for', 'waiting', 'waiting in'], (477, 478): ['wake up', 'wake up at'], (479, 480): ['hike', 'hiked', 'hiking with', 'mind if SPEAKER2 walk to', 'walking around', 'was walking'], (481, 482): ['like to be', 'about to', 'd like', 'd like to be', 'deserving of', 'have dreamed of going', 'hope to', 'intend to', 'like to', 'like to have', 'like us to', 'm hoping to visit', 'mean to', 'wanna talk about', 'wanna try out', 'want', 'want in fifties', 'want it', 'want SPEAKER2 to sign', 'want to', 'want to be', 'want to be tomorrow', 'want to be transferred', 'want to do', 'want to extend', 'want to go out to', 'want to pay', 'want to take', 'want to watch together', 'wanted to', 'wanting', 'wanting to', 'wants', 'wants to', 'wants to be', 'willing to do', 'wish'], (483, 484): ['wasted'], (485, 486): ['binging', 'like watching', 'love watching from indoors', 'watch', 'watched', 'watching', 'went to watch out of curiosity'], (487, 488): ['must water'], (489, 490): ['wear that way', 'wearing', 'wears', 'worn much'], (491, 492): ['ll', 'll be', 'll be at', 'will', 'will be', 'wo'], (493, 494): ['won'], (495, 496): ['love working on', 'always worked in', 'been an employee of', 'been employed', 'code', 'do for a job', 'do for a living', 'have worked in', 'manage', 'market for', 'serving in', 'volunteer', 'volunteer at', 'volunteer with', 'work', 'work as', 'work at', 'work during', 'work for', 'work in', 'worked', 'worked in', 'worked long time', 'worked with', 'working', 'working at', 'working in', 'working nights at', 'working on', 'works', 'works in'], (497, 498): ['work with'], (499, 500): ['concerned about', 'worried about', 'worry about'], (501, 502): ['would'], (503, 504): ['note', 'post', 'type', 'write', 'write to', 'writing']}
-
-
-    lookup_l2 = {'roleplaying as': (3, 4), 'imagining': (3, 4), 'add': (5, 6), 'could add': (5, 6), 'accept': (7, 8), 'align with': (7, 8), 'ca imagine': (7, 8), 'will request hr to': (9, 10), 'ask if': (9, 10), 'proposed to': (9, 10), 'able to': (11, 12), 'been able to': (11, 12), "ca n't": (11, 12), 'can': (11, 12), 'can accommodate': (11, 12), 'can do': (11, 12), 'have experience': (11, 12), 'have experience in': (11, 12), 'is room for': (11, 12), 'might': (11, 12), 'could': (11, 12), 'need to be': (11, 12), 'are required to': (11, 12), 'had to': (11, 12), 'have to': (11, 12), 'have to be': (11, 12), 'needed to': (11, 12), 'require': (11, 12), 'need to': (11, 12), 'should': (11, 12), 'll': (11, 12), 'll be': (11, 12), 'll be at': (11, 12), 'will': (11, 12), 'will be': (11, 12), 'wo': (11, 12), 'would': (11, 12), 'being': (13, 14), 'is': (13, 14), 'm': (13, 14), 's': (13, 14), 'ai': (13, 14), 'am': (13, 14), 'are': (13, 14), 'are from': (13, 14), 'are over weight': (13, 14), 'be': (13, 14), 'be a type of': (13, 14), 'be for': (13, 14), 'be for SPEAKER1': (13, 14), 'be there before': (13, 14), 'be with': (13, 14), 'been': (13, 14), 'been for': (13, 14), 'can be': (13, 14), 'is about': (13, 14), 'is away': (13, 14), 'is below': (13, 14), 'is color': (13, 14), 'is considered': (13, 14), 'is far away from': (13, 14), 'is for': (13, 14), 'is one of': (13, 14), 'is set on': (13, 14), 'its': (13, 14), 'm at': (13, 14), 'm part of': (13, 14), 'must be': (13, 14), 're': (13, 14), 're on': (13, 14), 's for': (13, 14), 's going': (13, 14), 's naturally': (13, 14), 's on': (13, 14), 'setting with': (13, 14), 'use to': (13, 14), 'used': (13, 14), 'used to': (13, 14), 'used to be': (13, 14), 'was': (13, 14), 'was for a long time': (13, 14), 'was on': (13, 14), 'wass': (13, 14), 'were': (13, 14), 'were members': (13, 14), 'would be': (13, 14), 'happen to': (13, 14), 'is on': (13, 14), 'm out': (13, 14), 'was with': (13, 14), 'hard for': (15, 16), 'hard to': (15, 16), 'am off for': (17, 18), 'take off': (17, 18), 'being from': (19, 20), 'born in': (19, 20), 'grew up in': (19, 20), 'grow up in': (19, 20), 'm from': (19, 20), 'move from': (19, 20), 'moved from': (19, 20), 'am from': (19, 20), 'migrate from': (19, 20), 'moved back from': (19, 20), 'is old': (21, 22), 'are ready to': (23, 24), 'get ready': (23, 24), 'ready for': (23, 24), 'ready to': (23, 24), 'is wrong with': (25, 26), 'become': (27, 28), 'turning': (27, 28), 'double cross': (29, 30), 'would stab in the back': (29, 30), 'better than': (31, 32), 'beat': (31, 32), 'do better than': (31, 32), 'may borrow': (33, 34), 'bring': (35, 36), 'bring in': (35, 36), 'bring over': (35, 36), 'bring SPEAKER1': (35, 36), 'bring SPEAKER2': (35, 36), 'brought': (35, 36), 'will bring back': (35, 36), 'call SPEAKER2': (37, 38), 'called': (37, 38), 'calling from': (37, 38), 'can call in': (37, 38), 'can phone': (37, 38), 'dial': (37, 38), 'should call': (37, 38), 'caused': (39, 40), 'be deciding about switching': (41, 42), 'change': (41, 42), 'charge': (41, 42), 'would change': (41, 42), 'switched': (41, 42), 'switched from': (41, 42), 'exchange': (41, 42), 'checked in': (43, 44), 'should choose from': (45, 46), 'vote for': (45, 46), 'voted for': (45, 46), 'decided': (45, 46), 'have picked': (45, 46), 'exfoliating': (47, 48), 'washed': (47, 48), 'washing': (47, 48), 'is near': (49, 50), 'close': (49, 50), 'shuts down in': (49, 50), 'come': (51, 52), 'come and': (51, 52), 'come to': (51, 52), 'come with': (51, 52), 'comes by': (51, 52), 'imported from': (51, 52), 'is coming to get': (51, 52), 'show up for': (51, 52), 'will come': (51, 52), 'will comes': (51, 52), 'are shopping for': (53, 54), 'bought': (53, 54), 'buy': (53, 54), 'buying': (53, 54), 'd tike to buy': (53, 54), "do SPEAKER1's shopping through": (53, 54), 'like to buy': (53, 54), "like to buy for SPEAKER1's girlfriend": (53, 54), 'like to purchase': (53, 54), 'purchased from ikea': (53, 54), 'purchasing': (53, 54), 'shop': (53, 54), 'shopping for': (53, 54), 'should buy': (53, 54), 'should go to buy': (53, 54), 'use to buy': (53, 54), 'can pay with': (53, 54), 'can refund': (53, 54), 'charge to': (53, 54), 'depositing': (53, 54), 'like to pay': (53, 54), 'must pay': (53, 54), 'pay': (53, 54), 'pay by': (53, 54), 'pay for': (53, 54), 'pays': (53, 54), 'should pay': (53, 54), 'would pay': (53, 54), 'sell': (53, 54), 'selling': (53, 54), 'should sell': (53, 54), 'throw off': (55, 56), 'ca drink': (57, 58), 'drink': (57, 58), 'drinking': (57, 58), 'like to drink': (57, 58), 'should drink more': (57, 58), 'ca eat': (57, 58), 'eat': (57, 58), 'eat at': (57, 58), 'eaten': (57, 58), 'eating': (57, 58), 'eats': (57, 58), 'like to eat at': (57, 58), 'only eat': (57, 58), 'would eat': (57, 58), 'must water': (57, 58), 'can get in touch with': (59, 60), 'can help SPEAKER1 contact': (59, 60), 'have contact with': (59, 60), 'in touch with': (59, 60), 'should sms over': (59, 60), 'bake': (61, 62), 'cook': (61, 62), 'cook for': (61, 62), 'cook to': (61, 62), 'cooking': (61, 62), 'like to cook for': (61, 62), 'copy': (63, 64), 'cost': (65, 66), 'cost SPEAKER1': (65, 66), 'costs': (65, 66), 'count': (67, 68), 'like it cut': (69, 70), 'mow': (69, 70), 'depends on': (71, 72), 'leaking for': (73, 74), 'tore off': (73, 74), 'wrecked': (73, 74), 'scalded on': (73, 74), 'burn down': (73, 74), 'burned down': (73, 74), 'devote more time to': (75, 76), 'died': (77, 78), 'pass': (77, 78), 'passing': (77, 78), 'starving': (77, 78), 'different from': (79, 80), 'dislike': (81, 82), 'hate': (81, 82), 'hated': (81, 82), 'hates': (81, 82), 'have reason to distrust': (81, 82), 'am on': (83, 84), 'are on': (83, 84), 'are up to': (83, 84), 'been up to': (83, 84), 'ca do': (83, 84), 'did': (83, 84), 'do': (83, 84), 'do for SPEAKER1': (83, 84), 'do remotely': (83, 84), 'does': (83, 84), 'doing': (83, 84), 'll make work': (83, 84), 'bad at': (85, 86), 'spell wrong': (85, 86), 'aced': (87, 88), 'could make it as': (87, 88), 'distinguished for': (87, 88), 'doing good': (87, 88), 'get real good at': (87, 88), 'good at': (87, 88), 'passed': (87, 88), 'proficiency in': (87, 88), 'went to town on': (87, 88), 'draw': (89, 90), 'draw over': (89, 90), 'dye': (89, 90), 'dye red': (89, 90), 'paint': (89, 90), 'drive': (91, 92), 'drive around': (91, 92), 'drives': (91, 92), 'driving under': (91, 92), 'race': (91, 92), 'race for a living': (91, 92), 'ride to': (91, 92), 'inspired SPEAKER1 to': (93, 94), 'ca endure': (95, 96), 'ca put up with': (95, 96), 'ca stand': (95, 96), 'matched': (97, 98), 'expect to': (99, 100), 'll be expecting': (99, 100), 'falling in': (101, 102), 'fell': (101, 102), 'fell on': (101, 102), 'feel': (103, 104), 'feel about': (103, 104), 'feel like': (103, 104), 'felt': (103, 104), 'felt connected to': (103, 104), 'was feeling': (103, 104), 'fighting off': (105, 106), 'could fill out': (107, 108), 'fill up': (107, 108), 'able to find': (109, 110), 'can find': (109, 110), 'dig': (109, 110), 'find': (109, 110), 'find out': (109, 110), 'found': (109, 110), 'found in': (109, 110), 'like to find': (109, 110), 'fit in': (111, 112), 'fit right': (111, 112), 'goes great with': (111, 112), 'be lead by': (113, 114), 'chase': (113, 114), 'follow in': (113, 114), 'followed': (113, 114), 'forget': (115, 116), 'forget to': (115, 116), 'forgot': (115, 116), 'lose track of': (115, 116), 'can catch': (117, 118), 'catches': (117, 118), 'catching up on': (117, 118), 'caught on': (117, 118), 'have caught': (117, 118), 'make bank': (117, 118), 'need to make per year': (117, 118), 'got more': (117, 118), 'put on': (117, 118), 'can get': (117, 118), 'could get': (117, 118), 'could go': (123, 124), 'get': (117, 118), 'get at the clinic': (117, 118), 'get enough of': (117, 118), 'get in english 101': (117, 118), 'get out': (117, 118), 'gets': (117, 118), 'getting': (117, 118), 'got SPEAKER1': (117, 118), 'got ta': (117, 118), 'got ta go get': (117, 118), 'got us': (117, 118), 'll get SPEAKER2': (117, 118), 'should get': (117, 118), 'to withdraw': (117, 118), 'are trying to get': (117, 118), 'getting to': (117, 118), 'getting into': (119, 120), 'got in because': (119, 120), 'got in that class': (119, 120), 'can give SPEAKER2': (121, 122), 'could supply': (121, 122), 'gave SPEAKER1': (121, 122), 'gave to us': (121, 122), 'give': (121, 122), 'give SPEAKER2': (121, 122), 'gives SPEAKER1': (121, 122), 'have to give SPEAKER1': (121, 122), 'provide': (121, 122), 'would give SPEAKER1': (121, 122), 'arrives at': (123, 124), 'arriving at': (123, 124), 'came back in': (123, 124), 'came here to be': (123, 124), 'came to': (123, 124), 'is arriving': (123, 124), 're arriving': (123, 124), 'land': (123, 124), 'going to across': (123, 124), 'am sneaking away to': (123, 124), 'backed into': (123, 124), 'can go': (123, 124), 'go for': (123, 124), 'go in': (123, 124), 'go often': (123, 124), 'go out to': (123, 124), 'go there': (123, 124), 'go there with': (123, 124), 'go to far from': (123, 124), 'going': (123, 124), 'going at': (123, 124), 'going for': (123, 124), 'going on': (123, 124), 'going thru': (123, 124), 'gon na be': (123, 124), 'gone': (123, 124), 'gone to': (123, 124), 'like to go further in': (123, 124), 'm going to': (123, 124), 'was planning on going': (123, 124), 'went': (123, 124), 'went for': (123, 124), 'need to go back to': (123, 124), 're going to': (123, 124), 'go to': (123, 124), 'going to': (123, 124), 'go': (123, 124), 'going out to': (123, 124), 'gone out on': (123, 124), 'goes to': (123, 124), 'get to': (123, 124), 'go next': (123, 124), 'grow': (125, 126), 'grow well in': (125, 126), 'growing up as': (125, 126), 'ca handle': (127, 128), 'harder than': (129, 130), 'been having': (131, 132), 'can have': (131, 132), 'can have free': (131, 132), 'got': (131, 132), 'had': (131, 132), 'had 3 shoots': (131, 132), 'had at a great restaurant': (131, 132), 'had time for': (131, 132), 'has': (131, 132), 'has been': (131, 132), 'has from surgery': (131, 132), 'has SPEAKER1': (131, 132), 'has to': (131, 132), 'have': (131, 132), 'have available': (131, 132), 'have family': (131, 132), 'have got': (131, 132), 'have in the area': (131, 132), 'have in them': (131, 132), 'have seats for': (131, 132), 'have under SPEAKER1': (131, 132), 'have with that': (131, 132), 'having': (131, 132), 'may have': (131, 132), 's got': (131, 132), 's out for': (131, 132), 'serve': (131, 132), 'should have': (131, 132), 'use to have': (131, 132), 've': (131, 132), 've got': (131, 132), 've to': (131, 132), 'will have': (131, 132), 'will have to take': (131, 132), 'will hold': (131, 132), 'will open': (131, 132), 'hear': (133, 134), 'hear about': (133, 134), 'hear clearly': (133, 134), 'heard': (133, 134), 'heard about': (133, 134), 'heard of': (133, 134), 'can listen to': (133, 134), 'like listening to': (133, 134), 'listen to': (133, 134), 'listened to': (133, 134), 'listening to': (133, 134), 'love listening to': (133, 134), 'meditate to': (133, 134), 'comes in': (135, 136), 'is going to make easy': (135, 136), 'is serious business for': (135, 136), 'good for': (135, 136), 'give time to do': (135, 136), 'assist': (135, 136), 'can help': (135, 136), 'help': (135, 136), 'help in': (135, 136), 'help in this city': (135, 136), 'help out': (135, 136), 'help SPEAKER1': (135, 136), 'help SPEAKER2': (135, 136), 'help with': (135, 136), 'helped': (135, 136), 'helped out with': (135, 136), 'need help': (135, 136), 'support': (135, 136), 'supporting': (135, 136), 'can kick': (137, 138), 'arrested': (139, 140), 'can hold': (139, 140), 'hold': (139, 140), 'kept in': (139, 140), 'rush': (141, 142), 'hurts': (143, 144), 'include': (145, 146), 'involve': (147, 148), 'joined': (149, 150), 'should join': (149, 150), 'joining': (149, 150), 'kidding': (151, 152), 'would keep': (153, 154), 'keep': (153, 154), 'keep SPEAKER2': (153, 154), 'kept SPEAKER1 all night': (153, 154), 'kept up all night': (153, 154), 'relaxing with': (153, 154), 'took to her grave': (155, 156), 'killed': (157, 158), 'are sure': (159, 160), 'knew': (159, 160), 'knew it was': (159, 160), 'know': (159, 160), 'know a lot about': (159, 160), 'know about': (159, 160), 'know about that': (159, 160), 'know by face': (159, 160), 'know how to use': (159, 160), 'know much about': (159, 160), 'm familar with': (159, 160), 'learned': (159, 160), 'could recognize': (159, 160), 'work with': (159, 160), 'lead': (161, 162), 'guided': (161, 162), 'been learning': (163, 164), 'learning': (163, 164), 'would learn to': (163, 164), 'practiced as a kid': (163, 164), 'll learn to deal with': (163, 164), 'majored in': (163, 164), 'majoring in': (163, 164), 'studied': (163, 164), 'study': (163, 164), 'studying': (163, 164), 'should leave': (165, 166), 'should leave for a tip': (165, 166), 'got off': (165, 166), 'be gone in': (165, 166), 'get off': (165, 166), 'get off on': (165, 166), 'is to leave for a tip': (165, 166), 'left': (165, 166), 'like to depart': (165, 166), 'like to leave on': (165, 166), 'must leave for': (165, 166), 'should take off': (165, 166), 'should light': (167, 168), 'are a fan of': (169, 170), 'like going to': (169, 170), 'like to do for fun': (169, 170), 'like to go': (169, 170), 'like to go for': (169, 170), 'like to go to': (169, 170), 'like going out to': (169, 170), 'am a fan of': (169, 170), 'am into': (169, 170), 'am more in to': (169, 170), 'am obsessed with': (169, 170), 'are in to': (169, 170), 'are into': (169, 170), 'can deal with': (169, 170), 'can handle': (169, 170), 'could stand': (169, 170), 'do for fun': (169, 170), 'enjoy': (169, 170), 'enjoy working with': (169, 170), 'enjoyed': (169, 170), 'enjoying': (169, 170), 'enjoys': (169, 170), 'excited to': (169, 170), 'fancy': (169, 170), 'get along': (169, 170), 'get along with': (169, 170), 'got SPEAKER1 interested in': (169, 170), 'had fun at': (169, 170), 'interest': (169, 170), 'interested in': (169, 170), 'interested in going to': (169, 170), 'into': (169, 170), 'keen on': (169, 170), 'like': (169, 170), 'like back': (169, 170), 'like being': (169, 170), 'like being at': (169, 170), 'like doing': (169, 170), 'like having around SPEAKER1': (169, 170), 'like SPEAKER1': (169, 170), 'like to do': (169, 170), 'likes': (169, 170), 'm a fan': (169, 170), 'm a huge fan of': (169, 170), 'm content': (169, 170), 'm excited to': (169, 170), 'm into': (169, 170), 'mind going on': (169, 170), 'open about': (169, 170), 'open to': (169, 170), 'passionate about': (169, 170), 'should appreciate': (169, 170), 've a crush on': (169, 170), 'was for': (169, 170), 'will suit best': (169, 170), 'would like': (169, 170), 'would like to': (169, 170), 'would love': (169, 170), 'would love to': (169, 170), 'would mind': (169, 170), 'love to live on': (169, 170), 'obsessed with': (169, 170), 'love to own': (169, 170), 'love to go with': (169, 170), 'love to go to': (169, 170), 'love': (169, 170), 'love being with': (169, 170), 'love to': (169, 170), 'loved': (169, 170), 'loves': (169, 170), 'prefer': (169, 170), 'prefer to': (169, 170), 'prefer to bother': (169, 170), 'would rather': (169, 170), 'can recommend SPEAKER2': (169, 170), 'recommend': (169, 170), 'should limit': (171, 172), 'been living': (173, 174), 'could live': (173, 174), 'live': (173, 174), 'live above': (173, 174), 'live around': (173, 174), 'live by': (173, 174), 'live with': (173, 174), 'lived': (173, 174), 'lived for a month': (173, 174), "lived SPEAKER1's whole life": (173, 174), 'lived there': (173, 174), 'lived there for': (173, 174), 'living': (173, 174), 'living for a long time': (173, 174), 'living here for': (173, 174), 'living on': (173, 174), 'like to live in': (175, 176), 'live in': (175, 176), 'lives in': (175, 176), 'living in': (175, 176), 'am at': (177, 178), 'am at the weekend': (177, 178), 'be at': (177, 178), 'came from': (177, 178), 'is at': (177, 178), 'm in': (177, 178), 'am in': (177, 178), 'are in': (177, 178), 'be in': (177, 178), 'been in': (177, 178), 'is in': (177, 178), 's in': (177, 178), 'was in': (177, 178), 'm in between': (177, 178), 'm on': (177, 178), 'located': (177, 178), 'located in': (177, 178), 's off of': (177, 178), 'set in': (177, 178), 'locked out': (179, 180), 'sheds': (181, 182), 'loses': (181, 182), 'lost': (181, 182), 'made of': (183, 184), 'fix': (185, 186), 'about to fix': (185, 186), 'made in': (185, 186), 'build': (185, 186), 'build upon request': (185, 186), 'built': (185, 186), 'can make': (185, 186), 'can seem to make': (185, 186), 'have made': (185, 186), 'like to make': (185, 186), 'made': (185, 186), 'made some for': (185, 186), 'made up': (185, 186), 'make': (185, 186), 'make for SPEAKER1': (185, 186), 'make it': (185, 186), 'make it between us': (185, 186), 'make SPEAKER1': (185, 186), 'make SPEAKER2': (185, 186), 'makes': (185, 186), 'makes SPEAKER1': (185, 186), 'making': (185, 186), 'making more than': (185, 186), 'would make SPEAKER1': (185, 186), 'mean': (187, 188), 'stand for': (187, 188), 'bumped into': (189, 190), 'like to meet for a drink': (189, 190), 'like to meet up with': (189, 190), 'meet': (189, 190), 'meet for': (189, 190), 'meet up for': (189, 190), 'should meet': (189, 190), 'meet up with': (189, 190), 'hang': (189, 190), 'hanging with': (189, 190), 'miss': (191, 192), 'missed': (191, 192), 'mixing': (193, 194), 's mixed with': (193, 194), 'is more expensive than': (195, 196), 'dance': (197, 198), 'dancing': (197, 198), 'dancing in': (197, 198), 'dancing on': (197, 198), 'breakdance': (197, 198), 'exercise': (197, 198), 'work out': (197, 198), 'going to transfer': (197, 198), 'migrated to': (197, 198), 'move with': (197, 198), 'moved': (197, 198), 'moved back to': (197, 198), 'moved in': (197, 198), 'moved to': (197, 198), 'moved when': (197, 198), 'transferred into': (197, 198), 'turn': (197, 198), 'turn right at': (197, 198), 'swim': (197, 198), 'hike': (197, 198), 'hiked': (197, 198), 'hiking with': (197, 198), 'mind if SPEAKER2 walk to': (197, 198), 'walking around': (197, 198), 'was walking': (197, 198), 'dropped': (199, 200), 'threw at SPEAKER1': (199, 200), 'in need of': (201, 202), 'need': (201, 202), 'need for health insurance': (201, 202), 'need quickly': (201, 202), 'need right away': (201, 202), 'is a need for': (201, 202), 'about': (203, 204), 'church on': (203, 204), 'close to': (203, 204), 'faster than': (203, 204), 'fine for': (203, 204), 'for': (203, 204), 'from': (203, 204), 'good': (203, 204), 'here for': (203, 204), 'in': (203, 204), 'in between': (203, 204), 'it': (203, 204), 'like some magic to take away': (203, 204), 'named': (203, 204), 'never': (203, 204), 'new to': (203, 204), 'on': (203, 204), 'play off': (203, 204), 's for SPEAKER1': (203, 204), 's plenty for': (203, 204), 'SPEAKER1': (203, 204), 'to': (203, 204), 'with': (203, 204), 'busy with': (205, 206), 'take up': (205, 206), 'opened up': (207, 208), 'order': (209, 210), 'ordered': (209, 210), 'ordering': (209, 210), 'arrange': (211, 212), 'have planned to go': (211, 212), 'plan on making': (211, 212), 'plan to': (211, 212), 'plan to go': (211, 212), 'planing on watching': (211, 212), 'planned': (211, 212), 'planning': (211, 212), 'planning on': (211, 212), 're planning': (211, 212), 'can alphabetize': (211, 212), 'sort': (211, 212), 'adopted': (213, 214), 'inherited': (213, 214), 'own': (213, 214), 'owns': (213, 214), 'parked in': (215, 216), 'paying attention to': (217, 218), 'pay attention to': (217, 218), 'can play': (219, 220), 'geocache': (219, 220), 'is to play': (219, 220), 'play': (219, 220), 'play hoops with': (219, 220), 'play in': (219, 220), 'play loud': (219, 220), 'play on': (219, 220), 'play soccer on': (219, 220), 'played': (219, 220), 'played on': (219, 220), 'played piano in': (219, 220), 'playing': (219, 220), 'playing with': (219, 220), 'plays': (219, 220), 'replaying': (219, 220), 'blast': (219, 220), 'can afford': (221, 222), 'ca afford': (221, 222), 'ca afford to': (221, 222), 'allow': (221, 222), 'allow SPEAKER1': (221, 222), 'allowed': (221, 222), 'allowed to': (221, 222), 'let': (221, 222), 'let SPEAKER1': (221, 222), 'let SPEAKER2 do': (221, 222), 'permitted in': (221, 222), 'available at': (221, 222), 'be around for': (221, 222), 'be available': (221, 222), 'pray for': (223, 224), 'need to get ready': (225, 226), 'getting ready for': (225, 226), 'getting ready to': (225, 226), 'getting ready to take': (225, 226), 'keep SPEAKER2 from': (227, 228), 'owe SPEAKER1': (229, 230), 'guaranteed': (229, 230), 'keep safe': (231, 232), 'wo pull': (233, 234), 'll put away': (235, 236), 'rained': (237, 238), 'raise': (239, 240), 'reach': (241, 242), 'comes to': (241, 242), 'coming to': (241, 242), 'like reading': (243, 244), 'like to read': (243, 244), 'read': (243, 244), 'read as a child': (243, 244), 'read in college': (243, 244), 'read often': (243, 244), 'read to': (243, 244), 'reading': (243, 244), 'recycle': (245, 246), 'divorced': (247, 248), 'broke up with': (247, 248), 'married': (247, 248), 'married SPEAKER1 for': (247, 248), 'been together': (247, 248), 'calms down': (249, 250), 'can relax': (249, 250), 'relaxing': (249, 250), 'remember': (251, 252), 'cut out': (253, 254), 'scrap': (253, 254), 'booked': (255, 256), 'reserved': (255, 256), 'got back from': (257, 258), 'got home from': (257, 258), 'like to return': (257, 258), 'rule': (259, 260), 'rather save': (261, 262), 'saves': (261, 262), 'saving for': (261, 262), 'look': (263, 264), 'look like': (263, 264), 'check out': (263, 264), 'love to look at': (263, 264), 'allow people to check out': (263, 264), 'be seen': (263, 264), 'can see': (263, 264), 'get a good look at': (263, 264), 'like to see in beijing': (263, 264), 'saw': (263, 264), 'see': (263, 264), 'seeing tomorrow': (263, 264), 'seen': (263, 264), 'should see': (263, 264), 'binging': (263, 264), 'like watching': (263, 264), 'love watching from indoors': (263, 264), 'watch': (263, 264), 'watched': (263, 264), 'watching': (263, 264), 'went to watch out of curiosity': (263, 264), 'looking in to': (265, 266), 'am looking for': (265, 266), 'are looking for': (265, 266), 'look for': (265, 266), 'looking for': (265, 266), 's looking good for': (265, 266), 'seeking': (265, 266), 'make SPEAKER1 look': (267, 268), 'seem to': (267, 268), 'seemed': (267, 268), 'seems': (267, 268), 'sound appealing to': (267, 268), 'sounds': (267, 268), 'sounds like': (267, 268), 'looks': (267, 268), 'looks like': (267, 268), 'like to send': (269, 270), 'send': (269, 270), 'send by airmail': (269, 270), 'send over': (269, 270), 'send to': (269, 270), 'sent to be fixed': (269, 270), 'frustrated with': (271, 272), 'afraid of': (271, 272), 'm scared of': (271, 272), 'nervous for': (271, 272), 'scared to': (271, 272), 'scares': (271, 272), 'been looking forward to': (273, 274), 'look forward to': (273, 274), 'looking forward to': (273, 274), 'are glad': (273, 274), 'are glad is over': (273, 274), 'glad': (273, 274), 'glad SPEAKER1': (273, 274), 'glad to': (273, 274), 'pleased that': (273, 274), 'care if': (273, 274), 'take care of': (273, 274), 'pet sitting': (273, 274), 'share': (275, 276), 'share with': (275, 276), 'shooting': (277, 278), 'portray as weak': (279, 280), 'show on': (279, 280), 'can show': (279, 280), 'can show SPEAKER2': (279, 280), 'displays': (279, 280), 'presented': (279, 280), 'suitable for': (281, 282), 'is like': (281, 282), 'similar to': (281, 282), 'like to sing': (283, 284), 'love to sing': (283, 284), 'sing': (283, 284), 'sing in': (283, 284), 'singing': (283, 284), 'love to sit around': (285, 286), 'must sit on': (285, 286), 'sit on': (285, 286), 'were in the chair': (285, 286), 'pass out': (287, 288), 'sleep': (287, 288), 'sleep with': (287, 288), 'slept like': (287, 288), 'smells': (289, 290), 'smoke': (291, 292), 'smoking': (291, 292), 'responding to': (293, 294), 'said': (293, 294), 'say': (293, 294), 'says': (293, 294), 'can speak': (293, 294), 'could speak to': (293, 294), 'may speak to': (293, 294), 'speak': (293, 294), 'speak to': (293, 294), 'speaking of': (293, 294), 'stand up at': (293, 294), 'describe': (293, 294), 'can talk about': (293, 294), 'interviewed with': (293, 294), 'talk to': (293, 294), 'talking about': (293, 294), 'talking to': (293, 294), 'like talking about': (293, 294), 'tell': (293, 294), 'tell SPEAKER1': (293, 294), 'tell SPEAKER1 to': (293, 294), 'told': (293, 294), 'can spend': (295, 296), 'spend': (295, 296), 'spend on shopping': (295, 296), "spend SPEAKER1's holidays from": (295, 296), 'spending': (295, 296), 'spent': (295, 296), 'spent the day in': (295, 296), 'spent too much on': (295, 296), 'will spend most of the weekend with': (295, 296), 'began': (297, 298), 'could start with': (297, 298), 'start': (297, 298), 'start in': (297, 298), 'started': (297, 298), 'started as': (297, 298), 'started in': (297, 298), 'stick to': (299, 300), 'still at': (299, 300), 'rather stay': (299, 300), 'can stay': (299, 300), 'can stay for hours': (299, 300), 'like to stay': (299, 300), 'stay': (299, 300), 'stay at': (299, 300), 'stay in': (299, 300), 'stay with': (299, 300), 'stayed in': (299, 300), 'staying': (299, 300), 'staying at': (299, 300), 'staying in': (299, 300), 'staying with': (299, 300), 've stay with': (299, 300), 'is over': (301, 302), 'cancelled': (301, 302), 'finished': (301, 302), 'finished up': (301, 302), 'got done': (301, 302), 'graduated': (301, 302), 'graduated from': (301, 302), 'retired': (301, 302), 'retired for': (301, 302), 'retired from': (301, 302), 'quit': (301, 302), 'stop for': (301, 302), 'survived': (303, 304), 'robbed': (305, 306), 'be able to take again': (305, 306), 'can take': (305, 306), 'can take again': (305, 306), 'could take': (305, 306), 'going to be taking': (305, 306), 'm taking the kids to': (305, 306), 'may take': (305, 306), 'take': (305, 306), 'take at the bar': (305, 306), 'take SPEAKER1 to': (305, 306), 'take SPEAKER2': (305, 306), 'taken': (305, 306), 'takes': (305, 306), 'taking': (305, 306), 'took': (305, 306), 'will take': (305, 306), 'pull out': (305, 306), 's taking out': (305, 306), 'taste like': (307, 308), 'tastes like': (307, 308), 'taught': (309, 310), 'taught in': (309, 310), 'teach': (309, 310), 'teach at': (309, 310), 'teach during': (309, 310), 'teach in': (309, 310), 'teaches': (309, 310), 'teaching': (309, 310), 'teaching at': (309, 310), 'train': (309, 310), 'tutor': (309, 310), 'believe in': (311, 312), 'may consider': (311, 312), 'considered': (311, 312), 'should consider': (311, 312), 'daydream about': (311, 312), 'have ideas about': (311, 312), 'think': (311, 312), 'think about': (311, 312), 'thinking': (311, 312), 'thinking about': (311, 312), 'thought about': (311, 312), 'exhausted from': (313, 314), 'tired': (313, 314), 'tired from': (313, 314), 'can try': (315, 316), 'could try on': (315, 316), 'like to try': (315, 316), 'should try': (315, 316), 'tried': (315, 316), 'tried to': (315, 316), 'try': (315, 316), 'try out': (315, 316), 'try to': (315, 316), 'trying': (315, 316), "trying on SPEAKER1's travels": (315, 316), 'trying to': (315, 316), 'trying to be': (315, 316), 'take advantage of': (317, 318), 'can use': (317, 318), 'like to use': (317, 318), 'ride': (317, 318), 'use': (317, 318), 'uses': (317, 318), 'travel': (319, 320), 'travel for': (319, 320), 'went to': (319, 320), 'were in attendance at': (319, 320), 'been to': (319, 320), 'm coming for': (319, 320), 'tour': (319, 320), 'visit': (319, 320), 'visiting from': (319, 320), 'ca wait for': (321, 322), 'waiting': (321, 322), 'waiting in': (321, 322), 'wake up': (323, 324), 'wake up at': (323, 324), 'ran': (325, 326), 'run': (325, 326), 'runs': (325, 326), 'hope': (327, 328), 'hope SPEAKER2': (327, 328), 'like to be': (327, 328), 'about to': (327, 328), 'd like': (327, 328), 'd like to be': (327, 328), 'deserving of': (327, 328), 'have dreamed of going': (327, 328), 'hope to': (327, 328), 'intend to': (327, 328), 'like to': (327, 328), 'like to have': (327, 328), 'like us to': (327, 328), 'm hoping to visit': (327, 328), 'mean to': (327, 328), 'wanna talk about': (327, 328), 'wanna try out': (327, 328), 'want': (327, 328), 'want in fifties': (327, 328), 'want it': (327, 328), 'want SPEAKER2 to sign': (327, 328), 'want to': (327, 328), 'want to be': (327, 328), 'want to be tomorrow': (327, 328), 'want to be transferred': (327, 328), 'want to do': (327, 328), 'want to extend': (327, 328), 'want to go out to': (327, 328), 'want to pay': (327, 328), 'want to take': (327, 328), 'want to watch together': (327, 328), 'wanted to': (327, 328), 'wanting': (327, 328), 'wanting to': (327, 328), 'wants': (327, 328), 'wants to': (327, 328), 'wants to be': (327, 328), 'willing to do': (327, 328), 'wish': (327, 328), 'wasted': (329, 330), 'dressed as a lion': (331, 332), 'wear that way': (331, 332), 'wearing': (331, 332), 'wears': (331, 332), 'worn much': (331, 332), 'won': (333, 334), 'love working on': (335, 336), 'always worked in': (335, 336), 'been an employee of': (335, 336), 'been employed': (335, 336), 'code': (335, 336), 'do for a job': (335, 336), 'do for a living': (335, 336), 'have worked in': (335, 336), 'manage': (335, 336), 'market for': (335, 336), 'serving in': (335, 336), 'volunteer': (335, 336), 'volunteer at': (335, 336), 'volunteer with': (335, 336), 'work': (335, 336), 'work as': (335, 336), 'work at': (335, 336), 'work during': (335, 336), 'work for': (335, 336), 'work in': (335, 336), 'worked': (335, 336), 'worked in': (335, 336), 'worked long time': (335, 336), 'worked with': (335, 336), 'working': (335, 336), 'working at': (335, 336), 'working in': (335, 336), 'working nights at': (335, 336), 'working on': (335, 336), 'works': (335, 336), 'works in': (335, 336), 'concerned about': (337, 338), 'worried about': (337, 338), 'worry about': (337, 338), 'sign': (339, 340), 'note': (339, 340), 'post': (339, 340), 'type': (339, 340), 'write': (339, 340), 'write to': (339, 340), 'writing': (339, 340)}
-    bio_lookup_l2 = {3: 'act', 5: 'add', 7: 'agree', 9: 'ask', 11: 'aux', 13: 'be', 15: 'be difficult', 17: 'be free', 19: 'be from', 21: 'be old', 23: 'be ready', 25: 'be wrong', 27: 'become', 29: 'betray', 31: 'better than', 33: 'borrow', 35: 'bring', 37: 'call', 39: 'cause', 41: 'change', 43: 'check in', 45: 'choose', 47: 'clean', 49: 'close', 51: 'come', 53: 'commerce-transaction', 55: 'confuse', 57: 'consume', 59: 'contact', 61: 'cook', 63: 'copy', 65: 'cost', 67: 'count', 69: 'cut', 71: 'depend on', 73: 'destroy', 75: 'devote', 77: 'die', 79: 'different', 81: 'dislike', 83: 'do', 85: 'do badly', 87: 'do well', 89: 'draw', 91: 'drive', 93: 'enable', 95: 'endure', 97: 'equal', 99: 'expect', 101: 'fall', 103: 'feel', 105: 'fight', 107: 'fill', 109: 'find', 111: 'fit', 113: 'follow', 115: 'forget', 117: 'get', 119: 'get in', 121: 'give', 123: 'go', 125: 'grow', 127: 'handle', 129: 'harder than', 131: 'have', 133: 'hear', 135: 'help', 137: 'hit', 139: 'hold', 141: 'hurry', 143: 'hurt', 145: 'include', 147: 'involve', 149: 'join', 151: 'joke', 153: 'keep', 155: 'keep secret', 157: 'kill', 159: 'know', 161: 'lead', 163: 'learn', 165: 'leave', 167: 'light', 169: 'like', 171: 'limit', 173: 'live', 175: 'live in', 177: 'located', 179: 'lock out', 181: 'lose', 183: 'made of', 185: 'make', 187: 'mean', 189: 'meet', 191: 'miss', 193: 'mix', 195: 'more expensive than', 197: 'move', 199: 'move-object', 201: 'need', 203: 'None', 205: 'occupy', 207: 'open', 209: 'order', 211: 'organize', 213: 'own', 215: 'park', 217: 'pay attention', 219: 'play', 221: 'possible', 223: 'pray', 225: 'prepare', 227: 'prevent', 229: 'promise', 231: 'protect', 233: 'pull', 235: 'put', 237: 'rain', 239: 'raise', 241: 'reach', 243: 'read', 245: 'recycle', 247: 'relationship', 249: 'relax', 251: 'remember', 253: 'remove', 255: 'reserve', 257: 'return', 259: 'rule', 261: 'save', 263: 'see', 265: 'seek', 267: 'seem', 269: 'send', 271: 'sentiment-negative', 273: 'sentiment-positive', 275: 'share', 277: 'shoot', 279: 'show', 281: 'similar', 283: 'sing', 285: 'sit', 287: 'sleep', 289: 'smell', 291: 'smoke', 293: 'speak', 295: 'spend', 297: 'start', 299: 'stay', 301: 'stop', 303: 'survive', 305: 'take', 307: 'taste', 309: 'teach', 311: 'think', 313: 'tired', 315: 'try', 317: 'use', 319: 'visit', 321: 'wait', 323: 'wake up', 325: 'walk', 327: 'want', 329: 'waste', 331: 'wear', 333: 'win', 335: 'work', 337: 'worry', 339: 'write'}
-    abstract_dict_l2 = {(3, 4): ['roleplaying as', 'imagining'], (5, 6): ['add', 'could add'], (7, 8): ['accept', 'align with', 'ca imagine'], (9, 10): ['will request hr to', 'ask if', 'proposed to'], (11, 12): ['able to', 'been able to', "ca n't", 'can', 'can accommodate', 'can do', 'have experience', 'have experience in', 'is room for', 'might', 'could', 'need to be', 'are required to', 'had to', 'have to', 'have to be', 'needed to', 'require', 'need to', 'should', 'll', 'll be', 'll be at', 'will', 'will be', 'wo', 'would'], (13, 14): ['being', 'is', 'm', 's', 'ai', 'am', 'are', 'are from', 'are over weight', 'be', 'be a type of', 'be for', 'be for SPEAKER1', 'be there before', 'be with', 'been', 'been for', 'can be', 'is about', 'is away', 'is below', 'is color', 'is considered', 'is far away from', 'is for', 'is one of', 'is set on', 'its', 'm at', 'm part of', 'must be', 're', 're on', 's for', 's going', 's naturally', 's on', 'setting with', 'use to', 'used', 'used to', 'used to be', 'was', 'was for a long time', 'was on', 'wass', 'were', 'were members', 'would be', 'happen to', 'is on', 'm out', 'was with'], (15, 16): ['hard for', 'hard to'], (17, 18): ['am off for', 'take off'], (19, 20): ['being from', 'born in', 'grew up in', 'grow up in', 'm from', 'move from', 'moved from', 'am from', 'migrate from', 'moved back from'], (21, 22): ['is old'], (23, 24): ['are ready to', 'get ready', 'ready for', 'ready to'], (25, 26): ['is wrong with'], (27, 28): ['become', 'turning'], (29, 30): ['double cross', 'would stab in the back'], (31, 32): ['better than', 'beat', 'do better than'], (33, 34): ['may borrow'], (35, 36): ['bring', 'bring in', 'bring over', 'bring SPEAKER1', 'bring SPEAKER2', 'brought', 'will bring back'], (37, 38): ['call SPEAKER2', 'called', 'calling from', 'can call in', 'can phone', 'dial', 'should call'], (39, 40): ['caused'], (41, 42): ['be deciding about switching', 'change', 'charge', 'would change', 'switched', 'switched from', 'exchange'], (43, 44): ['checked in'], (45, 46): ['should choose from', 'vote for', 'voted for', 'decided', 'have picked'], (47, 48): ['exfoliating', 'washed', 'washing'], (49, 50): ['is near', 'close', 'shuts down in'], (51, 52): ['come', 'come and', 'come to', 'come with', 'comes by', 'imported from', 'is coming to get', 'show up for', 'will come', 'will comes'], (53, 54): ['are shopping for', 'bought', 'buy', 'buying', 'd tike to buy', "do SPEAKER1's shopping through", 'like to buy', "like to buy for SPEAKER1's girlfriend", 'like to purchase', 'purchased from ikea', 'purchasing', 'shop', 'shopping for', 'should buy', 'should go to buy', 'use to buy', 'can pay with', 'can refund', 'charge to', 'depositing', 'like to pay', 'must pay', 'pay', 'pay by', 'pay for', 'pays', 'should pay', 'would pay', 'sell', 'selling', 'should sell'], (55, 56): ['throw off'], (57, 58): ['ca drink', 'drink', 'drinking', 'like to drink', 'should drink more', 'ca eat', 'eat', 'eat at', 'eaten', 'eating', 'eats', 'like to eat at', 'only eat', 'would eat', 'must water'], (59, 60): ['can get in touch with', 'can help SPEAKER1 contact', 'have contact with', 'in touch with', 'should sms over'], (61, 62): ['bake', 'cook', 'cook for', 'cook to', 'cooking', 'like to cook for'], (63, 64): ['copy'], (65, 66): ['cost', 'cost SPEAKER1', 'costs'], (67, 68): ['count'], (69, 70): ['like it cut', 'mow'], (71, 72): ['depends on'], (73, 74): ['leaking for', 'tore off', 'wrecked', 'scalded on', 'burn down', 'burned down'], (75, 76): ['devote more time to'], (77, 78): ['died', 'pass', 'passing', 'starving'], (79, 80): ['different from'], (81, 82): ['dislike', 'hate', 'hated', 'hates', 'have reason to distrust'], (83, 84): ['am on', 'are on', 'are up to', 'been up to', 'ca do', 'did', 'do', 'do for SPEAKER1', 'do remotely', 'does', 'doing', 'll make work'], (85, 86): ['bad at', 'spell wrong'], (87, 88): ['aced', 'could make it as', 'distinguished for', 'doing good', 'get real good at', 'good at', 'passed', 'proficiency in', 'went to town on'], (89, 90): ['draw', 'draw over', 'dye', 'dye red', 'paint'], (91, 92): ['drive', 'drive around', 'drives', 'driving under', 'race', 'race for a living', 'ride to'], (93, 94): ['inspired SPEAKER1 to'], (95, 96): ['ca endure', 'ca put up with', 'ca stand'], (97, 98): ['matched'], (99, 100): ['expect to', 'll be expecting'], (101, 102): ['falling in', 'fell', 'fell on'], (103, 104): ['feel', 'feel about', 'feel like', 'felt', 'felt connected to', 'was feeling'], (105, 106): ['fighting off'], (107, 108): ['could fill out', 'fill up'], (109, 110): ['able to find', 'can find', 'dig', 'find', 'find out', 'found', 'found in', 'like to find'], (111, 112): ['fit in', 'fit right', 'goes great with'], (113, 114): ['be lead by', 'chase', 'follow in', 'followed'], (115, 116): ['forget', 'forget to', 'forgot', 'lose track of'], (117, 118): ['can catch', 'catches', 'catching up on', 'caught on', 'have caught', 'make bank', 'need to make per year', 'got more', 'put on', 'can get', 'could get', 'could go', 'get', 'get at the clinic', 'get enough of', 'get in english 101', 'get out', 'gets', 'getting', 'got SPEAKER1', 'got ta', 'got ta go get', 'got us', 'll get SPEAKER2', 'should get', 'to withdraw', 'are trying to get', 'getting to'], (119, 120): ['getting into', 'got in because', 'got in that class'], (121, 122): ['can give SPEAKER2', 'could supply', 'gave SPEAKER1', 'gave to us', 'give', 'give SPEAKER2', 'gives SPEAKER1', 'have to give SPEAKER1', 'provide', 'would give SPEAKER1'], (123, 124): ['arrives at', 'arriving at', 'came back in', 'came here to be', 'came to', 'is arriving', 're arriving', 'land', 'going to across', 'am sneaking away to', 'backed into', 'can go', 'could go', 'go for', 'go in', 'go often', 'go out to', 'go there', 'go there with', 'go to far from', 'going', 'going at', 'going for', 'going on', 'going thru', 'gon na be', 'gone', 'gone to', 'like to go further in', 'm going to', 'was planning on going', 'went', 'went for', 'need to go back to', 're going to', 'go to', 'going to', 'go', 'going out to', 'gone out on', 'goes to', 'get to', 'go next'], (125, 126): ['grow', 'grow well in', 'growing up as'], (127, 128): ['ca handle'], (129, 130): ['harder than'], (131, 132): ['been having', 'can have', 'can have free', 'got', 'had', 'had 3 shoots', 'had at a great restaurant', 'had time for', 'has', 'has been', 'has from surgery', 'has SPEAKER1', 'has to', 'have', 'have available', 'have family', 'have got', 'have in the area', 'have in them', 'have seats for', 'have under SPEAKER1', 'have with that', 'having', 'may have', 's got', 's out for', 'serve', 'should have', 'use to have', 've', 've got', 've to', 'will have', 'will have to take', 'will hold', 'will open'], (133, 134): ['hear', 'hear about', 'hear clearly', 'heard', 'heard about', 'heard of', 'can listen to', 'like listening to', 'listen to', 'listened to', 'listening to', 'love listening to', 'meditate to'], (135, 136): ['comes in', 'is going to make easy', 'is serious business for', 'good for', 'give time to do', 'assist', 'can help', 'help', 'help in', 'help in this city', 'help out', 'help SPEAKER1', 'help SPEAKER2', 'help with', 'helped', 'helped out with', 'need help', 'support', 'supporting'], (137, 138): ['can kick'], (139, 140): ['arrested', 'can hold', 'hold', 'kept in'], (141, 142): ['rush'], (143, 144): ['hurts'], (145, 146): ['include'], (147, 148): ['involve'], (149, 150): ['joined', 'should join', 'joining'], (151, 152): ['kidding'], (153, 154): ['would keep', 'keep', 'keep SPEAKER2', 'kept SPEAKER1 all night', 'kept up all night', 'relaxing with'], (155, 156): ['took to her grave'], (157, 158): ['killed'], (159, 160): ['are sure', 'knew', 'knew it was', 'know', 'know a lot about', 'know about', 'know about that', 'know by face', 'know how to use', 'know much about', 'm familar with', 'learned', 'could recognize', 'work with'], (161, 162): ['lead', 'guided'], (163, 164): ['been learning', 'learning', 'would learn to', 'practiced as a kid', 'll learn to deal with', 'majored in', 'majoring in', 'studied', 'study', 'studying'], (165, 166): ['should leave', 'should leave for a tip', 'got off', 'be gone in', 'get off', 'get off on', 'is to leave for a tip', 'left', 'like to depart', 'like to leave on', 'must leave for', 'should take off'], (167, 168): ['should light'], (169, 170): ['are a fan of', 'like going to', 'like to do for fun', 'like to go', 'like to go for', 'like to go to', 'like going out to', 'am a fan of', 'am into', 'am more in to', 'am obsessed with', 'are in to', 'are into', 'can deal with', 'can handle', 'could stand', 'do for fun', 'enjoy', 'enjoy working with', 'enjoyed', 'enjoying', 'enjoys', 'excited to', 'fancy', 'get along', 'get along with', 'got SPEAKER1 interested in', 'had fun at', 'interest', 'interested in', 'interested in going to', 'into', 'keen on', 'like', 'like back', 'like being', 'like being at', 'like doing', 'like having around SPEAKER1', 'like SPEAKER1', 'like to do', 'likes', 'm a fan', 'm a huge fan of', 'm content', 'm excited to', 'm into', 'mind going on', 'open about', 'open to', 'passionate about', 'should appreciate', 've a crush on', 'was for', 'will suit best', 'would like', 'would like to', 'would love', 'would love to', 'would mind', 'love to live on', 'obsessed with', 'love to own', 'love to go with', 'love to go to', 'love', 'love being with', 'love to', 'loved', 'loves', 'prefer', 'prefer to', 'prefer to bother', 'would rather', 'can recommend SPEAKER2', 'recommend'], (171, 172): ['should limit'], (173, 174): ['been living', 'could live', 'live', 'live above', 'live around', 'live by', 'live with', 'lived', 'lived for a month', "lived SPEAKER1's whole life", 'lived there', 'lived there for', 'living', 'living for a long time', 'living here for', 'living on'], (175, 176): ['like to live in', 'live in', 'lives in', 'living in'], (177, 178): ['am at', 'am at the weekend', 'be at', 'came from', 'is at', 'm in', 'am in', 'are in', 'be in', 'been in', 'is in', 's in', 'was in', 'm in between', 'm on', 'located', 'located in', 's off of', 'set in'], (179, 180): ['locked out'], (181, 182): ['sheds', 'loses', 'lost'], (183, 184): ['made of'], (185, 186): ['fix', 'about to fix', 'made in', 'build', 'build upon request', 'built', 'can make', 'can seem to make', 'have made', 'like to make', 'made', 'made some for', 'made up', 'make', 'make for SPEAKER1', 'make it', 'make it between us', 'make SPEAKER1', 'make SPEAKER2', 'makes', 'makes SPEAKER1', 'making', 'making more than', 'would make SPEAKER1'], (187, 188): ['mean', 'stand for'], (189, 190): ['bumped into', 'like to meet for a drink', 'like to meet up with', 'meet', 'meet for', 'meet up for', 'should meet', 'meet up with', 'hang', 'hanging with'], (191, 192): ['miss', 'missed'], (193, 194): ['mixing', 's mixed with'], (195, 196): ['is more expensive than'], (197, 198): ['dance', 'dancing', 'dancing in', 'dancing on', 'breakdance', 'exercise', 'work out', 'going to transfer', 'migrated to', 'move with', 'moved', 'moved back to', 'moved in', 'moved to', 'moved when', 'transferred into', 'turn', 'turn right at', 'swim', 'hike', 'hiked', 'hiking with', 'mind if SPEAKER2 walk to', 'walking around', 'was walking'], (199, 200): ['dropped', 'threw at SPEAKER1'], (201, 202): ['in need of', 'need', 'need for health insurance', 'need quickly', 'need right away', 'is a need for'], (203, 204): ['about', 'church on', 'close to', 'faster than', 'fine for', 'for', 'from', 'good', 'here for', 'in', 'in between', 'it', 'like some magic to take away', 'named', 'never', 'new to', 'on', 'play off', 's for SPEAKER1', 's plenty for', 'SPEAKER1', 'to', 'with'], (205, 206): ['busy with', 'take up'], (207, 208): ['opened up'], (209, 210): ['order', 'ordered', 'ordering'], (211, 212): ['arrange', 'have planned to go', 'plan on making', 'plan to', 'plan to go', 'planing on watching', 'planned', 'planning', 'planning on', 're planning', 'can alphabetize', 'sort'], (213, 214): ['adopted', 'inherited', 'own', 'owns'], (215, 216): ['parked in'], (217, 218): ['paying attention to', 'pay attention to'], (219, 220): ['can play', 'geocache', 'is to play', 'play', 'play hoops with', 'play in', 'play loud', 'play on', 'play soccer on', 'played', 'played on', 'played piano in', 'playing', 'playing with', 'plays', 'replaying', 'blast'], (221, 222): ['can afford', 'ca afford', 'ca afford to', 'allow', 'allow SPEAKER1', 'allowed', 'allowed to', 'let', 'let SPEAKER1', 'let SPEAKER2 do', 'permitted in', 'available at', 'be around for', 'be available'], (223, 224): ['pray for'], (225, 226): ['need to get ready', 'getting ready for', 'getting ready to', 'getting ready to take'], (227, 228): ['keep SPEAKER2 from'], (229, 230): ['owe SPEAKER1', 'guaranteed'], (231, 232): ['keep safe'], (233, 234): ['wo pull'], (235, 236): ['ll put away'], (237, 238): ['rained'], (239, 240): ['raise'], (241, 242): ['reach', 'comes to', 'coming to'], (243, 244): ['like reading', 'like to read', 'read', 'read as a child', 'read in college', 'read often', 'read to', 'reading'], (245, 246): ['recycle'], (247, 248): ['divorced', 'broke up with', 'married', 'married SPEAKER1 for', 'been together'], (249, 250): ['calms down', 'can relax', 'relaxing'], (251, 252): ['remember'], (253, 254): ['cut out', 'scrap'], (255, 256): ['booked', 'reserved'], (257, 258): ['got back from', 'got home from', 'like to return'], (259, 260): ['rule'], (261, 262): ['rather save', 'saves', 'saving for'], (263, 264): ['look', 'look like', 'check out', 'love to look at', 'allow people to check out', 'be seen', 'can see', 'get a good look at', 'like to see in beijing', 'saw', 'see', 'seeing tomorrow', 'seen', 'should see', 'binging', 'like watching', 'love watching from indoors', 'watch', 'watched', 'watching', 'went to watch out of curiosity'], (265, 266): ['looking in to', 'am looking for', 'are looking for', 'look for', 'looking for', 's looking good for', 'seeking'], (267, 268): ['make SPEAKER1 look', 'seem to', 'seemed', 'seems', 'sound appealing to', 'sounds', 'sounds like', 'looks', 'looks like'], (269, 270): ['like to send', 'send', 'send by airmail', 'send over', 'send to', 'sent to be fixed'], (271, 272): ['frustrated with', 'afraid of', 'm scared of', 'nervous for', 'scared to', 'scares'], (273, 274): ['been looking forward to', 'look forward to', 'looking forward to', 'are glad', 'are glad is over', 'glad', 'glad SPEAKER1', 'glad to', 'pleased that', 'care if', 'take care of', 'pet sitting'], (275, 276): ['share', 'share with'], (277, 278): ['shooting'], (279, 280): ['portray as weak', 'show on', 'can show', 'can show SPEAKER2', 'displays', 'presented'], (281, 282): ['suitable for', 'is like', 'similar to'], (283, 284): ['like to sing', 'love to sing', 'sing', 'sing in', 'singing'], (285, 286): ['love to sit around', 'must sit on', 'sit on', 'were in the chair'], (287, 288): ['pass out', 'sleep', 'sleep with', 'slept like'], (289, 290): ['smells'], (291, 292): ['smoke', 'smoking'], (293, 294): ['responding to', 'said', 'say', 'says', 'can speak', 'could speak to', 'may speak to', 'speak', 'speak to', 'speaking of', 'stand up at', 'describe', 'can talk about', 'interviewed with', 'talk to', 'talking about', 'talking to', 'like talking about', 'tell', 'tell SPEAKER1', 'tell SPEAKER1 to', 'told'], (295, 296): ['can spend', 'spend', 'spend on shopping', "spend SPEAKER1's holidays from", 'spending', 'spent', 'spent the day in', 'spent too much on', 'will spend most of the weekend with'], (297, 298): ['began', 'could start with', 'start', 'start in', 'started', 'started as', 'started in'], (299, 300): ['stick to', 'still at', 'rather stay', 'can stay', 'can stay for hours', 'like to stay', 'stay', 'stay at', 'stay in', 'stay with', 'stayed in', 'staying', 'staying at', 'staying in', 'staying with', 've stay with'], (301, 302): ['is over', 'cancelled', 'finished', 'finished up', 'got done', 'graduated', 'graduated from', 'retired', 'retired for', 'retired from', 'quit', 'stop for'], (303, 304): ['survived'], (305, 306): ['robbed', 'be able to take again', 'can take', 'can take again', 'could take', 'going to be taking', 'm taking the kids to', 'may take', 'take', 'take at the bar', 'take SPEAKER1 to', 'take SPEAKER2', 'taken', 'takes', 'taking', 'took', 'will take', 'pull out', 's taking out'], (307, 308): ['taste like', 'tastes like'], (309, 310): ['taught', 'taught in', 'teach', 'teach at', 'teach during', 'teach in', 'teaches', 'teaching', 'teaching at', 'train', 'tutor'], (311, 312): ['believe in', 'may consider', 'considered', 'should consider', 'daydream about', 'have ideas about', 'think', 'think about', 'thinking', 'thinking about', 'thought about'], (313, 314): ['exhausted from', 'tired', 'tired from'], (315, 316): ['can try', 'could try on', 'like to try', 'should try', 'tried', 'tried to', 'try', 'try out', 'try to', 'trying', "trying on SPEAKER1's travels", 'trying to', 'trying to be'], (317, 318): ['take advantage of', 'can use', 'like to use', 'ride', 'use', 'uses'], (319, 320): ['travel', 'travel for', 'went to', 'were in attendance at', 'been to', 'm coming for', 'tour', 'visit', 'visiting from'], (321, 322): ['ca wait for', 'waiting', 'waiting in'], (323, 324): ['wake up', 'wake up at'], (325, 326): ['ran', 'run', 'runs'], (327, 328): ['hope', 'hope SPEAKER2', 'like to be', 'about to', 'd like', 'd like to be', 'deserving of', 'have dreamed of going', 'hope to', 'intend to', 'like to', 'like to have', 'like us to', 'm hoping to visit', 'mean to', 'wanna talk about', 'wanna try out', 'want', 'want in fifties', 'want it', 'want SPEAKER2 to sign', 'want to', 'want to be', 'want to be tomorrow', 'want to be transferred', 'want to do', 'want to extend', 'want to go out to', 'want to pay', 'want to take', 'want to watch together', 'wanted to', 'wanting', 'wanting to', 'wants', 'wants to', 'wants to be', 'willing to do', 'wish'], (329, 330): ['wasted'], (331, 332): ['dressed as a lion', 'wear that way', 'wearing', 'wears', 'worn much'], (333, 334): ['won'], (335, 336): ['love working on', 'always worked in', 'been an employee of', 'been employed', 'code', 'do for a job', 'do for a living', 'have worked in', 'manage', 'market for', 'serving in', 'volunteer', 'volunteer at', 'volunteer with', 'work', 'work as', 'work at', 'work during', 'work for', 'work in', 'worked', 'worked in', 'worked long time', 'worked with', 'working', 'working at', 'working in', 'working nights at', 'working on', 'works', 'works in'], (337, 338): ['concerned about', 'worried about', 'worry about'], (339, 340): ['sign', 'note', 'post', 'type', 'write', 'write to', 'writing']}
+    index_l1 = load_predicate_index('../Argument Extraction/conversion_dict_level1.json')
+    index_l2 = load_predicate_index('../Argument Extraction/conversion_dict_level2.json')
 
 
     MODEL = 'albert'
@@ -151,7 +145,7 @@ if __name__ == '__main__':
     else:
         raise Exception('model %s not recognized' % MODEL)
 
-    result = evaluate(TEST_FILE, model, abstract_dict_l2, lookup_l2, bio_lookup_l2, k=MIN_CONF, deduplication=False)
+    result = evaluate(TEST_FILE, model, index_l2, k=MIN_CONF, deduplication=False)
 
     # Save to file
     save_results(result, MODEL, TEST_FILE, MIN_CONF)
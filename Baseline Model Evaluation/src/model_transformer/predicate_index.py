@@ -0,0 +1,141 @@
+import argparse
+import json
+from functools import lru_cache
+
+import numpy as np
+
+
+# Apostrophes that annotators (or keyboards) use in place of '
+_APOSTROPHES = str.maketrans({'’': "'", '‘': "'", '`': "'", '´': "'"})
+
+
+def normalize_predicate(pred):
+    """ Normalizes a predicate span for lookup: apostrophes are unified, whitespace is collapsed
+        and apostrophes around the span are stripped (e.g. " can 't'" -> "can 't").
+
+        params:
+        str pred:   predicate span
+
+        returns:    normalized span
+    """
+    return ' '.join(pred.translate(_APOSTROPHES).split()).strip("'").strip()
+
+
+class PredicateIndex:
+    def __init__(self, conversion_dict):
+        """ Compiled lookup from predicate spans to abstract predicates (and their BIO tags), built from
+            a conversion dict in 'Argument Extraction'. Abstract predicates are numbered in order of the
+            dict with B-tags 3, 5, 7, etc. and I-tags 4, 6, 8, etc.
+
+            params:
+            dict conversion_dict:   dict with abstract predicate as key and list of predicate spans as value
+        """
+        self._predicates = list(conversion_dict)
+
+        # Normalized span -> index of abstract predicate (later spans override earlier ones)
+        self._lookup = dict()
+        for i, spans in enumerate(conversion_dict.values()):
+            for span in spans:
+                self._lookup[normalize_predicate(span)] = i
+
+        # Class ID -> label and class ID -> abstract predicate ('' for O-, B- and I-tags of arguments)
+        self._labels = np.array(['O', 'B', 'I'] + [tag + '-' + pred for pred in self._predicates for tag in 'BI'])
+        self._class_predicates = np.array(['', '', ''] + [pred for pred in self._predicates for _ in 'BI'])
+
+    @classmethod
+    def from_file(cls, path):
+        """ Builds the index from a conversion dict (.json) or loads a compiled index (.npz, see save).
+        """
+        if not path.endswith('.npz'):
+            with open(path, 'r', encoding='utf-8') as file:
+                return cls(json.load(file))
+
+        data = np.load(path)
+        predicates = data['predicates'].tolist()
+        conversion_dict = {pred: [] for pred in predicates}
+        for span, i in zip(data['spans'].tolist(), data['span_predicates'].tolist()):
+            conversion_dict[predicates[i]].append(span)
+        return cls(conversion_dict)
+
+    def save(self, path):
+        """ Saves the compiled index as .npz (see from_file).
+        """
+        np.savez(path, predicates=np.array(self._predicates), spans=np.array(list(self._lookup)),
+                 span_predicates=np.array(list(self._lookup.values()), dtype=np.int32))
+
+    def __len__(self):
+        return len(self._predicates)
+
+    def __contains__(self, pred):
+        return normalize_predicate(pred) in self._lookup
+
+    def __getitem__(self, pred):
+        """ Returns the (B-tag, I-tag) of a predicate span (like the lookup dicts used to create BIO tags).
+        """
+        i = self._lookup[normalize_predicate(pred)]
+        return 2 * i + 3, 2 * i + 4
+
+    @property
+    def num_labels(self):
+        return len(self._labels)
+
+    @property
+    def labels(self):
+        """ ndarray with the label of each class ID (e.g. 'B-like') """
+        return self._labels
+
+    @property
+    def class_predicates(self):
+        """ ndarray with the abstract predicate of each class ID ('' for non-predicate labels) """
+        return self._class_predicates
+
+    @property
+    def bio_lookup(self):
+        """ dict with B-tag as key and abstract predicate as value """
+        return {2 * i + 3: pred for i, pred in enumerate(self._predicates)}
+
+    def tags(self, pred, default=None):
+        """ Returns the (B-tag, I-tag) of a predicate span, or default if it has no abstract predicate.
+        """
+        i = self._lookup.get(normalize_predicate(pred))
+        return default if i is None else (2 * i + 3, 2 * i + 4)
+
+    def abstract(self, pred, default=None):
+        """ Returns the abstract predicate of a predicate span, or default if it has none.
+        """
+        i = self._lookup.get(normalize_predicate(pred))
+        return default if i is None else self._predicates[i]
+
+    def abstract_triples(self, triples):
+        """ Replaces the predicates of scored triples by their abstract predicate (if they have one).
+
+            params:
+            list triples:   list of (confidence, (subj, pred, obj, polarity)) pairs
+
+            returns:    list of (confidence, (subj, abstract pred, obj, polarity)) pairs
+        """
+        out = []
+        for conf, (subj, pred, obj, *rest) in triples:
+            out.append((conf, (subj, self.abstract(pred, pred), obj, *rest)))
+        return out
+
+
+@lru_cache(maxsize=None)
+def load_predicate_index(path):
+    """ Loads the PredicateIndex of a conversion dict or compiled index once per process (see
+        PredicateIndex.from_file), so that training, the pipeline and evaluation share it.
+    """
+    return PredicateIndex.from_file(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compile a conversion dict into a predicate index')
+    parser.add_argument('--level', default=1, type=int, choices=[1, 2], help='level of abstract predicates')
+    parser.add_argument('--out_path', default=None, help='path of the compiled index (.npz)')
+    args = parser.parse_args()
+
+    index = PredicateIndex.from_file('../Argument Extraction/conversion_dict_level%s.json' % args.level)
+    out_path = args.out_path if args.out_path else 'predicate_index_level%s.npz' % args.level
+    index.save(out_path)
+    print('compiled %s abstract predicates (%s spans, %s labels) to %s' % (len(index), len(index._lookup),
+                                                                          index.num_labels, out_path))
@@ -83,41 +83,105 @@ def load_annotations(path, remove_unk=True, keep_skipped=False):
     return annotations
 
 
-def triple_to_bio_tags(annotation, arg, lookup):
-    """ Converts the token indices of the annotations to a vector of BIO labels
-        for an argument.
+# Ways to handle predicate spans without (B-tag, I-tag) in the lookup; a (B-tag, I-tag) tuple labels them as that class
+UNKNOWN_PREDICATE_POLICIES = ['error',  # raise a KeyError
+                              'skip']   # leave the span unlabeled (O)
+
+
+def _predicate_tags(lookup, pred):
+    # PredicateIndex normalizes the span before lookup
+    return lookup.tags(pred) if hasattr(lookup, 'tags') else lookup.get(pred)
+
+
+def triple_to_bio_spans(annotation, lookup, args=(0, 1, 2), unknown='error'):
+    """ Converts the token indices of the annotations to BIO label spans of all arguments in a single
+        pass, without creating label vectors (see bio_spans_to_tags).
 
         params:
         dict annotation:    loaded annotation file (see load_annotations)
-        int arg:            argument to create tag sequence for (subj=0, pred=1, obj=2)
         dict lookup:        dict with unique predicate as key and tuple (B-tag, I-tag) as value
+        tuple args:         arguments to create spans for (subj=0, pred=1, obj=2; default: all)
+        unknown:            how to handle predicate spans missing from lookup (see UNKNOWN_PREDICATE_POLICIES,
+                            default: error)
 
-        returns:    ndarray with BIO labels
+        returns:    number of tokens in the dialogue (including <eos>) and list of (arg, positions, B-tag, I-tag)
+                    spans in order of the annotations, with positions the indices of the tokens in the dialogue
     """
-    # Determine length of dialogue
+    # Index of the first token of each turn in the dialogue (+1 for <eos>)
     turns = annotation['tokens']
-    triples = annotation['annotations']
-    num_tokens = sum([len(turn) + 1 for turn in turns])  # +1 for <eos>
+    offsets = np.cumsum([0] + [len(turn) + 1 for turn in turns])
 
-    # Create vector same size as dialogue
-    mask = np.zeros(num_tokens, dtype=np.uint8)
+    spans = []
+    for triple in annotation['annotations']:
+        for arg in args:
+            if not triple[arg]:
+                continue
 
-    # Label annotated arguments as BIO tags
-    for triple in triples:
-        if arg == 1:
-            pred = get_predicate_tokens(annotation, triple)
-            if pred is not None:
-                b_tag, i_tag = lookup[pred]
-                for j, (turn_id, token_id) in enumerate(triple[arg]):
-                    k = sum([len(t) + 1 for t in turns[:turn_id]]) + token_id  # k = index of token in dialogue
-                    mask[k] = b_tag if j == 0 else i_tag
-        else:
-            for j, (turn_id, token_id) in enumerate(triple[arg]):
-                k = sum([len(t) + 1 for t in turns[:turn_id]]) + token_id  # k = index of token in dialogue
-                mask[k] = 1 if j == 0 else 2
+            if arg == 1:
+                pred = get_predicate_tokens(annotation, triple)
+                tags = _predicate_tags(lookup, pred)
+                if tags is None:
+                    if unknown == 'skip':
+                        continue
+                    if unknown == 'error':
+                        raise KeyError(pred)
+                    tags = unknown
+                b_tag, i_tag = tags
+            else:
+                b_tag, i_tag = 1, 2
+
+            indices = np.array(triple[arg], dtype=np.int64).reshape(-1, 2)
+            spans.append((arg, offsets[indices[:, 0]] + indices[:, 1], b_tag, i_tag))
+    return int(offsets[-1]), spans
+
+
+def bio_spans_to_tags(num_tokens, spans, dtype=np.int16):
+    """ Expands BIO label spans (see triple_to_bio_spans) into label vectors. Later spans overwrite
+        earlier ones, as do the I-tags of a span its B-tag.
+
+        params:
+        int num_tokens:     number of tokens in the dialogue
+        list spans:         list of (arg, positions, B-tag, I-tag) spans
+        dtype:              dtype of the labels; int16 holds the labels of all abstract predicate levels
+
+        returns:    ndarray of shape (3, num_tokens) with the BIO labels of the subject, predicate and object
+    """
+    mask = np.zeros((3, num_tokens), dtype=dtype)
+    for arg, positions, b_tag, i_tag in spans:
+        mask[arg, positions[0]] = b_tag
+        mask[arg, positions[1:]] = i_tag
     return mask
 
 
+def triples_to_bio_tags(annotation, lookup, unknown='error'):
+    """ Converts the token indices of the annotations to vectors of BIO labels for all
+        arguments at once.
+
+        params:
+        dict annotation:    loaded annotation file (see load_annotations)
+        dict lookup:        dict with unique predicate as key and tuple (B-tag, I-tag) as value
+        unknown:            how to handle predicate spans missing from lookup (see UNKNOWN_PREDICATE_POLICIES)
+
+        returns:    ndarray of shape (3, num_tokens) with BIO labels (subj, pred, obj)
+    """
+    return bio_spans_to_tags(*triple_to_bio_spans(annotation, lookup, unknown=unknown))
+
+
+def triple_to_bio_tags(annotation, arg, lookup, unknown='error'):
+    """ Converts the token indices of the annotations to a vector of BIO labels
+        for an argument (see triples_to_bio_tags to convert all arguments at once).
+
+        params:
+        dict annotation:    loaded annotation file (see load_annotations)
+        int arg:            argument to create tag sequence for (subj=0, pred=1, obj=2)
+        dict lookup:        dict with unique predicate as key and tuple (B-tag, I-tag) as value
+        unknown:            how to handle predicate spans missing from lookup (see UNKNOWN_PREDICATE_POLICIES)
+
+        returns:    ndarray with BIO labels
+    """
+    return bio_spans_to_tags(*triple_to_bio_spans(annotation, lookup, args=(arg,), unknown=unknown))[arg]
+
+
 def bio_tags_to_tokens(tokens, mask, predicate=False, one_hot=False):
     """ Converts a vector of BIO-tags into spans of tokens. If BIO-tags are one-hot encoded,
         one_hot=True will first perform an argmax to obtain the BIO labels.
@@ -276,9 +340,7 @@ if __name__ == "__main__":
     tokens, labels = [], []
     for ann in anns:
         # Map triple arguments to BIO tagged masks
-        labels.append((triple_to_bio_tags(ann, 0, lookup),
-                       triple_to_bio_tags(ann, 1, lookup),
-                       triple_to_bio_tags(ann, 2, lookup)))
+        labels.append(triples_to_bio_tags(ann, lookup))
 
         # Flatten turn sequence
         tokens.append([t for ts in ann['tokens'] for t in ts + ['<eos>']])
@@ -303,29 +365,13 @@ if __name__ == "__main__":
 
 
 #triples is een lijst met triples in de vorm van (confidence, (subj, pred, obj, polarity))
-def abstract_predicates_triples(triples, abstract_dict, lookup, bio_lookup):
-  dict_values = []
-  trip = []
-  for values in abstract_dict.values():
-    for value in values:
-      dict_values.append(value)
-
-  for triple in triples:
-    abstract_triples = []
-    if triple[1][1] in dict_values:
-        key = lookup[triple[1][1]]
-        abstract_pred = bio_lookup[key[0]]
-        y = list(triple[1])
-        y[1] = abstract_pred
-        ab_triple = tuple(y)
-        # print(triple)
-        abstract_triples.append(triple[0])
-        abstract_triples.append(ab_triple)
-        abstract_triples = tuple(abstract_triples)
-    else:
-        abstract_triples.append(triple[0])
-        abstract_triples.append(triple[1])
-        abstract_triples = tuple(abstract_triples)
-    trip.append(abstract_triples)
+def abstract_predicates_triples(triples, index):
+    """ Replaces the predicates of triples by their abstract predicate (see PredicateIndex).
 
-  return trip
\ No newline at end of file
+        params:
+        list triples:           list of (confidence, (subj, pred, obj, polarity)) pairs
+        PredicateIndex index:   index of the conversion dict of the level
+
+        returns:    list of (confidence, (subj, abstract pred, obj, polarity)) pairs
+    """
+    return index.abstract_triples(triples)